@@ -18,6 +18,151 @@ export STESTS_CACHE_REDIS_HOST=localhost
 # Cache -> REDIS -> port
 export STESTS_CACHE_REDIS_PORT=6379
 
+# Cache -> REDIS -> pooled connection health check interval (seconds)
+export STESTS_CACHE_REDIS_HEALTH_CHECK_INTERVAL=30
+
+# Cache -> REDIS -> max. pooled connections per partition
+export STESTS_CACHE_REDIS_POOL_MAX_CONNECTIONS=64
+
+# Cache -> REDIS -> pooled connection wait timeout (seconds)
+export STESTS_CACHE_REDIS_POOL_TIMEOUT=20
+
+# Cache -> REDIS -> flag indicating whether host is a cluster node
+export STESTS_CACHE_REDIS_CLUSTER=0
+
+# Cache -> REDIS -> per partition overrides, e.g. so as to isolate monitoring traffic
+# export STESTS_CACHE_REDIS_MONITORING_HOST=localhost
+# export STESTS_CACHE_REDIS_MONITORING_PORT=6380
+# export STESTS_CACHE_REDIS_MONITORING_DB=3
+# export STESTS_CACHE_REDIS_MONITORING_CLUSTER=0
+
+# --------------------------------------------------------------------
+# Cache: LOCAL
+# --------------------------------------------------------------------
+
+# Cache -> LOCAL -> max. items cached per process
+export STESTS_CACHE_LOCAL_MAX_SIZE=1024
+
+# Cache -> LOCAL -> item time to live (seconds, 0 = disabled)
+export STESTS_CACHE_LOCAL_TTL=60
+
+# --------------------------------------------------------------------
+# Cache: METRICS
+# --------------------------------------------------------------------
+
+# Cache -> METRICS -> flag indicating whether cache operations are instrumented
+export STESTS_CACHE_METRICS=0
+
+# Cache -> METRICS -> interval at which instrumentation is flushed to logs & cache (seconds, 0 = disabled)
+export STESTS_CACHE_METRICS_FLUSH_INTERVAL=60
+
+# --------------------------------------------------------------------
+# Cache: ORCHESTRATION
+# --------------------------------------------------------------------
+
+# Cache -> ORCHESTRATION -> time for which a step's finalization time histogram is retained after it's last sample (seconds)
+export STESTS_CACHE_FINALIZATION_HISTOGRAM_RETENTION=604800
+
+# --------------------------------------------------------------------
+# Chain
+# --------------------------------------------------------------------
+
+# Chain -> query client type (NATIVE | SUBPROCESS)
+export STESTS_CHAIN_CLIENT_TYPE=NATIVE
+
+# Chain -> native transfer dispatch client type (NATIVE | SUBPROCESS)
+export STESTS_CHAIN_DISPATCH_CLIENT_TYPE=SUBPROCESS
+
+# Chain -> RPC -> max. pooled keep-alive connections per node
+export STESTS_CHAIN_RPC_POOL_MAX_CONNECTIONS=16
+
+# Chain -> RPC -> request timeout (seconds)
+export STESTS_CHAIN_RPC_TIMEOUT=30
+
+# Chain -> dispatch -> max. delay (seconds) between jittered dispatch retries
+export STESTS_CHAIN_DISPATCH_BACKOFF_MAX=2.0
+
+# Chain -> dispatch -> consecutive failures upon which a node is excluded from dispatch
+export STESTS_CHAIN_DISPATCH_CIRCUIT_FAILURE_THRESHOLD=3
+
+# Chain -> dispatch -> time (seconds) for which a failing node is excluded from dispatch
+export STESTS_CHAIN_DISPATCH_CIRCUIT_OPEN_DURATION=30
+
+# Chain -> event stream payload JSON backend (AUTO | ORJSON | JSON)
+export STESTS_CHAIN_EVENT_JSON_BACKEND=AUTO
+
+# Chain -> max. memoised state root scoped query results (0 = disabled)
+export STESTS_CHAIN_MEMO_MAX_SIZE=4096
+
+# --------------------------------------------------------------------
+# Monitoring
+# --------------------------------------------------------------------
+
+# Monitoring -> max. finalised block deploys fetched & correlated concurrently
+export STESTS_MONITORING_BLOCK_DEPLOY_WORKERS=32
+
+# Monitoring -> deploy correlation mode (BLOCK = query chain upon finality signature | EVENT = DeployProcessed + BlockAdded payloads)
+export STESTS_MONITORING_CORRELATION=BLOCK
+
+# Monitoring -> deploy correlation mode -> per network overrides (suffixed with raw network name, e.g. NCTL-01 -> NCTL1)
+# export STESTS_MONITORING_CORRELATION_NCTL1=EVENT
+
+# Monitoring -> min. interval (seconds) between persisting a node's last processed event id
+export STESTS_MONITORING_CHECKPOINT_INTERVAL=5
+
+# Monitoring -> node metrics -> comma delimited prefixes of metrics to sample (* = all)
+export STESTS_MONITORING_NODE_METRICS=amount_of_blocks,contract_runtime,deploy_gossiper,mem_,pending_deploy,scheduler_queue
+
+# Monitoring -> node metrics -> max. samples retained per node metric series
+export STESTS_MONITORING_NODE_METRICS_BUFFER_SIZE=720
+
+# Monitoring -> node metrics -> sampling interval (seconds) (0 = disabled)
+export STESTS_MONITORING_NODE_METRICS_INTERVAL=0
+
+# Monitoring -> node metrics -> sample store (CACHE | MEMORY)
+export STESTS_MONITORING_NODE_METRICS_STORE=CACHE
+
+# Monitoring -> node metrics -> max. nodes polled concurrently
+export STESTS_MONITORING_NODE_METRICS_WORKERS=16
+
+# Monitoring -> follow all of a network's nodes from a single multiplexed actor (0 = one actor per node, max. 5 nodes)
+export STESTS_MONITORING_MULTIPLEXED=0
+
+# Monitoring -> number of monitor shards across which each network's nodes are assigned (0 = unsharded)
+export STESTS_MONITORING_SHARDS=0
+
+# Monitoring -> shards -> interval (seconds) between heartbeats, i.e. lease renewal & node rebalancing
+export STESTS_MONITORING_SHARD_HEARTBEAT_INTERVAL=5
+
+# Monitoring -> shards -> time (seconds) after which an unrenewed shard or node lease expires
+export STESTS_MONITORING_SHARD_LEASE_DURATION=20
+
+# Monitoring -> multiplexer -> max. node events awaiting processing before stream reads are suspended
+export STESTS_MONITORING_MULTIPLEXER_QUEUE_SIZE=1024
+
+# Monitoring -> multiplexer -> delay (seconds) before rebinding to a node's event stream following an error
+export STESTS_MONITORING_MULTIPLEXER_REBIND_DELAY=5
+
+# Monitoring -> multiplexer -> max. node events processed concurrently
+export STESTS_MONITORING_MULTIPLEXER_WORKERS=16
+
+# --------------------------------------------------------------------
+# Crypto
+# --------------------------------------------------------------------
+
+# Crypto -> directory within which PEM key files are cached (tmpfs recommended)
+export STESTS_CRYPTO_PEM_CACHE_DIR=/dev/shm
+
+# Crypto -> time (seconds) after which a run's unmodified PEM key files are swept upon worker start
+export STESTS_CRYPTO_PEM_CACHE_MAX_AGE=86400
+
+# --------------------------------------------------------------------
+# Codec
+# --------------------------------------------------------------------
+
+# type (JSON | MSGPACK)
+export STESTS_CODEC=JSON
+
 # --------------------------------------------------------------------
 # Broker
 # --------------------------------------------------------------------
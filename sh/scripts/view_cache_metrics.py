@@ -0,0 +1,92 @@
+import argparse
+
+from beautifultable import BeautifulTable
+
+from stests.core import cache
+from stests.core.cache import metrics
+from stests.core.utils import cli as utils
+
+
+
+# CLI argument parser.
+ARGS = argparse.ArgumentParser("Displays cache operation instrumentation flushed by processes - requires STESTS_CACHE_METRICS=1.")
+
+
+# Table columns.
+COLS = [
+    ("Partition", BeautifulTable.ALIGN_LEFT),
+    ("Operation", BeautifulTable.ALIGN_LEFT),
+    ("Calls", BeautifulTable.ALIGN_RIGHT),
+    ("Errors", BeautifulTable.ALIGN_RIGHT),
+    ("Retries", BeautifulTable.ALIGN_RIGHT),
+    ("Local Hits", BeautifulTable.ALIGN_RIGHT),
+    ("Total (ms)", BeautifulTable.ALIGN_RIGHT),
+    ("Share %", BeautifulTable.ALIGN_RIGHT),
+    ("Mean (ms)", BeautifulTable.ALIGN_RIGHT),
+    ("P50 (ms)", BeautifulTable.ALIGN_RIGHT),
+    ("P95 (ms)", BeautifulTable.ALIGN_RIGHT),
+    ("Max (ms)", BeautifulTable.ALIGN_RIGHT),
+    ("Codec (ms)", BeautifulTable.ALIGN_RIGHT),
+    ("Bytes Read", BeautifulTable.ALIGN_RIGHT),
+    ("Bytes Written", BeautifulTable.ALIGN_RIGHT),
+]
+
+
+def main(args):
+    """Entry point.
+
+    :param args: Parsed CLI arguments.
+
+    """
+    # Pull data.
+    data = metrics.merge(cache.monitoring.get_cache_metrics())
+    if not data:
+        print("No cache instrumentation found - ensure STESTS_CACHE_METRICS=1 whilst running workloads.")
+        return
+    total_ms = sum(i["latency_total_ms"] for i in data.values()) or 1
+
+    # Set cols/rows - most expensive operations first.
+    cols = [i for i, _ in COLS]
+    rows = map(lambda i: [
+        i[0].split(".")[0],
+        i[0].split(".")[1],
+        i[1]["calls"],
+        i[1]["errors"],
+        i[1]["retries"],
+        i[1]["local_hits"],
+        format(i[1]["latency_total_ms"], '.1f'),
+        format(100 * i[1]["latency_total_ms"] / total_ms, '.1f'),
+        format(i[1]["latency_total_ms"] / i[1]["calls"], '.3f') if i[1]["calls"] else "--",
+        _format_percentile(i[1], 0.5),
+        _format_percentile(i[1], 0.95),
+        format(i[1]["latency_max_ms"], '.3f'),
+        format(i[1]["codec_ms"], '.1f'),
+        i[1]["bytes_read"],
+        i[1]["bytes_written"],
+    ], sorted(data.items(), key=lambda i: i[1]["latency_total_ms"], reverse=True))
+
+    # Set table.
+    t = utils.get_table(cols, rows)
+
+    # Set table alignments.
+    for key, aligmnent in COLS:
+        t.column_alignments[key] = aligmnent
+
+    # Render.
+    print(t)
+
+
+def _format_percentile(stats: dict, percentile: float) -> str:
+    """Returns formatted upper bound of latency histogram bucket within which a percentile falls.
+
+    """
+    if not stats["calls"]:
+        return "--"
+    bound = metrics.get_percentile(stats, percentile)
+
+    return f"<={bound}" if bound is not None else f">{metrics.LATENCY_BUCKETS[-1]}"
+
+
+# Entry point.
+if __name__ == '__main__':
+    main(ARGS.parse_args())
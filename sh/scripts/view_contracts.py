@@ -48,13 +48,13 @@ def main(args):
         return
 
     # Sort data.
-    data = sorted(data, key=lambda i: f"{i.contract_type}.{i.name}")
+    data = sorted(data, key=lambda i: f"{i.contract_type.name}.{i.name}")
 
     # Set table cols/rows.
     cols = [i for i, _ in COLS]
     rows = map(lambda i: [
         network_id.name,
-        i.contract_type,
+        i.contract_type.name,
         i.name,      
         i.hash,      
     ], data)
@@ -62,18 +62,18 @@ def main(args):
     """
     # Set run data.
     network_id = factory.create_network_id(args.network)
-    data = cache.orchestration.get_info_list(network_id, args.run_type, args.run_index)
+    data = sorted(
+        cache.orchestration.iter_info_list(network_id, args.run_type, args.run_index),
+        key=lambda i: i.label_index,
+        )
     if not data:
         utils.log("No run information found.")
         return
-    
-    # Set sorted data.
-    data = sorted(data, key=lambda i: i.label_index)
 
     # Set deploy counts.
     keys, counts = cache.orchestration.get_deploy_count_list(network_id, args.run_type, args.run_index)
     keys = [i.split(":") for i in keys]
-    keys = [f"{i[3]}.{i[5]}" if i[5] != "-" else i[3] for i in keys]
+    keys = [f"{i[-3].rstrip('}')}.{i[-1]}" if i[-1] != "-" else i[-3].rstrip('}') for i in keys]
     counts = dict(zip(keys, counts))
 
     # Set table.
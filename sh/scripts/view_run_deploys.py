@@ -1,5 +1,4 @@
 import argparse
-import statistics
 
 from beautifultable import BeautifulTable
 
@@ -63,29 +62,65 @@ def main(args):
     :param args: Parsed CLI arguments.
 
     """
-    # Pull data.
+    # Pull data - deploys are streamed page by page & reduced to rows, which are retained for chronological ordering.
     network_id = factory.create_network_id(args.network)
-    data = cache.state.get_deploys(network_id, args.run_type, args.run_index)
-    if not data:
+    stats = _FinalizationStats()
+    rows = []
+    for deploy in cache.state.iter_deploys(network_id, args.run_type, args.run_index):
+        stats.push(deploy)
+        rows.append((deploy.dispatch_timestamp, _get_row(deploy)))
+    if not rows:
         utils.log("No run deploys found.")
         return
 
     # Sort data.
-    data = sorted(data, key=lambda i: i.dispatch_timestamp)
+    rows.sort(key=lambda i: i[0])
 
     # Render views.
-    _render_table(args, network_id, data)
-    _render_finalization_stats(data)
+    _render_table(args, network_id, rows)
+    _render_finalization_stats(stats)
 
 
-def _render_table(args, network_id, data):
-    """Renders table of deploys.
+class _FinalizationStats():
+    """Running finalization time statistics (Welford).
     
     """
-    # Set table cols/rows.
-    cols = [i for i, _ in COLS]
-    rows = map(lambda i: [
-        data.index(i) + 1,
+    def __init__(self):
+        self.count = 0
+        self.finalized = 0
+        self.maxima = None
+        self.minima = None
+        self.mean = 0.0
+        self.m2 = 0.0
+
+
+    def push(self, deploy):
+        """Accumulates a deploy's finalization time.
+        
+        """
+        self.count += 1
+        value = deploy.finalization_duration
+        if not value:
+            return
+
+        self.finalized += 1
+        self.maxima = value if self.maxima is None else max(self.maxima, value)
+        self.minima = value if self.minima is None else min(self.minima, value)
+        delta = value - self.mean
+        self.mean += delta / self.finalized
+        self.m2 += delta * (value - self.mean)
+
+
+    @property
+    def stdev(self):
+        return (self.m2 / (self.finalized - 1)) ** 0.5
+
+
+def _get_row(i):
+    """Returns table row data.
+    
+    """
+    return [
         i.typeof.name,
         i.deploy_hash,      
         i.dispatch_node_index,
@@ -95,7 +130,16 @@ def _render_table(args, network_id, data):
         i.label_finalization_duration,
         f"{i.era_id or '--'}:{i.round_id or '??'}",
         i.block_hash or "--"
-    ], data)
+    ]
+
+
+def _render_table(args, network_id, rows):
+    """Renders table of deploys.
+    
+    """
+    # Set table cols/rows.
+    cols = [i for i, _ in COLS]
+    rows = ([idx] + row for idx, (_, row) in enumerate(rows, 1))
 
     # Set table.
     t = utils.get_table(cols, rows)
@@ -107,22 +151,14 @@ def _render_table(args, network_id, data):
     print(f"{network_id.name} - {args.run_type}  - Run {args.run_index}")
 
 
-def _render_finalization_stats(data):
+def _render_finalization_stats(stats):
     """Renders finalization stats.
     
     """
-    times = [i.finalization_duration for i in data if i.finalization_duration]
-    if not times or len(times) == 1:
+    if stats.finalized < 2:
         return
 
-    maxima = max(times)
-    minima = min(times)
-    avg = statistics.mean(times)
-    stdev = statistics.stdev(times)
-    # variance = format(statistics.variance(times), '.3f') if len(times) > 1 else 'N/A'
-
-    # print(f"Finalized = {len(times)} :: %={int((len(times) / len(data)) * 100)} :: Avg={format(avg, '.3f')}s :: Max={format(maxima, '.3f')}s :: Min={format(minima, '.3f')}s :: Variance={variance}s :: Std Dev= {format(stdev, '.3f')}s")
-    print(f"Finalized = {len(times)} :: %={int((len(times) / len(data)) * 100)} :: Avg={format(avg, '.3f')}s :: Max={format(maxima, '.3f')}s :: Min={format(minima, '.3f')}s :: Std Dev= {format(stdev, '.3f')}s")
+    print(f"Finalized = {stats.finalized} :: %={int((stats.finalized / stats.count) * 100)} :: Avg={format(stats.mean, '.3f')}s :: Max={format(stats.maxima, '.3f')}s :: Min={format(stats.minima, '.3f')}s :: Std Dev= {format(stats.stdev, '.3f')}s")
 
 
 # Entry point.
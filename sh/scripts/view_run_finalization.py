@@ -0,0 +1,120 @@
+import argparse
+
+from beautifultable import BeautifulTable
+
+from stests.core import cache
+from stests.core import factory
+from stests.core.utils import args_validator
+from stests.core.utils import cli as utils
+from stests.core.utils import env
+from stests.core.utils import histogram
+
+
+
+# CLI argument parser.
+ARGS = argparse.ArgumentParser("Displays deploy finalization time percentiles for a run - broken down by phase & step.")
+
+# CLI argument: network name.
+ARGS.add_argument(
+    "--net",
+    default=env.get_network_name(),
+    dest="network",
+    help="Network name {type}{id}, e.g. nctl1.",
+    type=args_validator.validate_network,
+    )
+
+# CLI argument: run type.
+ARGS.add_argument(
+    "--type",
+    default="wg-100",
+    dest="run_type",
+    help="Generator type - e.g. wg-100.",
+    type=args_validator.validate_run_type,
+    )
+
+# CLI argument: run index.
+ARGS.add_argument(
+    "--run",
+    default=1,
+    dest="run_index",
+    help="Run identifier.",
+    type=args_validator.validate_run_index,
+    )
+
+
+# Table columns.
+COLS = [
+    ("Phase / Step", BeautifulTable.ALIGN_LEFT),
+    ("Finalized", BeautifulTable.ALIGN_RIGHT),
+    ("Mean (S)", BeautifulTable.ALIGN_RIGHT),
+    ("P50 (S)", BeautifulTable.ALIGN_RIGHT),
+    ("P90 (S)", BeautifulTable.ALIGN_RIGHT),
+    ("P99 (S)", BeautifulTable.ALIGN_RIGHT),
+    ("Max (S)", BeautifulTable.ALIGN_RIGHT),
+    ("TPS", BeautifulTable.ALIGN_RIGHT),
+]
+
+
+def main(args):
+    """Entry point.
+    
+    :param args: Parsed CLI arguments.
+
+    """
+    # Pull data.
+    network_id = factory.create_network_id(args.network)
+    steps = cache.orchestration.get_finalization_histograms(network_id, args.run_type, args.run_index)
+    if not steps:
+        utils.log("No run finalization times found.")
+        return
+
+    # Merge step histograms into phase & run histograms.
+    phases = dict()
+    run = histogram.Histogram()
+    for step in steps:
+        phases.setdefault(step.labels["phase"], histogram.Histogram()).merge(step)
+        run.merge(step)
+
+    # Set rows - run, then each phase followed by it's steps.
+    rows = [_get_row("--", run)]
+    for phase in sorted(phases):
+        rows.append(_get_row(phase, phases[phase]))
+        for step in sorted([i for i in steps if i.labels["phase"] == phase], key=lambda i: i.labels["step"]):
+            rows.append(_get_row(f"{phase}.{step.labels['step']}", step))
+
+    # Set table.
+    t = utils.get_table([i for i, _ in COLS], rows)
+    for key, aligmnent in COLS:
+        t.column_alignments[key] = aligmnent
+
+    # Render.
+    print(t)
+    print(f"{network_id.name} - {args.run_type}  - Run {args.run_index} :: percentiles accurate to within {int(histogram.RELATIVE_ACCURACY * 100)}%")
+
+
+def _get_row(label: str, i: histogram.Histogram):
+    """Returns table row data.
+    
+    """
+    return [
+        label,
+        i.count,
+        _format(i.mean),
+        _format(i.get_percentile(0.5)),
+        _format(i.get_percentile(0.9)),
+        _format(i.get_percentile(0.99)),
+        _format(i.maxima),
+        _format(i.tps, '.2f'),
+    ]
+
+
+def _format(value: float, spec: str = '.3f') -> str:
+    """Returns formatted optional value.
+    
+    """
+    return "--" if value is None else format(value, spec)
+
+
+# Entry point.
+if __name__ == '__main__':
+    main(ARGS.parse_args())
@@ -4,6 +4,7 @@ from beautifultable import BeautifulTable
 
 from stests.core import cache
 from stests.core import factory
+from stests.core.cache.model import get_run_scope
 from stests.core.types.orchestration import ExecutionAspect
 from stests.core.types.orchestration import ExecutionInfo
 from stests.core.types.orchestration import ExecutionStatus
@@ -63,8 +64,7 @@ def main(args):
     """
     # Pull data.
     network_id = factory.create_network_id(args.network)
-    data = cache.orchestration.get_info_list(network_id, args.run_type)
-    data = [i for i in data if i.aspect == ExecutionAspect.RUN]
+    data = [i for i in cache.orchestration.iter_info_list(network_id, args.run_type) if i.aspect == ExecutionAspect.RUN]
     if not data:
         utils.log("No run information found.")
         return    
@@ -77,9 +77,12 @@ def main(args):
                 break
 
     # Associate info with execution context.
-    ctx_list = cache.orchestration.get_context_list(network_id, args.run_type)
+    ctx_map = {(i.run_type, i.run_index): None for i in data}
+    for ctx in cache.orchestration.iter_context_list(network_id, args.run_type):
+        if (ctx.run_type, ctx.run_index) in ctx_map:
+            ctx_map[(ctx.run_type, ctx.run_index)] = ctx
     for i in data:
-        i.ctx = _get_ctx(i, ctx_list)
+        i.ctx = ctx_map[(i.run_type, i.run_index)]
 
     # Associate info with deploy count.
     keys, counts = cache.orchestration.get_deploy_count_list(network_id, args.run_type)
@@ -108,20 +111,11 @@ def main(args):
     print("----------------------------------------------------------------------------------------------------------------------------")
 
 
-def _get_ctx(i, ctx_list):
-    """Returns execution context associated with a run.
-    
-    """
-    for ctx in ctx_list:
-        if i.run_type == ctx.run_type and i.run_index == ctx.run_index:
-            return ctx
-
-
 def _get_deploy_count(i: ExecutionInfo, counts):
     """Returns count of deploys dispatched during course of a run.
     
     """
-    key = f"{i.network}:{i.run_type}:{i.label_run_index}:deploy-count:-"
+    key = f"{get_run_scope(i.network, i.run_type, i.label_run_index)}:deploy-count:-"
     for count in counts:
         if count.endswith(key):
             return counts[count]
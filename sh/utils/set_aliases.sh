@@ -120,8 +120,12 @@ alias stests-view-validator-account-keys='_exec_cmd $STESTS_PATH_SH_SCRIPTS/view
 # Views #6: generator information.
 alias stests-view-run='_exec_cmd $STESTS_PATH_SH_SCRIPTS/view_run.py'
 alias stests-view-run-deploys='_exec_cmd $STESTS_PATH_SH_SCRIPTS/view_run_deploys.py'
+alias stests-view-run-finalization='_exec_cmd $STESTS_PATH_SH_SCRIPTS/view_run_finalization.py'
 alias stests-view-runs='_exec_cmd $STESTS_PATH_SH_SCRIPTS/view_runs.py'
 
+# Views #7: cache information.
+alias stests-view-cache-metrics='_exec_cmd $STESTS_PATH_SH_SCRIPTS/view_cache_metrics.py'
+
 # ###############################################################
 # ALIASES: Direct deploys
 # ###############################################################
@@ -15,6 +15,7 @@ from stests.chain.get_state_root_hash import execute as get_state_root_hash
 
 # Node queries.
 from stests.chain.get_node_metrics import execute as get_node_metrics
+from stests.chain.get_node_metrics import execute_parsed as get_node_metric_samples
 from stests.chain.get_node_peers import execute as get_node_peers
 from stests.chain.get_node_status import execute as get_node_status
 
@@ -28,6 +29,7 @@ from stests.chain.set_transfer_wasm import execute as set_transfer_wasm
 
 # Node events.
 from stests.chain.stream_events import execute as stream_events
+from stests.chain.stream_events import execute_async as stream_events_async
 
 # Misc.
 from stests.chain.utils import DeployDispatchInfo
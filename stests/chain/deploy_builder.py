@@ -0,0 +1,269 @@
+import datetime
+import re
+import typing
+
+from stests.core import crypto
+from stests.core.types.chain import Account
+
+
+
+# Map: CL type -> bytesrepr type tag.
+_CL_TYPE_TAGS = {
+    "U64": 5,
+    "U512": 8,
+    "Option": 13,
+    "ByteArray": 15,
+}
+
+# Map: key algorithm -> bytesrepr public key | signature tag.
+_KEY_ALGO_TAGS = {
+    crypto.KeyAlgorithm.ED25519: 1,
+    crypto.KeyAlgorithm.SECP256K1: 2,
+}
+
+# Map: humantime duration unit -> milliseconds.
+_TTL_UNITS = {
+    "ms": 1,
+    "s": 1000,
+    "m": 60 * 1000,
+    "h": 60 * 60 * 1000,
+    "d": 24 * 60 * 60 * 1000,
+}
+
+# Unix epoch.
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+# Tag of executable deploy item: module bytes.
+_ITEM_TAG_MODULE_BYTES = 0
+
+# Tag of executable deploy item: native transfer.
+_ITEM_TAG_TRANSFER = 5
+
+
+class _CLValue():
+    """A CL value, i.e. a bytesrepr encoded runtime argument.
+
+    """
+    def __init__(self, cl_type: typing.Union[str, dict], cl_type_bytes: bytes, as_bytes: bytes, parsed: typing.Any):
+        self.as_bytes = as_bytes
+        self.cl_type = cl_type
+        self.cl_type_bytes = cl_type_bytes
+        self.parsed = parsed
+
+    def to_bytes(self) -> bytes:
+        return _to_bytes_bytes(self.as_bytes) + self.cl_type_bytes
+
+    def to_json(self) -> dict:
+        return {
+            "bytes": self.as_bytes.hex(),
+            "cl_type": self.cl_type,
+            "parsed": self.parsed,
+        }
+
+
+def create_transfer_native(
+    dispatcher: Account,
+    target_account_key: str,
+    amount: int,
+    transfer_id: int,
+    chain_name: str,
+    fee: int,
+    gas_price: int,
+    time_to_live: str,
+    timestamp: datetime.datetime = None,
+    ) -> typing.Tuple[str, dict]:
+    """Returns a signed native transfer deploy - as per casper-client make-transfer.
+
+    :param dispatcher: Account dispatching (& signing) deploy.
+    :param target_account_key: Key of account to which funds are transferred.
+    :param amount: Amount (in motes) to be transferred.
+    :param transfer_id: Transfer correlation identifier.
+    :param chain_name: Name of target chain.
+    :param fee: Standard payment amount (in motes).
+    :param gas_price: Network gas price.
+    :param time_to_live: Humantime formatted deploy time to live, e.g. 1h.
+    :param timestamp: Deploy timestamp - defaults to now.
+
+    :returns: 2 member tuple: (deploy hash, JSON representation of deploy).
+
+    """
+    payment = (_ITEM_TAG_MODULE_BYTES, b"", [
+        ("amount", _get_cl_u512(fee)),
+    ])
+    session = (_ITEM_TAG_TRANSFER, None, [
+        ("amount", _get_cl_u512(amount)),
+        ("target", _get_cl_byte_array(bytes.fromhex(crypto.get_account_hash(target_account_key)))),
+        ("id", _get_cl_option_u64(transfer_id)),
+    ])
+
+    return _create_deploy(dispatcher, payment, session, chain_name, gas_price, time_to_live, timestamp)
+
+
+def get_ttl_ms(time_to_live: str) -> int:
+    """Returns a humantime formatted duration in milliseconds.
+
+    :param time_to_live: Humantime formatted duration, e.g. 1h 30m.
+
+    :returns: Duration in milliseconds.
+
+    """
+    terms = re.findall(r"(\d+)\s*(ms|s|m|h|d)", time_to_live)
+    if not terms or re.sub(r"(\d+)\s*(ms|s|m|h|d)|\s", "", time_to_live):
+        raise ValueError(f"Unsupported time to live: {time_to_live}")
+
+    return sum(int(value) * _TTL_UNITS[unit] for value, unit in terms)
+
+
+def _create_deploy(
+    dispatcher: Account,
+    payment: tuple,
+    session: tuple,
+    chain_name: str,
+    gas_price: int,
+    time_to_live: str,
+    timestamp: datetime.datetime = None,
+    ) -> typing.Tuple[str, dict]:
+    """Returns a signed deploy.
+
+    """
+    key_algo = crypto.KeyAlgorithm[dispatcher.key_algo]
+    public_key = bytes.fromhex(dispatcher.public_key)
+    timestamp = timestamp or datetime.datetime.now(tz=datetime.timezone.utc)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=datetime.timezone.utc)
+    timestamp_ms = (timestamp - _EPOCH) // datetime.timedelta(milliseconds=1)
+    ttl_ms = get_ttl_ms(time_to_live)
+
+    # Body hash -> header -> deploy hash.
+    body_hash = crypto.get_hash(_get_item_bytes(payment) + _get_item_bytes(session))
+    header = \
+        _get_public_key_bytes(key_algo, public_key) + \
+        _to_u64_bytes(timestamp_ms) + \
+        _to_u64_bytes(ttl_ms) + \
+        _to_u64_bytes(gas_price) + \
+        body_hash + \
+        _to_u32_bytes(0) + \
+        _to_string_bytes(chain_name)
+    deploy_hash = crypto.get_hash(header)
+
+    # Approval.
+    signature = crypto.get_signature(deploy_hash, bytes.fromhex(dispatcher.private_key), key_algo)
+    signature = bytes([_KEY_ALGO_TAGS[key_algo]]) + signature
+
+    return deploy_hash.hex(), {
+        "approvals": [
+            {
+                "signature": signature.hex(),
+                "signer": dispatcher.account_key,
+            }
+        ],
+        "hash": deploy_hash.hex(),
+        "header": {
+            "account": dispatcher.account_key,
+            "body_hash": body_hash.hex(),
+            "chain_name": chain_name,
+            "dependencies": [],
+            "gas_price": gas_price,
+            "timestamp": _get_timestamp_json(timestamp_ms),
+            "ttl": f"{ttl_ms}ms",
+        },
+        "payment": _get_item_json(payment),
+        "session": _get_item_json(session),
+    }
+
+
+def _get_cl_byte_array(value: bytes) -> _CLValue:
+    """Returns a CL value: ByteArray.
+
+    """
+    return _CLValue(
+        {"ByteArray": len(value)},
+        bytes([_CL_TYPE_TAGS["ByteArray"]]) + _to_u32_bytes(len(value)),
+        value,
+        value.hex(),
+        )
+
+
+def _get_cl_option_u64(value: typing.Optional[int]) -> _CLValue:
+    """Returns a CL value: Option<U64>.
+
+    """
+    return _CLValue(
+        {"Option": "U64"},
+        bytes([_CL_TYPE_TAGS["Option"], _CL_TYPE_TAGS["U64"]]),
+        bytes([0]) if value is None else bytes([1]) + _to_u64_bytes(value),
+        value,
+        )
+
+
+def _get_cl_u512(value: int) -> _CLValue:
+    """Returns a CL value: U512 - encoded as length prefixed little endian bytes sans trailing zeros.
+
+    """
+    as_bytes = value.to_bytes(64, "little").rstrip(b"\x00")
+
+    return _CLValue(
+        "U512",
+        bytes([_CL_TYPE_TAGS["U512"]]),
+        bytes([len(as_bytes)]) + as_bytes,
+        str(value),
+        )
+
+
+def _get_item_bytes(item: tuple) -> bytes:
+    """Returns an executable deploy item as bytes.
+
+    """
+    tag, module_bytes, args = item
+    as_bytes = bytes([tag])
+    if tag == _ITEM_TAG_MODULE_BYTES:
+        as_bytes += _to_bytes_bytes(module_bytes)
+    as_bytes += _to_u32_bytes(len(args))
+    for name, value in args:
+        as_bytes += _to_string_bytes(name) + value.to_bytes()
+
+    return as_bytes
+
+
+def _get_item_json(item: tuple) -> dict:
+    """Returns JSON representation of an executable deploy item.
+
+    """
+    tag, module_bytes, args = item
+    args = [[name, value.to_json()] for name, value in args]
+    if tag == _ITEM_TAG_MODULE_BYTES:
+        return {"ModuleBytes": {"args": args, "module_bytes": module_bytes.hex()}}
+
+    return {"Transfer": {"args": args}}
+
+
+def _get_public_key_bytes(key_algo: crypto.KeyAlgorithm, public_key: bytes) -> bytes:
+    """Returns a tagged public key as bytes.
+
+    """
+    return bytes([_KEY_ALGO_TAGS[key_algo]]) + public_key
+
+
+def _get_timestamp_json(timestamp_ms: int) -> str:
+    """Returns a timestamp formatted as RFC 3339 with millisecond precision.
+
+    """
+    timestamp = _EPOCH + datetime.timedelta(milliseconds=timestamp_ms)
+
+    return f"{timestamp.strftime('%Y-%m-%dT%H:%M:%S')}.{str(timestamp_ms % 1000).zfill(3)}Z"
+
+
+def _to_bytes_bytes(value: bytes) -> bytes:
+    return _to_u32_bytes(len(value)) + value
+
+
+def _to_string_bytes(value: str) -> bytes:
+    return _to_bytes_bytes(value.encode("utf-8"))
+
+
+def _to_u32_bytes(value: int) -> bytes:
+    return value.to_bytes(4, "little")
+
+
+def _to_u64_bytes(value: int) -> bytes:
+    return value.to_bytes(8, "little")
@@ -1,6 +1,8 @@
 import json
 import subprocess
 
+from stests.chain import memo
+from stests.chain import rpc
 from stests.chain.get_state_root_hash import execute as get_state_root_hash
 from stests.core.types.infra import Network
 from stests.core.types.infra import Node
@@ -11,6 +13,9 @@ from stests.core.utils import paths
 # Method upon client to be invoked.
 _CLIENT_METHOD = "query-state"
 
+# Method upon node to be invoked.
+_RPC_METHOD = "state_get_item"
+
 
 def execute(
     network: Network,
@@ -28,9 +33,29 @@ def execute(
     :returns: JSON representation of an on-chain account.
 
     """
-    binary_path = paths.get_path_to_client(network)
     state_root_hash = state_root_hash or get_state_root_hash(network, node)
 
+    return memo.get_at_state_root(
+        network,
+        state_root_hash,
+        (_RPC_METHOD, account_key),
+        lambda: _execute(network, node, account_key, state_root_hash),
+        )
+
+
+def _execute(network: Network, node: Node, account_key: str, state_root_hash: str) -> str:
+    """Queries a node for an account at a state root hash.
+
+    """
+    if rpc.is_native():
+        return rpc.execute(node, _RPC_METHOD, {
+            "key": rpc.get_state_key(account_key),
+            "path": [],
+            "state_root_hash": state_root_hash,
+            })
+
+    binary_path = paths.get_path_to_client(network)
+
     cli_response = subprocess.run([
         binary_path, _CLIENT_METHOD,
         "--node-address", node.url_rpc,
@@ -1,6 +1,8 @@
 import json
 import subprocess
 
+from stests.chain import memo
+from stests.chain import rpc
 from stests.chain.get_state_root_hash import execute as get_state_root_hash
 from stests.core.types.infra import Network
 from stests.core.types.infra import Node
@@ -11,6 +13,9 @@ from stests.core.utils import paths
 # Method upon client to be invoked.
 _CLIENT_METHOD = "get-balance"
 
+# Method upon node to be invoked.
+_RPC_METHOD = "state_get_balance"
+
 
 def execute(
     network: Network,
@@ -28,9 +33,31 @@ def execute(
     :returns: Account balance.
 
     """
-    binary_path = paths.get_path_to_client(network)
     state_root_hash = state_root_hash or get_state_root_hash(network, node)
 
+    return memo.get_at_state_root(
+        network,
+        state_root_hash,
+        (_RPC_METHOD, purse_uref),
+        lambda: _execute(network, node, purse_uref, state_root_hash),
+        )
+
+
+def _execute(network: Network, node: Node, purse_uref: str, state_root_hash: str) -> int:
+    """Queries purse balance at a state root hash.
+
+    """
+    if rpc.is_native():
+        try:
+            return int(rpc.execute(node, _RPC_METHOD, {
+                "purse_uref": purse_uref,
+                "state_root_hash": state_root_hash,
+                })['balance_value'])
+        except rpc.RPC_Exception:
+            return None
+
+    binary_path = paths.get_path_to_client(network)
+
     cli_response = subprocess.run([
         binary_path, _CLIENT_METHOD,
         "--node-address", node.url_rpc,
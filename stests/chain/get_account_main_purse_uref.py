@@ -1,3 +1,4 @@
+from stests.chain import memo
 from stests.chain.get_account import execute as get_account
 from stests.core.types.infra import Node
 from stests.core.types.infra import Network
@@ -10,7 +11,7 @@ def execute(
     account_key: str,
     state_root_hash: str = None,
     ) -> int:
-    """Returns main purse uref for an account.
+    """Returns main purse uref for an account - memoised as an account's main purse never changes.
 
     :param network: Target network being tested.
     :param node: Target node being tested.
@@ -20,6 +21,8 @@ def execute(
     :returns: Account main purse uref.
 
     """
-    account = get_account(network, node, account_key, state_root_hash)
-
-    return account['stored_value']['Account']['main_purse']
+    return memo.get_purse_uref(
+        network,
+        account_key,
+        lambda: get_account(network, node, account_key, state_root_hash)['stored_value']['Account']['main_purse'],
+        )
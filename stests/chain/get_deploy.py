@@ -1,6 +1,7 @@
 import json
 import subprocess
 
+from stests.chain import rpc
 from stests.core.types.infra import Network
 from stests.core.types.infra import Node
 from stests.core.utils import paths
@@ -10,6 +11,9 @@ from stests.core.utils import paths
 # Method upon client to be invoked.
 _CLIENT_METHOD = "get-deploy"
 
+# Method upon node to be invoked.
+_RPC_METHOD = "info_get_deploy"
+
 
 def execute(
     network: Network,
@@ -25,6 +29,11 @@ def execute(
     :returns: Representation of a deploy within a node's state.
 
     """
+    if rpc.is_native():
+        return rpc.execute(node, _RPC_METHOD, {
+            "deploy_hash": deploy_hash,
+            })
+
     binary_path = paths.get_path_to_client(network)
 
     cli_response = subprocess.run([
@@ -1,3 +1,6 @@
+import re
+import typing
+
 import requests
 
 from stests.core.types.infra import Network
@@ -5,6 +8,51 @@ from stests.core.types.infra import Node
 
 
 
+# Pattern matching a sample line: name, labels, value, optional timestamp.
+_SAMPLE_PATTERN = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})?\s+(\S+)(?:\s+(-?\d+))?\s*$')
+
+# Pattern matching a sample label pair.
+_LABEL_PATTERN = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*"((?:[^"\\]|\\.)*)"')
+
+# Map: label value escape sequence -> character.
+_LABEL_ESCAPES = {
+    '\\\\': '\\',
+    '\\"': '"',
+    '\\n': '\n',
+}
+
+# Suffixes of sample names derived from a histogram or summary metric family.
+_FAMILY_SUFFIXES = ("_bucket", "_count", "_sum")
+
+
+class NodeMetricSample(typing.NamedTuple):
+    """A typed sample parsed from a node's Prometheus metrics exposition.
+
+    """
+    # Metric name.
+    name: str
+
+    # Metric labels.
+    labels: typing.Dict[str, str]
+
+    # Metric family type: counter | gauge | histogram | summary | untyped.
+    metric_type: str
+
+    # Sampled value.
+    value: float
+
+    # Timestamp (in milliseconds) if exposed by node.
+    timestamp: typing.Optional[int] = None
+
+    @property
+    def series(self) -> str:
+        """Identifier of time series to which sample belongs."""
+        if not self.labels:
+            return self.name
+        labels = ",".join(f"{k}={v}" for k, v in sorted(self.labels.items()))
+        return f"{self.name}[{labels}]"
+
+
 def execute(
     network: Network,
     node: Node,
@@ -21,3 +69,83 @@ def execute(
     response = requests.get(url)
 
     return response.content.decode("utf-8")
+
+
+def execute_parsed(
+    network: Network,
+    node: Node,
+    ) -> typing.List[NodeMetricSample]:
+    """Queries a node for it's current metrics parsed into typed samples.
+
+    :param network: Target network being tested.
+    :param node: Target node being tested.
+
+    :returns: A node's metric samples.
+
+    """
+    return parse(execute(network, node))
+
+
+def parse(exposition: str) -> typing.List[NodeMetricSample]:
+    """Parses metrics in Prometheus text exposition format.
+
+    :param exposition: Metrics in Prometheus text exposition format.
+
+    :returns: Typed metric samples - unparseable lines are skipped.
+
+    """
+    family_types = dict()
+    samples = []
+    for line in exposition.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+
+        # Comments: only TYPE metadata is of interest.
+        if line.startswith("#"):
+            tokens = line.split()
+            if len(tokens) >= 4 and tokens[1] == "TYPE":
+                family_types[tokens[2]] = tokens[3]
+            continue
+
+        match = _SAMPLE_PATTERN.match(line)
+        if not match:
+            continue
+        name, labels, value, timestamp = match.groups()
+        try:
+            value = float(value)
+        except ValueError:
+            continue
+
+        samples.append(NodeMetricSample(
+            name=name,
+            labels=_parse_labels(labels) if labels else dict(),
+            metric_type=_get_family_type(family_types, name),
+            value=value,
+            timestamp=int(timestamp) if timestamp else None,
+        ))
+
+    return samples
+
+
+def _get_family_type(family_types: typing.Dict[str, str], name: str) -> str:
+    """Returns type of metric family to which a sample belongs.
+
+    """
+    if name in family_types:
+        return family_types[name]
+    for suffix in _FAMILY_SUFFIXES:
+        if name.endswith(suffix) and name[:-len(suffix)] in family_types:
+            return family_types[name[:-len(suffix)]]
+
+    return "untyped"
+
+
+def _parse_labels(labels: str) -> typing.Dict[str, str]:
+    """Returns parsed sample labels.
+
+    """
+    return {
+        name: re.sub(r'\\.', lambda i: _LABEL_ESCAPES.get(i.group(0), i.group(0)), value)
+        for name, value in _LABEL_PATTERN.findall(labels)
+    }
@@ -0,0 +1,80 @@
+import collections
+import threading
+import typing
+
+from stests.core.types.infra import Network
+from stests.core.utils import env
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Maximum number of memoised state root scoped query results - 0 disables memoisation.
+    MAX_SIZE = env.get_var('CHAIN_MEMO_MAX_SIZE', 4096, int)
+
+
+# Map: (network, state root hash, query, key) -> query result - bounded LRU.
+_AT_STATE_ROOT: typing.Dict[tuple, typing.Any] = collections.OrderedDict()
+
+# Map: (network, account key) -> main purse uref - unbounded as main purses never change.
+_PURSE_UREFS: typing.Dict[typing.Tuple[str, str], str] = dict()
+
+# Lock guarding access to memoised results.
+_LOCK = threading.Lock()
+
+
+def get_at_state_root(network: Network, state_root_hash: str, key: tuple, query: typing.Callable) -> typing.Any:
+    """Returns a query result memoised by state root hash - results at a given state root are immutable.
+
+    :param network: Target network being tested.
+    :param state_root_hash: State root hash at which query is executed.
+    :param key: Query specific key, e.g. (method, purse uref).
+    :param query: Query to execute upon a miss.
+
+    :returns: Query result.
+
+    """
+    if EnvVars.MAX_SIZE <= 0:
+        return query()
+
+    memo_key = (network.name, state_root_hash) + key
+    with _LOCK:
+        if memo_key in _AT_STATE_ROOT:
+            _AT_STATE_ROOT.move_to_end(memo_key)
+            return _AT_STATE_ROOT[memo_key]
+
+    # Null results, e.g. not found, are not memoised as they may reflect transient node errors.
+    result = query()
+    if result is not None:
+        with _LOCK:
+            _AT_STATE_ROOT[memo_key] = result
+            while len(_AT_STATE_ROOT) > EnvVars.MAX_SIZE:
+                _AT_STATE_ROOT.popitem(last=False)
+
+    return result
+
+
+def get_purse_uref(network: Network, account_key: str, query: typing.Callable) -> str:
+    """Returns an account's main purse uref memoised permanently.
+
+    :param network: Target network being tested.
+    :param account_key: Key of account whose main purse is being queried.
+    :param query: Query to execute upon a miss.
+
+    :returns: Account main purse uref.
+
+    """
+    memo_key = (network.name, account_key)
+    with _LOCK:
+        try:
+            return _PURSE_UREFS[memo_key]
+        except KeyError:
+            pass
+
+    result = query()
+    if result is not None:
+        with _LOCK:
+            _PURSE_UREFS[memo_key] = result
+
+    return result
+
@@ -0,0 +1,133 @@
+import random
+import threading
+import time
+import typing
+
+from stests.core import cache
+from stests.core.types.infra import Network
+from stests.core.types.infra import Node
+from stests.core.utils import env
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Maximum delay (in seconds) between dispatch attempts.
+    BACKOFF_MAX = env.get_var('CHAIN_DISPATCH_BACKOFF_MAX', 2.0, float)
+
+    # Number of consecutive failures upon which a node's circuit is opened, i.e. node is excluded from dispatch.
+    CIRCUIT_FAILURE_THRESHOLD = env.get_var('CHAIN_DISPATCH_CIRCUIT_FAILURE_THRESHOLD', 3, int)
+
+    # Time (in seconds) for which an opened circuit excludes a node before a trial dispatch is permitted.
+    CIRCUIT_OPEN_DURATION = env.get_var('CHAIN_DISPATCH_CIRCUIT_OPEN_DURATION', 30, int)
+
+
+# Weight of most recent observation within moving averages.
+_EWMA_WEIGHT = 0.2
+
+# Map: (network, node index) -> node health.
+_HEALTH: typing.Dict[typing.Tuple[str, int], "_NodeHealth"] = dict()
+
+# Lock guarding access to node health.
+_LOCK = threading.Lock()
+
+
+class _NodeHealth():
+    """Health of a node as observed by dispatches from current process.
+
+    """
+    def __init__(self):
+        self.consecutive_failures = 0
+        self.error_rate = 0.0
+        self.latency = 0.0
+        self.opened_at = None
+
+    @property
+    def is_available(self) -> bool:
+        """Flag indicating whether node may be dispatched to - an opened circuit permits a trial dispatch once elapsed."""
+        return self.opened_at is None or time.monotonic() - self.opened_at >= EnvVars.CIRCUIT_OPEN_DURATION
+
+    @property
+    def score(self) -> float:
+        """Health score in range (0, 1] - higher is healthier."""
+        return (1 - self.error_rate) / ((1 + self.latency) * (1 + self.consecutive_failures))
+
+    def on_failure(self):
+        self.consecutive_failures += 1
+        self.error_rate += _EWMA_WEIGHT * (1 - self.error_rate)
+        if self.consecutive_failures >= EnvVars.CIRCUIT_FAILURE_THRESHOLD:
+            self.opened_at = time.monotonic()
+
+    def on_success(self, latency: float):
+        self.consecutive_failures = 0
+        self.error_rate -= _EWMA_WEIGHT * self.error_rate
+        self.latency += _EWMA_WEIGHT * (latency - self.latency)
+        self.opened_at = None
+
+
+def get_backoff(attempt: int, retry_delay: float) -> float:
+    """Returns time to wait prior to a dispatch retry - exponential with full jitter.
+
+    :param attempt: Number of attempts made so far.
+    :param retry_delay: Base retry delay (in seconds).
+
+    :returns: Time (in seconds) to wait.
+
+    """
+    return random.uniform(0, min(EnvVars.BACKOFF_MAX, retry_delay * 2 ** (attempt - 1)))
+
+
+def get_node(network: Network, preferred: Node, excluded: typing.Set[int] = frozenset()) -> Node:
+    """Returns node to which a deploy is to be dispatched - preferred node unless unhealthy, else an alternative weighted by health.
+
+    :param network: Target network being tested.
+    :param preferred: Node preferred by caller.
+    :param excluded: Indexes of nodes to be excluded, e.g. those that failed a dispatch.
+
+    :returns: Node to which deploy is to be dispatched.
+
+    """
+    with _LOCK:
+        if preferred.index not in excluded and _get(preferred).is_available:
+            return preferred
+
+    candidates = [i for i in cache.infra.get_nodes_for_dispatch(network) if i.index not in excluded]
+    with _LOCK:
+        candidates = [i for i in candidates if _get(i).is_available] or candidates
+        if not candidates:
+            return preferred
+
+        return random.choices(candidates, weights=[_get(i).score for i in candidates])[0]
+
+
+def on_dispatch_failure(node: Node):
+    """Records a failed dispatch.
+
+    :param node: Node to which a deploy was dispatched.
+
+    """
+    with _LOCK:
+        _get(node).on_failure()
+
+
+def on_dispatch_success(node: Node, latency: float):
+    """Records a successful dispatch.
+
+    :param node: Node to which a deploy was dispatched.
+    :param latency: Time (in seconds) taken to dispatch.
+
+    """
+    with _LOCK:
+        _get(node).on_success(latency)
+
+
+def _get(node: Node) -> _NodeHealth:
+    """Returns (instantiating if necessary) health of a node.
+
+    """
+    key = (node.network, node.index)
+    try:
+        return _HEALTH[key]
+    except KeyError:
+        _HEALTH[key] = _NodeHealth()
+        return _HEALTH[key]
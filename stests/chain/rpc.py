@@ -0,0 +1,159 @@
+import itertools
+import os
+import threading
+import typing
+
+import requests
+
+from stests.core import crypto
+from stests.core.types.infra import Node
+from stests.core.utils import env
+from stests.core.utils.exceptions import InvalidEnvironmentVariable
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Client used to query chain state: NATIVE = pooled JSON-RPC | SUBPROCESS = casper-client binary.
+    CLIENT_TYPE = env.get_var('CHAIN_CLIENT_TYPE', "NATIVE", str.upper)
+
+    # Client used to dispatch native transfers: NATIVE = in-process signing + JSON-RPC | SUBPROCESS = casper-client binary.
+    DISPATCH_CLIENT_TYPE = env.get_var('CHAIN_DISPATCH_CLIENT_TYPE', "SUBPROCESS", str.upper)
+
+    # Maximum number of pooled keep-alive connections per node.
+    RPC_POOL_MAX_CONNECTIONS = env.get_var('CHAIN_RPC_POOL_MAX_CONNECTIONS', 16, int)
+
+    # Time (in seconds) to wait for a node to reply.
+    RPC_TIMEOUT = env.get_var('CHAIN_RPC_TIMEOUT', 30, int)
+
+
+# Set of supported chain clients.
+CLIENT_TYPES = {
+    "NATIVE",
+    "SUBPROCESS",
+}
+
+# Length of a hexadecimal block hash.
+_BLOCK_HASH_LENGTH = 64
+
+# Sequence of JSON-RPC request identifiers.
+_IDS = itertools.count(1)
+
+# Per thread pooled HTTP session.
+_SESSIONS = threading.local()
+
+
+class RPC_Exception(Exception):
+    """Raised when a node replies to a JSON-RPC request with an error.
+
+    """
+    def __init__(self, method: str, error: dict):
+        """Constructor.
+
+        :param method: JSON-RPC method that was invoked.
+        :param error: Error returned by node.
+
+        """
+        self.method = method
+        self.code = error.get("code")
+        self.message = error.get("message")
+        super(RPC_Exception, self).__init__(f"{method} failed :: {self.code} :: {self.message}")
+
+
+def is_native() -> bool:
+    """Returns flag indicating whether chain queries are issued natively over JSON-RPC.
+
+    """
+    return _is_native("CHAIN_CLIENT_TYPE", EnvVars.CLIENT_TYPE)
+
+
+def is_native_dispatch() -> bool:
+    """Returns flag indicating whether deploys are built, signed & dispatched natively over JSON-RPC.
+
+    """
+    return _is_native("CHAIN_DISPATCH_CLIENT_TYPE", EnvVars.DISPATCH_CLIENT_TYPE)
+
+
+def execute(node: Node, method: str, params: dict = None) -> typing.Any:
+    """Invokes a JSON-RPC method upon a node.
+
+    :param node: Target node being tested.
+    :param method: JSON-RPC method to be invoked.
+    :param params: JSON-RPC method parameters.
+
+    :returns: JSON-RPC method result.
+
+    """
+    request = {
+        "id": next(_IDS),
+        "jsonrpc": "2.0",
+        "method": method,
+    }
+    if params:
+        request["params"] = params
+
+    response = _get_session().post(node.url_rpc, json=request, timeout=EnvVars.RPC_TIMEOUT)
+    response.raise_for_status()
+    reply = response.json()
+    if "error" in reply:
+        raise RPC_Exception(method, reply["error"])
+
+    return reply["result"]
+
+
+def get_block_identifier(block_id: typing.Union[str, int] = None) -> typing.Optional[dict]:
+    """Returns a JSON-RPC block identifier - as per casper-client --block-identifier parsing.
+
+    :param block_id: Either a block hash or a block height.
+
+    :returns: JSON-RPC block identifier.
+
+    """
+    if block_id is None or block_id == "":
+        return None
+    if isinstance(block_id, str) and len(block_id) == _BLOCK_HASH_LENGTH:
+        return {"Hash": block_id}
+
+    return {"Height": int(block_id)}
+
+
+def get_state_key(key: str) -> str:
+    """Returns a formatted global state key - as per casper-client --key parsing, i.e. public keys map to account hashes.
+
+    :param key: Either a formatted key or a hexadecimal public key.
+
+    :returns: Formatted global state key.
+
+    """
+    if "-" in key:
+        return key
+
+    return f"account-hash-{crypto.get_account_hash(key)}"
+
+
+def _is_native(name: str, client_type: str) -> bool:
+    """Returns flag indicating whether a client type setting denotes native JSON-RPC.
+
+    """
+    if client_type not in CLIENT_TYPES:
+        raise InvalidEnvironmentVariable(name, client_type, " | ".join(sorted(CLIENT_TYPES)))
+
+    return client_type == "NATIVE"
+
+
+def _get_session() -> requests.Session:
+    """Returns (instantiating if necessary) a pooled keep-alive HTTP session bound to current thread.
+
+    """
+    # Sessions are discarded upon fork as sockets must not be shared across processes.
+    if getattr(_SESSIONS, "pid", None) != os.getpid():
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=EnvVars.RPC_POOL_MAX_CONNECTIONS,
+            pool_maxsize=EnvVars.RPC_POOL_MAX_CONNECTIONS,
+            )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _SESSIONS.session, _SESSIONS.pid = session, os.getpid()
+
+    return _SESSIONS.session
@@ -3,6 +3,8 @@ import random
 import subprocess
 
 from stests.core.logging import log_event
+from stests.chain import deploy_builder
+from stests.chain import rpc
 from stests.chain.utils import execute_cli
 from stests.chain.utils import DeployDispatchInfo
 from stests.core.types.chain import Account
@@ -15,6 +17,9 @@ from stests.events import EventType
 # Method upon client to be invoked.
 _CLIENT_METHOD = "transfer"
 
+# Method upon node to be invoked.
+_RPC_METHOD = "account_put_deploy"
+
 # Maximum value of a transfer ID.
 _MAX_TRANSFER_ID = (2 ** 63) - 1
 
@@ -30,8 +35,28 @@ def execute(info: DeployDispatchInfo, cp2: Account, amount: int, verbose: bool =
     :returns: Dispatched deploy hash.
 
     """
-    binary_path = paths.get_path_to_client(info.network)
     cp1 = info.dispatcher
+    if rpc.is_native_dispatch():
+        deploy_hash = _execute_native(info, cp2, amount)
+    else:
+        deploy_hash = _execute_client(info, cp2, amount)
+    
+    if verbose:
+        log_event(
+            EventType.WFLOW_DEPLOY_DISPATCHED,
+            f"{info.node.address} :: {deploy_hash} :: transfer (native) :: {amount} CSPR :: from {cp1.account_key[:8]} -> {cp2.account_key[:8]} ",
+            info.node,
+            deploy_hash=deploy_hash,
+            )
+
+    return deploy_hash
+
+
+def _execute_client(info: DeployDispatchInfo, cp2: Account, amount: int) -> str:
+    """Dispatches a transfer via casper-client.
+
+    """
+    binary_path = paths.get_path_to_client(info.network)
 
     cli_response = subprocess.run([
         binary_path, _CLIENT_METHOD,
@@ -47,14 +72,23 @@ def execute(info: DeployDispatchInfo, cp2: Account, amount: int, verbose: bool =
         ],
         stdout=subprocess.PIPE,
         )
-    deploy_hash = json.loads(cli_response.stdout)['result']['deploy_hash']
-    
-    if verbose:
-        log_event(
-            EventType.WFLOW_DEPLOY_DISPATCHED,
-            f"{info.node.address} :: {deploy_hash} :: transfer (native) :: {amount} CSPR :: from {cp1.account_key[:8]} -> {cp2.account_key[:8]} ",
-            info.node,
-            deploy_hash=deploy_hash,
-            )
 
-    return deploy_hash
+    return json.loads(cli_response.stdout)['result']['deploy_hash']
+
+
+def _execute_native(info: DeployDispatchInfo, cp2: Account, amount: int) -> str:
+    """Dispatches a transfer built & signed in process.
+
+    """
+    _, deploy = deploy_builder.create_transfer_native(
+        dispatcher=info.dispatcher,
+        target_account_key=cp2.account_key,
+        amount=amount,
+        transfer_id=random.randint(1, _MAX_TRANSFER_ID),
+        chain_name=info.network.chain_name,
+        fee=int(info.fee),
+        gas_price=int(info.gas_price),
+        time_to_live=str(info.time_to_live),
+        )
+
+    return rpc.execute(info.node, _RPC_METHOD, {"deploy": deploy})['deploy_hash']
@@ -1,5 +1,10 @@
+import asyncio
+import functools
 import json
+import re
+import ssl
 import typing
+import urllib.parse
 
 import requests
 import sseclient
@@ -7,20 +12,65 @@ import sseclient
 from stests.core import factory
 from stests.core.logging import log_event
 from stests.core.types.infra import Node
+from stests.core.utils import env
+from stests.core.utils.exceptions import InvalidEnvironmentVariable
 from stests.events import EventType
 
 
 
-def execute(node: Node, event_callback: typing.Callable, event_id: int = 0):
+# Environment variables required by this module.
+class EnvVars:
+    # JSON backend used to decode event payloads (AUTO = orjson if installed else json | ORJSON | JSON).
+    JSON_BACKEND = env.get_var('CHAIN_EVENT_JSON_BACKEND', "AUTO", str.upper)
+
+
+# Map: event payload top-level key -> event type (None = never of interest).
+_EVENT_KEYS = {
+    "ApiVersion": None,
+    "BlockAdded": EventType.MONIT_BLOCK_ADDED,
+    "BlockFinalized": EventType.MONIT_BLOCK_FINALIZED,
+    "DeployProcessed": EventType.MONIT_DEPLOY_PROCESSED,
+    "Fault": EventType.MONIT_CONSENSUS_FAULT,
+    "FinalitySignature": EventType.MONIT_CONSENSUS_FINALITY_SIGNATURE,
+    "Step": EventType.MONIT_STEP,
+}
+
+# Map: supported event stream url scheme -> default port.
+_DEFAULT_PORTS = {
+    "http": 80,
+    "https": 443,
+}
+
+# Pattern matching an event payload's top-level key.
+_EVENT_KEY_PATTERN = re.compile(r'\s*\{\s*"(\w+)"')
+
+# Set of supported JSON backends.
+_JSON_BACKENDS = {
+    "AUTO",
+    "JSON",
+    "ORJSON",
+}
+
+# Size (in bytes) of an event stream read - buffered reads beyond which socket reads are paused.
+_STREAM_READ_SIZE = 2 ** 16
+
+
+def execute(
+    node: Node,
+    event_callback: typing.Callable,
+    event_id: int = 0,
+    event_types: typing.Set[EventType] = None,
+    ):
     """Hooks upto a node's event stream invoking passed callback for each event.
 
     :param node: The node to which to bind.
     :param event_callback: Callback to invoke whenever an event of relevant type is received.
     :param event_id: Identifer of event from which to start stream.
+    :param event_types: Types of event of interest - others are discarded prior to decoding - defaults to all.
 
     """
     log_event(EventType.MONIT_STREAM_OPENING, node.address_event, node)
-    for event_type, event_id, payload, block_hash, deploy_hash, account_key in _yield_events(node, event_id):
+    for event_type, event_id, payload, block_hash, deploy_hash, account_key in _yield_events(node, event_id, event_types):
         event_info = factory.create_node_event_info(
             node,
             event_id,
@@ -32,7 +82,34 @@ def execute(node: Node, event_callback: typing.Callable, event_id: int = 0):
         event_callback(node, event_info, payload)
 
 
-def _yield_events(node: Node, event_id: int):
+async def execute_async(
+    node: Node,
+    event_callback: typing.Callable,
+    event_id: int = 0,
+    event_types: typing.Set[EventType] = None,
+    ):
+    """Hooks upto a node's event stream awaiting passed coroutine callback for each event.
+
+    :param node: The node to which to bind.
+    :param event_callback: Coroutine callback to await whenever an event of relevant type is received - stream reads are suspended until it returns.
+    :param event_id: Identifer of event from which to start stream.
+    :param event_types: Types of event of interest - others are discarded prior to decoding - defaults to all.
+
+    """
+    log_event(EventType.MONIT_STREAM_OPENING, node.address_event, node)
+    async for event_type, event_id, payload, block_hash, deploy_hash, account_key in _yield_events_async(node, event_id, event_types):
+        event_info = factory.create_node_event_info(
+            node,
+            event_id,
+            event_type,
+            block_hash,
+            deploy_hash,
+            account_key,
+        )
+        await event_callback(node, event_info, payload)
+
+
+def _yield_events(node: Node, event_id: int, event_types: typing.Optional[typing.Set[EventType]]):
     """Yields events streaming from node.
 
     """
@@ -48,7 +125,7 @@ def _yield_events(node: Node, event_id: int):
     # Bind to stream & yield parsed events.
     try:
         for event in client.events():
-            parsed = _parse_event(node, event.id, json.loads(event.data))
+            parsed = _decode_event(node, _get_event_id(event.id), event.data, event_types)
             if parsed:
                 yield parsed
 
@@ -62,6 +139,176 @@ def _yield_events(node: Node, event_id: int):
             raise err
 
 
+async def _yield_events_async(node: Node, event_id: int, event_types: typing.Optional[typing.Set[EventType]]):
+    """Yields events streaming from node over a non-blocking connection.
+
+    """
+    # Open connection.
+    host, port, ssl_context, path, netloc = _get_connection_info(node.url_event, event_id)
+    reader, writer = await asyncio.open_connection(host, port, ssl=ssl_context, limit=_STREAM_READ_SIZE)
+    try:
+        writer.write((
+            f"GET {path} HTTP/1.1\r\n"
+            f"Host: {netloc}\r\n"
+            "Accept: text/event-stream\r\n"
+            "Cache-Control: no-cache\r\n"
+            "\r\n"
+            ).encode("ascii"))
+        await writer.drain()
+
+        # Parse response headers.
+        status = (await reader.readline()).decode("latin-1").split(" ", 2)
+        if len(status) < 2 or status[1] != "200":
+            raise ConnectionError(f"event stream bind failure :: {node.url_event} :: {' '.join(status).strip()}")
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip().lower()
+
+        # Bind to stream & yield parsed events.
+        event = _SSE_Event()
+        async for line in _yield_lines(reader, headers.get("transfer-encoding") == "chunked"):
+            if line:
+                event.set_field(line)
+            elif event.data:
+                parsed = _decode_event(node, _get_event_id(event.id), event.data, event_types)
+                if parsed:
+                    yield parsed
+                event = _SSE_Event()
+
+    # Close connection.
+    finally:
+        writer.close()
+
+
+def _get_connection_info(url_event: str, event_id: int) -> typing.Tuple[str, int, typing.Optional[ssl.SSLContext], str, str]:
+    """Returns information required to open a connection to a node's event stream.
+
+    :param url_event: Url of node's event stream.
+    :param event_id: Identifier of event from which to stream.
+
+    :returns: 5 member tuple: (host, port, ssl context | None, request path, host header).
+
+    """
+    url = urllib.parse.urlsplit(url_event)
+    if url.scheme not in _DEFAULT_PORTS:
+        raise ValueError(f"Unsupported event stream url scheme: {url_event}")
+    if not url.hostname:
+        raise ValueError(f"Invalid event stream url: {url_event}")
+
+    query = urllib.parse.parse_qsl(url.query)
+    if event_id:
+        query.append(("start_from", event_id))
+    path = urllib.parse.urlunsplit(("", "", url.path or "/", urllib.parse.urlencode(query), ""))
+
+    return (
+        url.hostname,
+        url.port or _DEFAULT_PORTS[url.scheme],
+        ssl.create_default_context() if url.scheme == "https" else None,
+        path,
+        url.netloc,
+        )
+
+
+async def _yield_lines(reader: asyncio.StreamReader, is_chunked: bool):
+    """Yields decoded lines (sans line terminators) from an HTTP response body.
+
+    """
+    buffer = b""
+    while True:
+        if is_chunked:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                return
+            buffer += await reader.readexactly(size)
+            await reader.readexactly(2)
+        else:
+            data = await reader.read(_STREAM_READ_SIZE)
+            if not data:
+                return
+            buffer += data
+
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line.rstrip(b"\r").decode("utf-8")
+
+
+class _SSE_Event():
+    """A server sent event being assembled from stream fields.
+
+    """
+    def __init__(self):
+        self.data = ""
+        self.id = None
+
+    def set_field(self, line: str):
+        """Applies a field line as per the server sent events specification.
+
+        """
+        # Comment.
+        if line.startswith(":"):
+            return
+
+        name, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if name == "data":
+            self.data = f"{self.data}\n{value}" if self.data else value
+        elif name == "id":
+            self.id = value
+
+
+def _decode_event(
+    node: Node,
+    event_id: int,
+    data: str,
+    event_types: typing.Optional[typing.Set[EventType]],
+    ) -> typing.Optional[tuple]:
+    """Decodes raw event data - discarding events not of interest without a full decode.
+
+    """
+    # Peek at top-level key - large payloads, e.g. BlockAdded, are only decoded when of interest.
+    match = _EVENT_KEY_PATTERN.match(data)
+    if match and match.group(1) in _EVENT_KEYS:
+        event_type = _EVENT_KEYS[match.group(1)]
+        if event_type is None or (event_types is not None and event_type not in event_types):
+            return
+
+    parsed = _parse_event(node, event_id, _get_json_decoder()(data))
+    if parsed and (event_types is None or parsed[0] in event_types):
+        return parsed
+
+
+@functools.lru_cache(maxsize=1)
+def _get_json_decoder() -> typing.Callable:
+    """Returns JSON decoder used to decode event payloads.
+
+    """
+    if EnvVars.JSON_BACKEND not in _JSON_BACKENDS:
+        raise InvalidEnvironmentVariable("CHAIN_EVENT_JSON_BACKEND", EnvVars.JSON_BACKEND, " | ".join(sorted(_JSON_BACKENDS)))
+
+    if EnvVars.JSON_BACKEND != "JSON":
+        try:
+            import orjson
+        except ImportError:
+            if EnvVars.JSON_BACKEND == "ORJSON":
+                raise
+        else:
+            return orjson.loads
+
+    return json.loads
+
+
+def _get_event_id(value: typing.Optional[str]) -> typing.Optional[int]:
+    """Returns a parsed event identifier.
+
+    """
+    return int(value) if value and value.isdigit() else None
+
+
 def _parse_event(
     node: Node,
     event_id: int,
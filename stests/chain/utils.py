@@ -3,6 +3,7 @@ import time
 import typing
 
 from stests.chain import constants
+from stests.chain import node_health
 from stests.core.utils.misc import Timer
 from stests.core.types.chain import Account
 from stests.core.types.infra import Network
@@ -34,6 +35,13 @@ class DeployDispatchInfo():
         self.fee = fee
         self.gas_price = gas_price
 
+    def set_node(self, node: Node):
+        """Sets node to which deploy will be dispatched.
+
+        """
+        self.node = node
+        self.node_address = node.url_rpc
+
 
 class CLI_Exception(Exception):
     """Command line interface exception class.
@@ -68,10 +76,13 @@ class CLI_Exception(Exception):
 def execute_cli(command: str, on_failure_event: EventType,  max_attempts: int = 5, retry_delay: float = 1.0) -> typing.Callable:
     """Decorator to orthoganally execute a CLI operation.
 
+    When dispatching a deploy, unhealthy nodes are failed over to alternative dispatchable nodes, in which
+    case the node actually dispatched to is set upon the passed DeployDispatchInfo.
+
     :param command: CLI command being executed.
     :param on_failure_event: Logging event to emit upon failure.
     :param max_attempts: Maximum attempts to try being escaping.
-    :param retry_delay: Retry delay.
+    :param retry_delay: Base retry delay - actual delay is jittered & backs off exponentially.
 
     :returns: Decorated function with it's result augmented with execution stats.
 
@@ -79,18 +90,29 @@ def execute_cli(command: str, on_failure_event: EventType,  max_attempts: int =
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            info = args[0] if args and isinstance(args[0], DeployDispatchInfo) else None
+            preferred = info.node if info else None
+            failed = set()
 
             with Timer() as timer:
                 attempts = 0
                 while attempts < max_attempts:
                     attempts += 1
+                    if info:
+                        info.set_node(node_health.get_node(info.network, preferred, failed))
+                    started_at = time.perf_counter()
                     try:
                         result = func(*args, **kwargs)
                     except Exception as err:
+                        if info:
+                            node_health.on_dispatch_failure(info.node)
+                            failed.add(info.node.index)
                         if attempts == max_attempts:
                             raise CLI_Exception(command, on_failure_event, attempts, err)
-                        time.sleep(retry_delay)
+                        time.sleep(node_health.get_backoff(attempts, retry_delay))
                     else:
+                        if info:
+                            node_health.on_dispatch_success(info.node, time.perf_counter() - started_at)
                         break
 
             return result, timer.elapsed, attempts
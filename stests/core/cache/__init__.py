@@ -2,3 +2,4 @@ import stests.core.cache.ops.infra as infra
 import stests.core.cache.ops.monitoring as monitoring
 import stests.core.cache.ops.orchestration as orchestration
 import stests.core.cache.ops.state as state
+from stests.core.cache.ops.utils import batch
@@ -0,0 +1,183 @@
+import collections
+import os
+import threading
+import time
+import typing
+
+import redis
+
+from stests.core.cache.model import StorePartition
+from stests.core.cache import stores
+from stests.core.utils import encoder
+from stests.core.utils import env
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Maximum number of items held in process local cache.
+    MAX_SIZE = env.get_var('CACHE_LOCAL_MAX_SIZE', 1024, int)
+
+    # Time (in seconds) after which a process locally cached item is discarded - 0 disables local caching.
+    TTL = env.get_var('CACHE_LOCAL_TTL', 60, int)
+
+
+# Set of partitions whose reads are cached locally - i.e. rarely written partitions.
+PARTITIONS = {
+    StorePartition.INFRA,
+}
+
+# Channel over which invalidation notifications are published.
+_CHANNEL = "stests:cache:invalidate"
+
+# Map: (partition, operation, key) -> (expiry timestamp, encoded item).
+_ITEMS: typing.Dict[tuple, typing.Tuple[float, bytes]] = collections.OrderedDict()
+
+# Count of local cache invalidations - guards against caching items read prior to an invalidation.
+_GENERATION = 0
+
+# Lock guarding access to locally cached items.
+_ITEMS_LOCK = threading.Lock()
+
+# Identifier of process within which invalidation listener is running.
+_LISTENER_PID: typing.Optional[int] = None
+
+# Lock guarding invalidation listener instantiation across threads.
+_LISTENER_LOCK = threading.Lock()
+
+# Flag indicating whether invalidation notifications are being received.
+_IS_SUBSCRIBED = threading.Event()
+
+
+def get_generation() -> int:
+    """Returns number of times locally cached items have been discarded.
+
+    """
+    return _GENERATION
+
+
+def get_item(partition: StorePartition, key: tuple) -> typing.Tuple[bool, typing.Any]:
+    """Returns a locally cached item.
+
+    :param partition: Cache partition to which item pertains.
+    :param key: Key of locally cached item.
+
+    :returns: 2 member tuple -> (was cache hit, decoded item).
+
+    """
+    if not _is_enabled():
+        return False, None
+
+    with _ITEMS_LOCK:
+        try:
+            expiry, data = _ITEMS[(partition, ) + key]
+        except KeyError:
+            return False, None
+        if expiry < time.monotonic():
+            del _ITEMS[(partition, ) + key]
+            return False, None
+        _ITEMS.move_to_end((partition, ) + key)
+
+    # Decode per hit so that callers never share (mutable) instances.
+    return True, encoder.from_bytes(data)
+
+
+def set_item(partition: StorePartition, key: tuple, item: typing.Any, generation: int):
+    """Caches an item locally.
+
+    :param partition: Cache partition to which item pertains.
+    :param key: Key of locally cached item.
+    :param item: Item to be cached.
+    :param generation: Generation at time item was read from store.
+
+    """
+    if not _is_enabled():
+        return
+
+    data = encoder.as_bytes(item)
+    with _ITEMS_LOCK:
+        # Skip items read prior to an invalidation as they may be stale.
+        if generation != _GENERATION:
+            return
+        _ITEMS[(partition, ) + key] = (time.monotonic() + EnvVars.TTL, data)
+        _ITEMS.move_to_end((partition, ) + key)
+        while len(_ITEMS) > EnvVars.MAX_SIZE:
+            _ITEMS.popitem(last=False)
+
+
+def invalidate(partition: StorePartition):
+    """Discards locally cached items & notifies other processes to do likewise.
+
+    :param partition: Cache partition whose items are to be discarded.
+
+    """
+    _clear(partition.name)
+    with stores.get_store(partition) as store:
+        store.publish(_CHANNEL, partition.name)
+
+
+def _clear(partition_name: str = None):
+    """Discards locally cached items.
+
+    """
+    global _GENERATION
+
+    with _ITEMS_LOCK:
+        _GENERATION += 1
+        if partition_name is None:
+            _ITEMS.clear()
+        else:
+            for key in [i for i in _ITEMS if i[0].name == partition_name]:
+                del _ITEMS[key]
+
+
+def _is_enabled() -> bool:
+    """Returns flag indicating whether local caching is active - i.e. invalidation notifications are being received.
+
+    """
+    if EnvVars.TTL <= 0:
+        return False
+
+    _start_listener()
+
+    return _IS_SUBSCRIBED.is_set()
+
+
+def _listen():
+    """Processes invalidation notifications - reconnecting upon broken connections.
+
+    """
+    while True:
+        try:
+            with stores.get_store(StorePartition.INFRA) as store:
+                pubsub = store.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(_CHANNEL)
+                _IS_SUBSCRIBED.set()
+                for message in pubsub.listen():
+                    _clear(message['data'].decode('utf-8'))
+        # Listener must outlive broken connections & unexpected replies.
+        except (redis.RedisError, ValueError):
+            pass
+        finally:
+            # Notifications may have been missed whilst disconnected.
+            _IS_SUBSCRIBED.clear()
+            _clear()
+        time.sleep(float(1))
+
+
+def _start_listener():
+    """Starts (once per process) a thread listening for invalidation notifications.
+
+    """
+    global _LISTENER_PID
+
+    if _LISTENER_PID == os.getpid():
+        return
+
+    with _LISTENER_LOCK:
+        # Threads do not survive a fork - items inherited from a parent process are discarded.
+        if _LISTENER_PID != os.getpid():
+            _IS_SUBSCRIBED.clear()
+            _clear()
+            threading.Thread(target=_listen, daemon=True).start()
+            _LISTENER_PID = os.getpid()
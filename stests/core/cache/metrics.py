@@ -0,0 +1,329 @@
+import bisect
+import contextlib
+import os
+import socket
+import threading
+import time
+import typing
+
+from stests.core.cache.model import StoreOperation
+from stests.core.cache.model import StorePartition
+from stests.core.utils import env
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Flag indicating whether cache operations are instrumented.
+    ENABLED = env.get_var('CACHE_METRICS', 0, int)
+
+    # Interval (in seconds) at which instrumentation is flushed to logs & cache - 0 disables flushing.
+    FLUSH_INTERVAL = env.get_var('CACHE_METRICS_FLUSH_INTERVAL', 60, int)
+
+
+# Upper bounds (in milliseconds) of latency histogram buckets - a final bucket collects slower operations.
+LATENCY_BUCKETS = (0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+# Operation name under which batched pipelines are recorded.
+OPERATION_BATCH = "BATCH"
+
+# Map: (partition name, operation name) -> operation statistics.
+_STATS: typing.Dict[typing.Tuple[str, str], dict] = dict()
+
+# Lock guarding access to operation statistics.
+_STATS_LOCK = threading.Lock()
+
+# Identifier of process within which operation statistics were accumulated.
+_STATS_PID: typing.Optional[int] = None
+
+# Timestamp of last flush.
+_FLUSHED_AT = time.monotonic()
+
+# Lock guarding flushes across threads.
+_FLUSH_LOCK = threading.Lock()
+
+# Per thread stack of measurements in progress.
+_ACTIVE = threading.local()
+
+
+class _Measurement():
+    """Accumulates instrumentation of a single cache operation.
+
+    """
+    def __init__(self):
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.codec_ms = float(0)
+        self.elapsed_ms = float(0)
+        self.retries = 0
+
+
+def is_enabled() -> bool:
+    """Returns flag indicating whether cache operations are instrumented.
+
+    """
+    return bool(EnvVars.ENABLED)
+
+
+@contextlib.contextmanager
+def measure(partition: StorePartition, operation: typing.Union[StoreOperation, str]) -> typing.Iterator[None]:
+    """Context manager recording instrumentation of a cache operation.
+
+    :param partition: Cache partition to which operation pertains.
+    :param operation: Cache operation being applied.
+
+    """
+    measurement = _Measurement()
+    failed = False
+    try:
+        with _activate(measurement):
+            yield
+    except Exception:
+        failed = True
+        raise
+    finally:
+        _record(partition, operation, measurement, failed=failed)
+
+
+def measure_iter(partition: StorePartition, operation: typing.Union[StoreOperation, str], iterator: typing.Iterator) -> typing.Iterator:
+    """Yields from a streamed cache operation recording its instrumentation - time spent by consumer is excluded.
+
+    :param partition: Cache partition to which operation pertains.
+    :param operation: Cache operation being applied.
+    :param iterator: Iterator returned by streamed operation.
+
+    """
+    measurement = _Measurement()
+    failed = False
+    try:
+        while True:
+            with _activate(measurement):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+            yield item
+    except Exception:
+        failed = True
+        raise
+    finally:
+        _record(partition, operation, measurement, failed=failed)
+
+
+def record_codec(elapsed_ms: float, bytes_read: int = 0, bytes_written: int = 0):
+    """Records payload (de)serialisation against current cache operation.
+
+    :param elapsed_ms: Time (in milliseconds) spent encoding/decoding.
+    :param bytes_read: Size of payload read from store.
+    :param bytes_written: Size of payload written to store.
+
+    """
+    measurement = _get_current()
+    if measurement is not None:
+        measurement.codec_ms += elapsed_ms
+        measurement.bytes_read += bytes_read
+        measurement.bytes_written += bytes_written
+
+
+def record_local_hit(partition: StorePartition, operation: StoreOperation):
+    """Records a cache operation served from process local cache.
+
+    :param partition: Cache partition to which operation pertains.
+    :param operation: Cache operation being applied.
+
+    """
+    with _STATS_LOCK:
+        _reset_on_fork()
+        _get_stats(partition.name, operation.name)["local_hits"] += 1
+
+
+def record_retry():
+    """Records a retry of current cache operation.
+
+    """
+    measurement = _get_current()
+    if measurement is not None:
+        measurement.retries += 1
+
+
+def get_snapshot() -> typing.Dict[str, dict]:
+    """Returns copy of instrumentation accumulated within current process.
+
+    :returns: Map: PARTITION.OPERATION -> operation statistics.
+
+    """
+    with _STATS_LOCK:
+        _reset_on_fork()
+        return {
+            f"{partition}.{operation}": dict(stats, latency_histogram=list(stats["latency_histogram"]))
+            for (partition, operation), stats in sorted(_STATS.items())
+        }
+
+
+def get_percentile(stats: dict, percentile: float) -> typing.Optional[float]:
+    """Returns upper bound of histogram bucket within which a latency percentile falls.
+
+    :param stats: Operation statistics.
+    :param percentile: Percentile to be estimated, e.g. 0.95.
+
+    :returns: Latency upper bound in milliseconds - None if within unbounded bucket.
+
+    """
+    threshold = percentile * sum(stats["latency_histogram"])
+    total = 0
+    for idx, count in enumerate(stats["latency_histogram"]):
+        total += count
+        if total and total >= threshold:
+            return LATENCY_BUCKETS[idx] if idx < len(LATENCY_BUCKETS) else None
+
+
+def merge(snapshots: typing.List[typing.Dict[str, dict]]) -> typing.Dict[str, dict]:
+    """Returns aggregate of instrumentation snapshots, e.g. as flushed by several processes.
+
+    :param snapshots: Instrumentation snapshots.
+
+    :returns: Map: PARTITION.OPERATION -> operation statistics.
+
+    """
+    result = dict()
+    for snapshot in snapshots:
+        for key, stats in snapshot.items():
+            try:
+                aggregate = result[key]
+            except KeyError:
+                result[key] = dict(stats, latency_histogram=list(stats["latency_histogram"]))
+            else:
+                for field, value in stats.items():
+                    if field == "latency_histogram":
+                        aggregate[field] = [i + j for i, j in zip(aggregate[field], value)]
+                    elif field == "latency_max_ms":
+                        aggregate[field] = max(aggregate[field], value)
+                    else:
+                        aggregate[field] += value
+
+    return dict(sorted(result.items()))
+
+
+def flush():
+    """Writes instrumentation accumulated within current process to logs & cache.
+
+    """
+    global _FLUSHED_AT
+
+    # Deferred imports as cache operations are themselves instrumented.
+    from stests.core.cache.ops import monitoring
+    from stests.core.logging import log_event
+    from stests.events import EventType
+
+    _FLUSHED_AT = time.monotonic()
+    snapshot = get_snapshot()
+    if not snapshot:
+        return
+
+    calls = sum(i["calls"] for i in snapshot.values())
+    latency = sum(i["latency_total_ms"] for i in snapshot.values())
+    log_event(
+        EventType.CORE_CACHE_METRICS,
+        f"ops={calls} :: latency={format(latency, '.0f')}ms",
+        snapshot,
+        )
+    monitoring.set_cache_metrics(f"{socket.gethostname()}:{os.getpid()}", snapshot)
+
+
+@contextlib.contextmanager
+def _activate(measurement: _Measurement) -> typing.Iterator[None]:
+    """Context manager attributing instrumentation recorded by current thread to a measurement.
+
+    """
+    try:
+        stack = _ACTIVE.stack
+    except AttributeError:
+        stack = _ACTIVE.stack = []
+    stack.append(measurement)
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        measurement.elapsed_ms += (time.perf_counter() - started_at) * 1000
+        stack.pop()
+
+
+def _get_current() -> typing.Optional[_Measurement]:
+    """Returns measurement in progress within current thread.
+
+    """
+    try:
+        return _ACTIVE.stack[-1]
+    except (AttributeError, IndexError):
+        return None
+
+
+def _get_stats(partition_name: str, operation_name: str) -> dict:
+    """Returns (initialising if necessary) statistics of an operation - assumes lock is held.
+
+    """
+    try:
+        return _STATS[(partition_name, operation_name)]
+    except KeyError:
+        _STATS[(partition_name, operation_name)] = {
+            "bytes_read": 0,
+            "bytes_written": 0,
+            "calls": 0,
+            "codec_ms": float(0),
+            "errors": 0,
+            "latency_histogram": [0] * (len(LATENCY_BUCKETS) + 1),
+            "latency_max_ms": float(0),
+            "latency_total_ms": float(0),
+            "local_hits": 0,
+            "retries": 0,
+        }
+        return _STATS[(partition_name, operation_name)]
+
+
+def _record(partition: StorePartition, operation: typing.Union[StoreOperation, str], measurement: _Measurement, failed: bool):
+    """Folds a completed measurement into operation statistics.
+
+    """
+    operation_name = operation if isinstance(operation, str) else operation.name
+    with _STATS_LOCK:
+        _reset_on_fork()
+        stats = _get_stats(partition.name, operation_name)
+        stats["bytes_read"] += measurement.bytes_read
+        stats["bytes_written"] += measurement.bytes_written
+        stats["calls"] += 1
+        stats["codec_ms"] += measurement.codec_ms
+        stats["errors"] += int(failed)
+        stats["latency_histogram"][bisect.bisect_left(LATENCY_BUCKETS, measurement.elapsed_ms)] += 1
+        stats["latency_max_ms"] = max(stats["latency_max_ms"], measurement.elapsed_ms)
+        stats["latency_total_ms"] += measurement.elapsed_ms
+        stats["retries"] += measurement.retries
+
+    _flush_if_due()
+
+
+def _flush_if_due():
+    """Flushes instrumentation if flush interval has elapsed - flushing is skipped if already underway.
+
+    """
+    if EnvVars.FLUSH_INTERVAL <= 0 or time.monotonic() - _FLUSHED_AT < EnvVars.FLUSH_INTERVAL:
+        return
+
+    if _FLUSH_LOCK.acquire(blocking=False):
+        try:
+            flush()
+        # Instrumentation must not disrupt the cache operation being measured.
+        except Exception:
+            pass
+        finally:
+            _FLUSH_LOCK.release()
+
+
+def _reset_on_fork():
+    """Discards statistics inherited from a parent process - assumes lock is held.
+
+    """
+    global _STATS_PID
+
+    if _STATS_PID != os.getpid():
+        _STATS.clear()
+        _STATS_PID = os.getpid()
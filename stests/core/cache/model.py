@@ -1,10 +1,12 @@
 import enum
-import json
+import hashlib
 import os
 import pwd
+import time
 import typing
 
 from stests.core.utils import encoder
+from stests.core.utils import histogram
 
 
 
@@ -12,6 +14,22 @@ from stests.core.utils import encoder
 _OS_USER = pwd.getpwuid(os.getuid())[0]
 
 
+def get_run_scope(network: str, run_type: str, label_run_index: str) -> str:
+    """Returns key path segment scoping keys to a run.
+
+    The segment is a hash tag, i.e. when clustered all keys of a run map to a single slot,
+    thus run scoped multi-key operations (pipelines, scripts, deletes) remain valid.
+
+    :param network: Network name (or pattern).
+    :param run_type: Run type (or pattern).
+    :param label_run_index: Run index label (or pattern).
+
+    :returns: Key path segment.
+
+    """
+    return f"{{{network}:{run_type}:{label_run_index}}}"
+
+
 class ItemKey():
     """A key of an encached item.
     
@@ -21,8 +39,8 @@ class ItemKey():
         name = ".".join([str(i) for i in names])
         self.key = f"{path}:{name}"
     
-    def apply_key_prefix(self):
-        self.key = f"{_OS_USER}:{self.key}"
+    def apply_key_prefix(self, prefix: str = _OS_USER):
+        self.key = f"{prefix}:{self.key}"
 
 
 class Item():
@@ -35,11 +53,93 @@ class Item():
         self.expiration = expiration
 
     @property
-    def data_as_json(self):
-        return json.dumps(encoder.encode(self.data), indent=4)
+    def data_as_bytes(self):
+        return encoder.as_bytes(self.data)
+
+    def apply_key_prefix(self, prefix: str = _OS_USER):
+        self.key = f"{prefix}:{self.key}"
+
+
+class BucketedSetMember():
+    """A member to be added to a time bucketed set, i.e. a set per time bucket whereby each bucket expires as a whole.
+    Members are deduped across all retained buckets.
+    
+    """
+    def __init__(self, paths: typing.List[str], names: typing.List[str], retention: int, bucket_duration: int):
+        # Buckets share a hash tag, i.e. when clustered a set's buckets map to a single slot.
+        path = ":".join([str(i) for i in paths])
+        bucket = int(time.time()) // bucket_duration
+        bucket_count = -(-retention // bucket_duration)
+        self.keys = [f"{{{path}}}:{bucket - i}" for i in range(bucket_count + 1)]
+
+        # Members are digested so that set entries are of fixed (small) size.
+        name = ".".join([str(i) for i in names])
+        self.member = hashlib.blake2b(name.encode("utf-8"), digest_size=8).digest()
+
+        # Buckets expire once no longer retained.
+        self.expiration = (bucket_count + 1) * bucket_duration
+
+    @property
+    def key(self):
+        return self.keys[0]
+
+    def apply_key_prefix(self, prefix: str = _OS_USER):
+        self.keys = [f"{prefix}:{i}" for i in self.keys]
+
+
+class HashFieldItem(Item):
+    """An item to be encached as a field of a hash, i.e. a collection read back as a whole & expiring as a whole.
+    
+    """
+    def __init__(self, item_key: ItemKey, field: str, data: typing.Any, expiration: int = None):
+        super().__init__(item_key, data, expiration)
+        self.field = field
+
+
+class HistogramSample():
+    """A sample to be recorded within a mergeable histogram encached as a hash.
+    
+    """
+    def __init__(
+        self,
+        item_key: ItemKey,
+        value: float,
+        started_at: float,
+        ended_at: float,
+        labels: typing.Dict[str, str] = None,
+        expiration: int = None,
+        ):
+        self.key = item_key.key
+        self.bucket_field = histogram.get_bucket_field(value)
+        self.expiration = expiration
+        self.value = value
+        self.started_at = started_at
+        self.ended_at = ended_at
+        self.labels = labels or dict()
+
+    @property
+    def label_fields(self) -> typing.List[str]:
+        """Flattened (hash field, value) pairs of sample labels."""
+        return [j for k, v in self.labels.items() for j in (histogram.get_label_field(k), v)]
+
+    def apply_key_prefix(self, prefix: str = _OS_USER):
+        self.key = f"{prefix}:{self.key}"
+
+
+class IndexedItem(Item):
+    """An item to be encached alongside it's key plus a secondary index entry pointing to it.
+    Index entry keys are recorded within an index set so that they can be deleted without scanning.
+    
+    """
+    def __init__(self, item_key: ItemKey, index_key: ItemKey, index_set_key: ItemKey, data: typing.Any, expiration: int = None):
+        super().__init__(item_key, data, expiration)
+        self.index_key = index_key.key
+        self.index_set_key = index_set_key.key
 
-    def apply_key_prefix(self):
-        self.key = f"{_OS_USER}:{self.key}"
+    def apply_key_prefix(self, prefix: str = _OS_USER):
+        super().apply_key_prefix(prefix)
+        self.index_key = f"{prefix}:{self.index_key}"
+        self.index_set_key = f"{prefix}:{self.index_set_key}"
 
 
 class CountDecrementKey(ItemKey):
@@ -60,6 +160,53 @@ class CountIncrementKey(ItemKey):
         self.amount = amount
         
 
+class CountIncrementKeySet():
+    """A set of keys used to atomically increment counters.
+    
+    """
+    def __init__(self, keys: typing.List[CountIncrementKey]):
+        self.keys = keys
+
+    @property
+    def key(self):
+        return self.keys[0].key
+
+    def apply_key_prefix(self, prefix: str = _OS_USER):
+        for i in self.keys:
+            i.apply_key_prefix(prefix)
+
+
+class LockedItemSet():
+    """A lock to be encached alongside a set of items that are encached only if the lock is acquired.
+    
+    """
+    def __init__(self, lock: Item, items: typing.List[Item]):
+        self.lock = lock
+        self.items = items
+
+    @property
+    def key(self):
+        return self.lock.key
+
+    def apply_key_prefix(self, prefix: str = _OS_USER):
+        self.lock.apply_key_prefix(prefix)
+        for i in self.items:
+            i.apply_key_prefix(prefix)
+
+
+class RingBufferItem(Item):
+    """A set of entries to be appended to a bounded list, i.e. a ring buffer, whereby oldest entries are evicted once full.
+    
+    """
+    def __init__(self, item_key: ItemKey, data: typing.List[typing.Any], max_length: int, expiration: int = None):
+        super().__init__(item_key, data, expiration)
+        self.max_length = max_length
+
+    @property
+    def entries_as_bytes(self):
+        return [encoder.as_bytes(i) for i in self.data]
+
+
 class SearchKey():
     """A key used to perform a cache search.
     
@@ -68,8 +215,8 @@ class SearchKey():
         path = ':'.join([str(i) for i in paths])
         self.key = f"{path}{wildcard}"
 
-    def apply_key_prefix(self):
-        self.key = f"{_OS_USER}:{self.key}"
+    def apply_key_prefix(self, prefix: str = _OS_USER):
+        self.key = f"{prefix}:{self.key}"
 
 
 class StoreOperation(enum.Enum):
@@ -82,11 +229,20 @@ class StoreOperation(enum.Enum):
     # Atomically decrement a counter.
     COUNTER_DECR = enum.auto()
 
+    # Atomically increment a set of counters.
+    COUNTER_INCR_MANY = enum.auto()
+
     # Delete a key.
     DELETE_ONE = enum.auto()
 
+    # Delete a lease if held by caller, i.e. cached item is identical - atomically.
+    DELETE_LEASE = enum.auto()
+
     # Flush a key set.
     DELETE_MANY = enum.auto()
+
+    # Flush secondary index entries recorded within an index set plus the set itself.
+    DELETE_INDEX_SET = enum.auto()
     
     # Get count of matched cache item.
     GET_COUNT = enum.auto()
@@ -103,15 +259,51 @@ class StoreOperation(enum.Enum):
     # Get a single cached item from a collection.
     GET_ONE_FROM_MANY = enum.auto()
 
+    # Get a single cached item via a secondary index.
+    GET_ONE_BY_INDEX = enum.auto()
+
+    # Get values of all fields of a cached hash.
+    GET_HASH = enum.auto()
+
+    # Get a collection of cached histograms.
+    GET_HISTOGRAMS = enum.auto()
+
+    # Get entries of a ring buffer - oldest first.
+    GET_RING = enum.auto()
+
     # Get a collection of cached items.
     GET_MANY = enum.auto()
 
+    # Set a field of a hash - resetting expiration of hash as a whole.
+    HASH_SET = enum.auto()
+
+    # Record a sample within a histogram - atomically.
+    HISTOGRAM_RECORD = enum.auto()
+
+    # Stream a collection of cached items page by page.
+    ITER_MANY = enum.auto()
+
+    # Append entries to a ring buffer - evicting oldest entries once full.
+    RING_PUSH = enum.auto()
+
+    # Set a lease if not already cached or if held by caller, i.e. acquire or renew - atomically.
+    SET_LEASE = enum.auto()
+
+    # Add a member to a time bucketed set unless already a member of a retained bucket.
+    SET_ADD_BUCKETED = enum.auto()
+
     # Set an item.
     SET_ONE = enum.auto()
 
+    # Set an item plus a secondary index entry pointing to it.
+    SET_ONE_INDEXED = enum.auto()
+
     # Set cached item plus flag indicating whether it already was cached.
     SET_ONE_SINGLETON = enum.auto()
 
+    # Set an item if not already cached plus, upon doing so, a set of further items - atomically.
+    SET_ONE_SINGLETON_WITH_ITEMS = enum.auto()
+
 
 class StorePartition(enum.Enum):
     """Enumeration over set of types of store partition.
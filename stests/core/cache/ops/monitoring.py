@@ -1,8 +1,15 @@
+import typing
+
+from stests.core.cache.model import BucketedSetMember
+from stests.core.cache.model import HashFieldItem
 from stests.core.cache.model import Item
 from stests.core.cache.model import ItemKey
+from stests.core.cache.model import RingBufferItem
 from stests.core.cache.model import StoreOperation
+from stests.core.cache.model import SearchKey
 from stests.core.cache.model import StorePartition
 from stests.core.cache.ops.utils import cache_op
+from stests.core.types.infra import Node
 from stests.core.types.infra import NodeEventInfo
 from stests.core.types.infra import NodeMonitoringLock
 from stests.events import EventType
@@ -11,14 +18,59 @@ from stests.events import EventType
 
 # Cache collections.
 COL_BLOCK = "block"
+COL_BLOCK_SUMMARY = "block-summary"
+COL_CACHE_METRICS = "cache-metrics"
 COL_DEPLOY = "deploy"
+COL_DEPLOY_PROCESSED = "deploy-processed"
 COL_EVENT = "event"
+COL_NODE_EVENT_CHECKPOINT = "node-event-checkpoint"
 COL_NODE_LOCK = "node-lock"
+COL_NODE_MONITOR_LEASE = "node-monitor-lease"
+COL_NODE_METRIC = "node-metric"
+COL_NODE_METRICS_SAMPLER_LOCK = "node-metrics-sampler-lock"
+COL_MONITOR_SHARD_LEASE = "monitor-shard-lease"
 
 # Cache collection item expiration times.
 EXPIRATION_COL_BLOCK = 300
+EXPIRATION_COL_BLOCK_SUMMARY = 300
+EXPIRATION_COL_CACHE_METRICS = 86400
 EXPIRATION_COL_DEPLOY = 300
+EXPIRATION_COL_DEPLOY_PROCESSED = 300
 EXPIRATION_COL_EVENT = 300
+EXPIRATION_COL_NODE_EVENT_CHECKPOINT = 3600
+EXPIRATION_COL_NODE_METRICS_SAMPLER_LOCK = 3900
+
+# Time (in seconds) spanned by each bucket of a dedupe set.
+DEDUPE_BUCKET_DURATION = 60
+
+
+@cache_op(StorePartition.MONITORING_LOCKS, StoreOperation.DELETE_LEASE)
+def delete_monitor_shard_lease(network: str, shard_index: int, token: str) -> Item:
+    """Deletes a monitor shard's membership lease if held by caller.
+
+    :param network: Name of network being monitored.
+    :param shard_index: Index of monitor shard.
+    :param token: Token identifying lease holder.
+
+    :returns: Lease to be deleted.
+    
+    """
+    return _get_monitor_shard_lease(network, shard_index, token, None)
+
+
+@cache_op(StorePartition.MONITORING_LOCKS, StoreOperation.DELETE_LEASE)
+def delete_node_monitor_lease(network: str, node_index: int, shard_index: int, token: str) -> Item:
+    """Deletes a lease over a node's monitor if held by caller.
+
+    :param network: Name of network being monitored.
+    :param node_index: Index of node being monitored.
+    :param shard_index: Index of monitor shard holding lease.
+    :param token: Token identifying lease holder.
+
+    :returns: Lease to be deleted.
+    
+    """
+    return _get_node_monitor_lease(network, node_index, shard_index, token, None)
 
 
 @cache_op(StorePartition.MONITORING_LOCKS, StoreOperation.DELETE_ONE)
@@ -42,69 +94,337 @@ def delete_node_monitor_lock(lock: NodeMonitoringLock) -> ItemKey:
     )
 
 
-@cache_op(StorePartition.MONITORING, StoreOperation.SET_ONE_SINGLETON)
-def set_block(info: NodeEventInfo) -> Item:
-    """Encaches an item.
+@cache_op(StorePartition.MONITORING_LOCKS, StoreOperation.DELETE_ONE)
+def delete_node_metrics_sampler_lock(network: str) -> ItemKey:
+    """Deletes a lock over a network's node metrics sampler.
+
+    :param network: Name of network being sampled.
+
+    :returns: Key of locked item.
+    
+    """
+    return ItemKey(
+        paths=[
+            network,
+        ],
+        names=[
+            COL_NODE_METRICS_SAMPLER_LOCK,
+        ],
+    )
+
+
+@cache_op(StorePartition.MONITORING, StoreOperation.GET_ONE)
+def get_block_summary(network: str, block_hash: str) -> ItemKey:
+    """Decaches domain object: summary of an added block.
+    
+    :param network: Name of network being monitored.
+    :param block_hash: Hash of added block.
+
+    :returns: Key of item to be decached.
+
+    """
+    return ItemKey(
+        paths=[
+            network,
+            COL_BLOCK_SUMMARY,
+        ],
+        names=[
+            block_hash,
+        ],
+    )
+
+
+@cache_op(StorePartition.MONITORING, StoreOperation.GET_MANY)
+def get_cache_metrics() -> SearchKey:
+    """Decaches cache operation instrumentation flushed by processes.
+
+    :returns: Cache search key.
+
+    """
+    return SearchKey(
+        paths=[
+            COL_CACHE_METRICS,
+        ]
+    )
+
+
+@cache_op(StorePartition.MONITORING, StoreOperation.GET_HASH)
+def get_deploys_processed(network: str, block_hash: str) -> ItemKey:
+    """Decaches domain objects: summaries of deploys processed within a block.
+    
+    :param network: Name of network being monitored.
+    :param block_hash: Hash of block within which deploys were processed.
+
+    :returns: Key of hash to be decached.
+
+    """
+    return ItemKey(
+        paths=[
+            network,
+            COL_DEPLOY_PROCESSED,
+        ],
+        names=[
+            block_hash,
+        ],
+    )
+
+
+@cache_op(StorePartition.MONITORING_LOCKS, StoreOperation.GET_MANY)
+def get_monitor_shard_leases(network: str) -> SearchKey:
+    """Decaches membership leases of a network's live monitor shards.
+
+    :param network: Name of network being monitored.
+
+    :returns: Key of items to be decached.
+
+    """
+    return SearchKey(
+        paths=[
+            network,
+            COL_MONITOR_SHARD_LEASE,
+        ],
+    )
+
+
+@cache_op(StorePartition.MONITORING, StoreOperation.GET_ONE)
+def get_node_event_checkpoint(node: Node) -> ItemKey:
+    """Decaches identifier of last event processed from a node's event stream.
+
+    :param node: Node being monitored.
+
+    :returns: Key of cached item.
+
+    """
+    return ItemKey(
+        paths=[
+            node.network,
+            COL_NODE_EVENT_CHECKPOINT,
+        ],
+        names=[
+            node.label_index,
+        ],
+    )
+
+
+@cache_op(StorePartition.MONITORING, StoreOperation.GET_RING)
+def get_node_metric_samples(network: str, node_index: int, series: str) -> ItemKey:
+    """Decaches time series of samples of a node metric.
+
+    :param network: Name of network being monitored.
+    :param node_index: Index of node being sampled.
+    :param series: Metric series identifier, i.e. metric name plus labels.
+
+    :returns: Key of cached ring buffer.
+
+    """
+    return ItemKey(
+        paths=[
+            network,
+            COL_NODE_METRIC,
+            f"N-{str(node_index).zfill(4)}",
+        ],
+        names=[
+            series,
+        ],
+    )
+
+
+@cache_op(StorePartition.MONITORING, StoreOperation.SET_ADD_BUCKETED)
+def set_block(info: NodeEventInfo) -> BucketedSetMember:
+    """Encaches a processed block's hash - returns flag indicating whether block was not already processed.
     
     :param info: Node event information.
 
+    :returns: Member to be cached.
+
+    """
+    return BucketedSetMember(
+        paths=[
+            info.network,
+            COL_BLOCK,
+        ],
+        names=[
+            info.block_hash,
+        ],
+        retention=EXPIRATION_COL_BLOCK,
+        bucket_duration=DEDUPE_BUCKET_DURATION,
+    )
+
+
+@cache_op(StorePartition.MONITORING, StoreOperation.SET_ONE)
+def set_block_summary(network: str, summary: dict) -> Item:
+    """Encaches summary of an added block so that processed deploys can be correlated without querying chain.
+    
+    :param network: Name of network being monitored.
+    :param summary: Block summary: block_hash, era_id, height, state_root_hash, timestamp.
+
     :returns: Item to be cached.
 
     """
     return Item(
         item_key=ItemKey(
             paths=[
-                info.network,
-                COL_BLOCK,
+                network,
+                COL_BLOCK_SUMMARY,
             ],
             names=[
-                info.block_hash,
+                summary["block_hash"],
             ],
         ),
-        data={
-            "block_hash": info.block_hash,
-            "network": info.network,
-        },
-        expiration=EXPIRATION_COL_BLOCK
+        data=summary,
+        expiration=EXPIRATION_COL_BLOCK_SUMMARY
     )
 
 
-@cache_op(StorePartition.MONITORING, StoreOperation.SET_ONE_SINGLETON)
-def set_deploy(network: str, block_hash: str, deploy_hash: str) -> Item:
-    """Encaches an item.
+@cache_op(StorePartition.MONITORING, StoreOperation.SET_ONE)
+def set_cache_metrics(process_id: str, snapshot: dict) -> Item:
+    """Encaches cache operation instrumentation accumulated by a process.
     
-    :param summary: Deploy summary instance to be cached.
+    :param process_id: Identifier of process, i.e. host:pid.
+    :param snapshot: Instrumentation snapshot.
 
     :returns: Item to be cached.
 
     """
     return Item(
+        item_key=ItemKey(
+            paths=[
+                COL_CACHE_METRICS,
+            ],
+            names=[
+                process_id,
+            ],
+        ),
+        data=snapshot,
+        expiration=EXPIRATION_COL_CACHE_METRICS
+    )
+
+
+@cache_op(StorePartition.MONITORING, StoreOperation.SET_ADD_BUCKETED)
+def set_deploy(network: str, block_hash: str, deploy_hash: str) -> BucketedSetMember:
+    """Encaches a processed deploy's hash - returns flag indicating whether deploy was not already processed.
+    
+    :param network: Name of network being monitored.
+    :param block_hash: Hash of block within which deploy was processed.
+    :param deploy_hash: Hash of processed deploy.
+
+    :returns: Member to be cached.
+
+    """
+    return BucketedSetMember(
+        paths=[
+            network,
+            COL_DEPLOY,
+        ],
+        names=[
+            block_hash,
+            deploy_hash,
+        ],
+        retention=EXPIRATION_COL_DEPLOY,
+        bucket_duration=DEDUPE_BUCKET_DURATION,
+    )
+
+
+@cache_op(StorePartition.MONITORING, StoreOperation.HASH_SET)
+def set_deploy_processed(network: str, summary: dict) -> HashFieldItem:
+    """Encaches summary of a processed deploy pending arrival of it's block summary - summaries are hashed per block.
+    
+    :param network: Name of network being monitored.
+    :param summary: Processed deploy summary: block_hash, deploy_hash, deploy_cost, node_index.
+
+    :returns: Item to be cached.
+
+    """
+    return HashFieldItem(
         item_key=ItemKey(
             paths=[
                 network,
-                COL_DEPLOY,
+                COL_DEPLOY_PROCESSED,
+            ],
+            names=[
+                summary["block_hash"],
+            ],
+        ),
+        field=summary["deploy_hash"],
+        data=summary,
+        expiration=EXPIRATION_COL_DEPLOY_PROCESSED
+    )
+
+
+@cache_op(StorePartition.MONITORING, StoreOperation.SET_ONE)
+def set_node_event_checkpoint(node: Node, event_id: int) -> Item:
+    """Encaches identifier of last event processed from a node's event stream.
+    
+    :param node: Node being monitored.
+    :param event_id: Identifier of last processed event.
+
+    :returns: Item to be cached.
+
+    """
+    return Item(
+        item_key=ItemKey(
+            paths=[
+                node.network,
+                COL_NODE_EVENT_CHECKPOINT,
             ],
             names=[
-                block_hash,
-                deploy_hash,
+                node.label_index,
             ],
         ),
         data={
-            "block_hash": block_hash,
-            "deploy_hash": deploy_hash,
-            "network": network,
+            "event_id": event_id,
+            "network": node.network,
+            "node_index": node.index,
         },
-        expiration=EXPIRATION_COL_DEPLOY
+        expiration=EXPIRATION_COL_NODE_EVENT_CHECKPOINT
     )
 
 
-@cache_op(StorePartition.MONITORING, StoreOperation.SET_ONE_SINGLETON)
-def set_node_event_info(info: NodeEventInfo) -> Item:
-    """Encaches an item.
+@cache_op(StorePartition.MONITORING, StoreOperation.RING_PUSH)
+def set_node_metric_samples(
+    network: str,
+    node_index: int,
+    series: str,
+    samples: typing.List[typing.Tuple[float, float]],
+    max_length: int,
+    expiration: int,
+    ) -> RingBufferItem:
+    """Encaches samples of a node metric within a bounded time series.
+    
+    :param network: Name of network being monitored.
+    :param node_index: Index of node being sampled.
+    :param series: Metric series identifier, i.e. metric name plus labels.
+    :param samples: Samples to be appended: (timestamp, value).
+    :param max_length: Maximum number of samples retained.
+    :param expiration: Time (in seconds) after which series expires unless further samples are appended.
+
+    :returns: Ring buffer entries to be cached.
+
+    """
+    return RingBufferItem(
+        item_key=ItemKey(
+            paths=[
+                network,
+                COL_NODE_METRIC,
+                f"N-{str(node_index).zfill(4)}",
+            ],
+            names=[
+                series,
+            ],
+        ),
+        data=samples,
+        max_length=max_length,
+        expiration=expiration,
+    )
+
+
+@cache_op(StorePartition.MONITORING, StoreOperation.SET_ADD_BUCKETED)
+def set_node_event_info(info: NodeEventInfo) -> BucketedSetMember:
+    """Encaches a node event's identity - returns flag indicating whether event was not already processed.
     
     :param info: Node event information.
 
-    :returns: Item to be cached.
+    :returns: Member to be cached.
 
     """
     if info.event_type in (
@@ -121,19 +441,77 @@ def set_node_event_info(info: NodeEventInfo) -> Item:
             info.deploy_hash,
         ]
     else:
-        names=[]
+        # Events lacking a chain identity are deduped per node stream.
+        names = [
+            info.node_index,
+            info.event_id,
+        ]
+
+    return BucketedSetMember(
+        paths=[
+            info.network,
+            COL_EVENT,
+            info.event_type.name[6:],
+        ],
+        names=names,
+        retention=EXPIRATION_COL_EVENT,
+        bucket_duration=DEDUPE_BUCKET_DURATION,
+    )
 
+
+@cache_op(StorePartition.MONITORING_LOCKS, StoreOperation.SET_LEASE)
+def set_monitor_shard_lease(network: str, shard_index: int, token: str, expiration: int) -> Item:
+    """Acquires or renews a monitor shard's membership lease.
+
+    :param network: Name of network being monitored.
+    :param shard_index: Index of monitor shard.
+    :param token: Token identifying lease holder.
+    :param expiration: Time (in seconds) after which lease expires unless renewed.
+
+    :returns: Lease to be cached.
+
+    """
+    return _get_monitor_shard_lease(network, shard_index, token, expiration)
+
+
+@cache_op(StorePartition.MONITORING_LOCKS, StoreOperation.SET_LEASE)
+def set_node_monitor_lease(network: str, node_index: int, shard_index: int, token: str, expiration: int) -> Item:
+    """Acquires or renews a lease over a node's monitor.
+
+    :param network: Name of network being monitored.
+    :param node_index: Index of node being monitored.
+    :param shard_index: Index of monitor shard acquiring lease.
+    :param token: Token identifying lease holder.
+    :param expiration: Time (in seconds) after which lease expires unless renewed.
+
+    :returns: Lease to be cached.
+
+    """
+    return _get_node_monitor_lease(network, node_index, shard_index, token, expiration)
+
+
+@cache_op(StorePartition.MONITORING_LOCKS, StoreOperation.SET_ONE_SINGLETON)
+def set_node_metrics_sampler_lock(network: str) -> Item:
+    """Encaches a lock over a network's node metrics sampler - expires so as to outlive an abruptly terminated sampler.
+    
+    :param network: Name of network being sampled.
+
+    :returns: Item to be cached.
+
+    """
     return Item(
         item_key=ItemKey(
             paths=[
-                info.network,
-                COL_EVENT,
-                info.event_type.name[6:],
+                network,
+            ],
+            names=[
+                COL_NODE_METRICS_SAMPLER_LOCK,
             ],
-            names=names,
         ),
-        data=info,
-        expiration=EXPIRATION_COL_EVENT
+        data={
+            "network": network,
+        },
+        expiration=EXPIRATION_COL_NODE_METRICS_SAMPLER_LOCK
     )
 
 
@@ -159,3 +537,50 @@ def set_node_monitor_lock(lock: NodeMonitoringLock) -> Item:
         ),
         data=lock
     )
+
+
+def _get_monitor_shard_lease(network: str, shard_index: int, token: str, expiration: typing.Optional[int]) -> Item:
+    """Returns a monitor shard's membership lease.
+
+    """
+    return Item(
+        item_key=ItemKey(
+            paths=[
+                network,
+                COL_MONITOR_SHARD_LEASE,
+            ],
+            names=[
+                f"S-{str(shard_index).zfill(4)}",
+            ],
+        ),
+        data={
+            "network": network,
+            "shard_index": shard_index,
+            "token": token,
+        },
+        expiration=expiration
+    )
+
+
+def _get_node_monitor_lease(network: str, node_index: int, shard_index: int, token: str, expiration: typing.Optional[int]) -> Item:
+    """Returns a lease over a node's monitor.
+
+    """
+    return Item(
+        item_key=ItemKey(
+            paths=[
+                network,
+                COL_NODE_MONITOR_LEASE,
+            ],
+            names=[
+                f"N-{str(node_index).zfill(4)}",
+            ],
+        ),
+        data={
+            "network": network,
+            "node_index": node_index,
+            "shard_index": shard_index,
+            "token": token,
+        },
+        expiration=expiration
+    )
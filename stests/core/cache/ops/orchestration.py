@@ -3,28 +3,41 @@ import typing
 
 from stests.core import factory
 from stests.core.cache.model import CountIncrementKey
+from stests.core.cache.model import get_run_scope
+from stests.core.cache.model import CountIncrementKeySet
+from stests.core.cache.model import HistogramSample
 from stests.core.cache.model import Item
 from stests.core.cache.model import ItemKey
+from stests.core.cache.model import LockedItemSet
 from stests.core.cache.model import SearchKey
 from stests.core.cache.model import StoreOperation
 from stests.core.cache.model import StorePartition
 from stests.core.cache.ops.utils import cache_op
+from stests.core.types.chain import Deploy
 from stests.core.types.infra import NetworkIdentifier
 from stests.core.types.orchestration import ExecutionAspect
 from stests.core.types.orchestration import ExecutionContext
 from stests.core.types.orchestration import ExecutionInfo
 from stests.core.types.orchestration import ExecutionLock
 from stests.core.types.orchestration import ExecutionStatus
+from stests.core.utils import env
 import stests.core.cache.ops.infra as infra
 
 
 
+# Environment variables required by this module.
+class EnvVars:
+    # Time (in seconds) for which a step's finalization time histogram is retained after it's last sample.
+    FINALIZATION_HISTOGRAM_RETENTION = env.get_var('CACHE_FINALIZATION_HISTOGRAM_RETENTION', 604800, int)
+
+
 # Cache partition.
 _PARTITION = StorePartition.ORCHESTRATION
 
 # Cache collections.
 COL_CONTEXT = "context"
 COL_DEPLOY_COUNT = "deploy-count"
+COL_FINALIZATION_HISTOGRAM = "finalization-histogram"
 COL_GENERATOR_RUN_COUNT = "generator-run-count"
 COL_INFO = "info"
 COL_LOCK = "lock"
@@ -45,9 +58,7 @@ def delete_locks(ctx: ExecutionContext) -> SearchKey:
     """
     return SearchKey(
         paths=[
-            ctx.network,
-            ctx.run_type,
-            ctx.label_run_index,
+            get_run_scope(ctx.network, ctx.run_type, ctx.label_run_index),
             COL_LOCK,
         ]
     )
@@ -74,9 +85,7 @@ def _delete_on_run_completion_1(ctx: ExecutionContext) -> SearchKey:
     """
     return SearchKey(
         paths=[
-            ctx.network,
-            ctx.run_type,
-            ctx.label_run_index,
+            get_run_scope(ctx.network, ctx.run_type, ctx.label_run_index),
             COL_DEPLOY_COUNT,
             "P-"
         ]
@@ -93,9 +102,7 @@ def _delete_on_run_completion_2(ctx: ExecutionContext) -> SearchKey:
     """
     return SearchKey(
         paths=[
-            ctx.network,
-            ctx.run_type,
-            ctx.label_run_index,
+            get_run_scope(ctx.network, ctx.run_type, ctx.label_run_index),
             COL_INFO,
             "P-"
         ]
@@ -115,9 +122,7 @@ def get_context(network: str, run_index: int, run_type: str) -> ItemKey:
     """
     return ItemKey(
         paths=[
-            network,
-            run_type,
-            f"R-{str(run_index).zfill(3)}",
+            get_run_scope(network, run_type, f"R-{str(run_index).zfill(3)}"),
         ],
         names=[
             COL_CONTEXT,
@@ -137,9 +142,25 @@ def get_context_list(network_id: NetworkIdentifier, run_type: str) -> SearchKey:
     """
     return SearchKey(
         paths=[
-            network_id.name,
-            "WG-*" if run_type is None else run_type,
-            "R-*",
+            get_run_scope(network_id.name, "WG-*" if run_type is None else run_type, "R-*"),
+            COL_CONTEXT,
+        ]
+    )
+
+
+@cache_op(_PARTITION, StoreOperation.ITER_MANY)
+def iter_context_list(network_id: NetworkIdentifier, run_type: str) -> SearchKey:
+    """Decaches domain object: ExecutionContext - streamed so as to bound memory usage.
+    
+    :param network_id: Identifier of network being tested.
+    :param run_type: Generator run type, e.g. wg-100.
+
+    :returns: Cached run context information.
+
+    """
+    return SearchKey(
+        paths=[
+            get_run_scope(network_id.name, "WG-*" if run_type is None else run_type, "R-*"),
             COL_CONTEXT,
         ]
     )
@@ -164,9 +185,7 @@ def get_deploy_count(ctx: ExecutionContext, aspect: ExecutionAspect) -> ItemKey:
 
     return ItemKey(
         paths=[
-            ctx.network,
-            ctx.run_type,
-            ctx.label_run_index,
+            get_run_scope(ctx.network, ctx.run_type, ctx.label_run_index),
             COL_DEPLOY_COUNT,
         ],
         names=names,
@@ -187,9 +206,7 @@ def get_deploy_count_list(network_id: NetworkIdentifier, run_type: str = None, r
     if run_type is None:
         return SearchKey(
             paths=[
-                network_id.name,
-                "*",
-                "*",
+                get_run_scope(network_id.name, "*", "*"),
                 COL_DEPLOY_COUNT,
                 "-",                
             ],
@@ -198,9 +215,7 @@ def get_deploy_count_list(network_id: NetworkIdentifier, run_type: str = None, r
     elif run_index:
         return SearchKey(
             paths=[
-                network_id.name,
-                run_type,
-                f"R-{str(run_index).zfill(3)}",
+                get_run_scope(network_id.name, run_type, f"R-{str(run_index).zfill(3)}"),
                 COL_DEPLOY_COUNT,
             ]
         )
@@ -208,14 +223,31 @@ def get_deploy_count_list(network_id: NetworkIdentifier, run_type: str = None, r
     else:
         return SearchKey(
             paths=[
-                network_id.name,
-                run_type,
-                "*",
+                get_run_scope(network_id.name, run_type, "*"),
                 COL_DEPLOY_COUNT,
             ]
         )
 
 
+@cache_op(_PARTITION, StoreOperation.GET_HISTOGRAMS)
+def get_finalization_histograms(network_id: NetworkIdentifier, run_type: str, run_index: int) -> SearchKey:
+    """Decaches per step histograms of a run's deploy finalization times - labelled by phase & step.
+
+    :param network_id: A network identifier.
+    :param run_type: Type of run.
+    :param run_index: Index of run.
+
+    :returns: Cache search key.
+
+    """
+    return SearchKey(
+        paths=[
+            get_run_scope(network_id.name, run_type, f"R-{str(run_index).zfill(3)}"),
+            COL_FINALIZATION_HISTOGRAM,
+        ]
+    )
+
+
 @cache_op(_PARTITION, StoreOperation.GET_ONE)
 def get_info(ctx: ExecutionContext, aspect: ExecutionAspect) -> ItemKey:
     """Decaches domain object: ExecutionInfo.
@@ -234,9 +266,7 @@ def get_info(ctx: ExecutionContext, aspect: ExecutionAspect) -> ItemKey:
 
     return ItemKey(
         paths=[
-            ctx.network,
-            ctx.run_type,
-            ctx.label_run_index,
+            get_run_scope(ctx.network, ctx.run_type, ctx.label_run_index),
             COL_INFO,
         ],
         names=names,
@@ -253,30 +283,46 @@ def get_info_list(network_id: NetworkIdentifier, run_type: str, run_index: int =
 
     :returns: Keypath to domain object instance.
 
+    """
+    return _get_info_list_search_key(network_id, run_type, run_index)
+
+
+@cache_op(_PARTITION, StoreOperation.ITER_MANY)
+def iter_info_list(network_id: NetworkIdentifier, run_type: str, run_index: int = None) -> SearchKey:
+    """Decaches domain object: ExecutionInfo - streamed so as to bound memory usage.
+    
+    :param network_id: Identifier of network being tested.
+    :param run_type: Type of run that was executed.
+    :param run_index: Index of a run.
+
+    :returns: Keypath to domain object instance.
+
+    """
+    return _get_info_list_search_key(network_id, run_type, run_index)
+
+
+def _get_info_list_search_key(network_id: NetworkIdentifier, run_type: str, run_index: int = None) -> SearchKey:
+    """Returns search key over cached execution information.
+    
     """
     if not run_type:
         return SearchKey(
             paths=[
-                network_id.name,
-                "*",
+                get_run_scope(network_id.name, "*", "*"),
                 COL_INFO,
             ]
         )
     elif run_index:
         return SearchKey(
             paths=[
-                network_id.name,
-                run_type,
-                f"R-{str(run_index).zfill(3)}",
+                get_run_scope(network_id.name, run_type, f"R-{str(run_index).zfill(3)}"),
                 COL_INFO,
             ]
         )
     else:
         return SearchKey(
             paths=[
-                network_id.name,
-                run_type,
-                "*",
+                get_run_scope(network_id.name, run_type, "*"),
                 COL_INFO,
             ]
         )
@@ -294,6 +340,30 @@ def increment_deploy_count(
     :param aspect: Aspect of execution in scope.
     :param amount: Amount by which to increment counter.
 
+    """
+    return _get_deploy_count_increment_key(ctx, aspect, amount)
+
+
+@cache_op(_PARTITION, StoreOperation.COUNTER_INCR_MANY)
+def increment_deploy_counts(ctx: ExecutionContext, amount: int = 1) -> CountIncrementKeySet:
+    """Increments (atomically) count of run, phase & step deploys in a single round trip.
+
+    :param ctx: Execution context information.
+    :param amount: Amount by which to increment counters.
+
+    :returns: Cache increment keys - operation returns updated run, phase & step deploy counts.
+
+    """
+    return CountIncrementKeySet([
+        _get_deploy_count_increment_key(ctx, ExecutionAspect.RUN, amount),
+        _get_deploy_count_increment_key(ctx, ExecutionAspect.PHASE, amount),
+        _get_deploy_count_increment_key(ctx, ExecutionAspect.STEP, amount),
+    ])
+
+
+def _get_deploy_count_increment_key(ctx: ExecutionContext, aspect: ExecutionAspect, amount: int) -> CountIncrementKey:
+    """Returns key used to increment count of deploys within the scope of an execution aspect.
+
     """
     if aspect == ExecutionAspect.RUN:
         names = ["-"]
@@ -304,9 +374,7 @@ def increment_deploy_count(
 
     return CountIncrementKey(
         paths=[
-            ctx.network,
-            ctx.run_type,
-            ctx.label_run_index,
+            get_run_scope(ctx.network, ctx.run_type, ctx.label_run_index),
             COL_DEPLOY_COUNT,
         ],
         names=names,
@@ -314,17 +382,34 @@ def increment_deploy_count(
     )
 
 
-def increment_deploy_counts(ctx: ExecutionContext, amount: int = 1) -> int:
-    """Increments (atomically) count of run deploys.
+@cache_op(_PARTITION, StoreOperation.HISTOGRAM_RECORD)
+def increment_finalization_histogram(deploy: Deploy) -> HistogramSample:
+    """Records (atomically) a deploy's finalization time within it's step's histogram.
 
-    :param ctx: Execution context information.
+    :param deploy: A finalized deploy.
+
+    :returns: Histogram sample.
 
     """
-    # TODO: increment as a batch.
-    return (
-        increment_deploy_count(ctx, ExecutionAspect.RUN, amount),
-        increment_deploy_count(ctx, ExecutionAspect.PHASE, amount),
-        increment_deploy_count(ctx, ExecutionAspect.STEP, amount)
+    return HistogramSample(
+        item_key=ItemKey(
+            paths=[
+                get_run_scope(deploy.network, deploy.run_type, deploy.label_run_index),
+                COL_FINALIZATION_HISTOGRAM,
+            ],
+            names=[
+                deploy.label_phase_index,
+                deploy.label_step_index,
+            ],
+        ),
+        value=deploy.finalization_duration,
+        started_at=deploy.dispatch_timestamp.timestamp(),
+        ended_at=deploy.finalization_timestamp.timestamp(),
+        expiration=EnvVars.FINALIZATION_HISTOGRAM_RETENTION,
+        labels={
+            "phase": deploy.label_phase_index,
+            "step": deploy.label_step_index,
+        },
     )
 
 
@@ -348,32 +433,25 @@ def increment_generator_run_count(network: str, generator_type: str) -> CountInc
     )
 
 
-@cache_op(_PARTITION, StoreOperation.SET_ONE_SINGLETON)
-def set_lock(aspect: ExecutionAspect, lock: ExecutionLock) -> Item:
-    """Encaches a lock: ExecutionLock.
+@cache_op(_PARTITION, StoreOperation.SET_ONE_SINGLETON_WITH_ITEMS)
+def set_lock_with_context(aspect: ExecutionAspect, lock: ExecutionLock, ctx: ExecutionContext) -> LockedItemSet:
+    """Encaches a lock: ExecutionLock - plus, if acquired, domain objects: ExecutionContext & ExecutionInfo.
+
+    Lock acquisition & context update are applied atomically in a single round trip.
 
     :param aspect: Aspect of execution to be locked.
     :param lock: Information to be locked.
+    :param ctx: Execution context information to be encached if lock is acquired.
 
-    """
-    if aspect == ExecutionAspect.RUN:
-        names = ["-"]
-    elif aspect == ExecutionAspect.PHASE:
-        names = [lock.label_phase_index]
-    elif aspect == ExecutionAspect.STEP:
-        names = [lock.label_phase_index, lock.label_step_index]
+    :returns: Cache items - operation returns flag indicating whether lock was acquired.
 
-    return Item(
-        data=lock,
-        item_key=ItemKey(
-            paths=[
-                lock.network,
-                lock.run_type,
-                lock.label_run_index,
-                COL_LOCK,
-            ],
-            names=names,
-        ),
+    """
+    return LockedItemSet(
+        lock=_get_lock_item(aspect, lock),
+        items=[
+            _get_context_item(ctx),
+            _get_info_item(factory.create_execution_info(aspect, ctx)),
+        ]
     )
 
 
@@ -385,14 +463,31 @@ def set_context(ctx: ExecutionContext) -> Item:
 
     :returns: Keypath + domain object instance.
 
+    """
+    return _get_context_item(ctx)
+
+
+@cache_op(_PARTITION, StoreOperation.SET_ONE)
+def set_info(info: ExecutionInfo) -> Item:
+    """Encaches domain object: ExecutionInfo.
+    
+    :param info: ExecutionInfo domain object instance to be cached.
+
+    :returns: Keypath + domain object instance.
+
+    """
+    return _get_info_item(info)
+
+
+def _get_context_item(ctx: ExecutionContext) -> Item:
+    """Returns cache item: ExecutionContext.
+
     """
     return Item(
         data=ctx,
         item_key=ItemKey(
             paths=[
-                ctx.network,
-                ctx.run_type,
-                ctx.label_run_index,
+                get_run_scope(ctx.network, ctx.run_type, ctx.label_run_index),
             ],
             names=[
                 COL_CONTEXT,
@@ -402,13 +497,8 @@ def set_context(ctx: ExecutionContext) -> Item:
     )
 
 
-@cache_op(_PARTITION, StoreOperation.SET_ONE)
-def set_info(info: ExecutionInfo) -> Item:
-    """Encaches domain object: ExecutionInfo.
-    
-    :param info: ExecutionInfo domain object instance to be cached.
-
-    :returns: Keypath + domain object instance.
+def _get_info_item(info: ExecutionInfo) -> Item:
+    """Returns cache item: ExecutionInfo.
 
     """
     if info.phase_index and info.step_index:
@@ -422,9 +512,7 @@ def set_info(info: ExecutionInfo) -> Item:
         data=info,
         item_key=ItemKey(
             paths=[
-                info.network,
-                info.run_type,
-                info.label_run_index,
+                get_run_scope(info.network, info.run_type, info.label_run_index),
                 COL_INFO,
             ],
             names=names,
@@ -433,6 +521,29 @@ def set_info(info: ExecutionInfo) -> Item:
     )    
 
 
+def _get_lock_item(aspect: ExecutionAspect, lock: ExecutionLock) -> Item:
+    """Returns cache item: ExecutionLock.
+
+    """
+    if aspect == ExecutionAspect.RUN:
+        names = ["-"]
+    elif aspect == ExecutionAspect.PHASE:
+        names = [lock.label_phase_index]
+    elif aspect == ExecutionAspect.STEP:
+        names = [lock.label_phase_index, lock.label_step_index]
+
+    return Item(
+        data=lock,
+        item_key=ItemKey(
+            paths=[
+                get_run_scope(lock.network, lock.run_type, lock.label_run_index),
+                COL_LOCK,
+            ],
+            names=names,
+        ),
+    )
+
+
 def set_info_update(ctx: ExecutionContext, aspect: ExecutionAspect, status: ExecutionStatus):
     """Updates domain object: ExecutionContext.
     
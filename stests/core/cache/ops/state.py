@@ -4,6 +4,8 @@ import typing
 from stests.core import factory
 from stests.core.cache.model import CountDecrementKey
 from stests.core.cache.model import CountIncrementKey
+from stests.core.cache.model import get_run_scope
+from stests.core.cache.model import IndexedItem
 from stests.core.cache.model import Item
 from stests.core.cache.model import ItemKey
 from stests.core.cache.model import SearchKey
@@ -31,6 +33,8 @@ COL_ACCOUNT = "account"
 COL_ACCOUNT_BALANCE = "account-balance"
 COL_NAMED_KEY = "named-key"
 COL_DEPLOY = "deploy"
+COL_DEPLOY_INDEX = "deploy-index"
+COL_INDEX_SET = "index-set"
 COL_TRANSFER = "transfer"
 
 
@@ -46,9 +50,7 @@ def decrement_account_balance(account: Account, amount: int) -> CountDecrementKe
     """
     return CountDecrementKey(
         paths=[
-            account.network,
-            account.run_type,
-            account.label_run_index,
+            get_run_scope(account.network, account.run_type, account.label_run_index),
             COL_ACCOUNT_BALANCE,
         ],
         names=[
@@ -71,9 +73,7 @@ def decrement_account_balance_on_deploy_finalisation(deploy: Deploy, cost: int)
     
     return CountDecrementKey(
         paths=[
-            deploy.network,
-            deploy.run_type,
-            deploy.label_run_index,
+            get_run_scope(deploy.network, deploy.run_type, deploy.label_run_index),
             COL_ACCOUNT_BALANCE,
         ],
         names=[
@@ -83,8 +83,44 @@ def decrement_account_balance_on_deploy_finalisation(deploy: Deploy, cost: int)
     )
 
 
+def prune_on_run_completion(ctx: ExecutionContext):
+    """Deletes data cached during the course of a run.
+
+    :param ctx: Execution context information.
+
+    """
+    _delete_deploy_index_on_run_completion(ctx)
+    _delete_on_run_completion(ctx)
+
+
+@cache_op(_PARTITION, StoreOperation.DELETE_INDEX_SET)
+def _delete_deploy_index_on_run_completion(ctx: ExecutionContext) -> ItemKey:
+    """Deletes deploy index entries cached during the course of a run.
+
+    :param ctx: Execution context information.
+    :returns: Cache key of run specific set of index entries to be deleted.
+
+    """
+    return _get_deploy_index_set_key(ctx.network, ctx.run_type, ctx.label_run_index)
+
+
+def _get_deploy_index_set_key(network: str, run_type: str, label_run_index: str) -> ItemKey:
+    """Returns key of set recording deploy index entries cached during the course of a run.
+
+    """
+    return ItemKey(
+        paths=[
+            get_run_scope(network, run_type, label_run_index),
+            COL_INDEX_SET,
+        ],
+        names=[
+            COL_DEPLOY_INDEX,
+        ],
+    )
+
+
 @cache_op(_PARTITION, StoreOperation.DELETE_MANY)
-def prune_on_run_completion(ctx: ExecutionContext) -> SearchKey:
+def _delete_on_run_completion(ctx: ExecutionContext) -> SearchKey:
     """Deletes data cached during the course of a run.
 
     :param ctx: Execution context information.
@@ -93,9 +129,7 @@ def prune_on_run_completion(ctx: ExecutionContext) -> SearchKey:
     """
     return SearchKey(
         paths=[
-            ctx.network,
-            ctx.run_type,
-            ctx.label_run_index,
+            get_run_scope(ctx.network, ctx.run_type, ctx.label_run_index),
         ]
     )
 
@@ -108,9 +142,7 @@ def get_account(account_id: AccountIdentifier) -> ItemKey:
     """
     return ItemKey(
         paths=[
-            account_id.run.network.name,
-            account_id.run.type,
-            account_id.label_run_index,
+            get_run_scope(account_id.run.network.name, account_id.run.type, account_id.label_run_index),
             COL_ACCOUNT,
         ],
         names=[
@@ -127,9 +159,7 @@ def get_account_balance(account: Account) -> ItemKey:
     """
     return ItemKey(
         paths=[
-            account.network,
-            account.run_type,
-            account.label_run_index,
+            get_run_scope(account.network, account.run_type, account.label_run_index),
             COL_ACCOUNT_BALANCE,
         ],
         names=[
@@ -154,7 +184,7 @@ def get_account_by_index(ctx: ExecutionContext, index: int) -> Account:
         ))
 
 
-@cache_op(_PARTITION, StoreOperation.GET_ONE_FROM_MANY)
+@cache_op(_PARTITION, StoreOperation.GET_ONE_BY_INDEX)
 def get_deploy(ctx: ExecutionContext, deploy_hash: str) -> ItemKey:
     """Decaches domain object: Deploy.
 
@@ -167,19 +197,15 @@ def get_deploy(ctx: ExecutionContext, deploy_hash: str) -> ItemKey:
     return ItemKey(
         paths=[
             ctx.network,
-            ctx.run_type,
-            ctx.label_run_index,
-            COL_DEPLOY,
+            COL_DEPLOY_INDEX,
         ],
         names=[
-            "*.*",
             deploy_hash,
-            "A-*"
         ],
     )
 
 
-@cache_op(_PARTITION, StoreOperation.GET_ONE_FROM_MANY)
+@cache_op(_PARTITION, StoreOperation.GET_ONE_BY_INDEX)
 def get_deploy_on_finalisation(network_name: str, deploy_hash: str) -> ItemKey:
     """Decaches domain object: Deploy.
     
@@ -192,14 +218,10 @@ def get_deploy_on_finalisation(network_name: str, deploy_hash: str) -> ItemKey:
     return ItemKey(
         paths=[
             network_name,
-            "WG-*",
-            "R-*",
-            COL_DEPLOY,
+            COL_DEPLOY_INDEX,
         ],
         names=[
-            "*.*",
             deploy_hash,
-            "A-*"
         ],
     )
 
@@ -217,9 +239,7 @@ def get_deploys(network_id: NetworkIdentifier, run_type: str, run_index: int) ->
     """
     return SearchKey(
         paths=[
-            network_id.name,
-            run_type,
-            f"R-{str(run_index).zfill(3)}",
+            get_run_scope(network_id.name, run_type, f"R-{str(run_index).zfill(3)}"),
             COL_DEPLOY,
         ]
     )
@@ -236,9 +256,7 @@ def get_named_keys(ctx: ExecutionContext, account: Account, contract_type: Contr
     """
     return SearchKey(
         paths=[
-            ctx.network,
-            ctx.run_type,
-            ctx.label_run_index,
+            get_run_scope(ctx.network, ctx.run_type, ctx.label_run_index),
             COL_NAMED_KEY,
             account.label_index,
             contract_type.name,            
@@ -246,6 +264,25 @@ def get_named_keys(ctx: ExecutionContext, account: Account, contract_type: Contr
     )
 
 
+@cache_op(_PARTITION, StoreOperation.ITER_MANY)
+def iter_deploys(network_id: NetworkIdentifier, run_type: str, run_index: int) -> SearchKey:
+    """Decaches domain objects: Deploy - streamed so as to bound memory usage over large runs.
+    
+    :param network_id: Identifier of network being tested.
+    :param run_type: Type of run that was executed.
+    :param run_index: Index of a run.
+
+    :returns: Cache search key.
+
+    """
+    return SearchKey(
+        paths=[
+            get_run_scope(network_id.name, run_type, f"R-{str(run_index).zfill(3)}"),
+            COL_DEPLOY,
+        ]
+    )
+
+
 @cache_op(_PARTITION, StoreOperation.COUNTER_INCR)
 def increment_account_balance(account: Account, amount: int) -> CountIncrementKey:
     """Updates (atomically) an account's (theoretical) balance.
@@ -258,9 +295,7 @@ def increment_account_balance(account: Account, amount: int) -> CountIncrementKe
     """
     return CountIncrementKey(
         paths=[
-            account.network,
-            account.run_type,
-            account.label_run_index,
+            get_run_scope(account.network, account.run_type, account.label_run_index),
             COL_ACCOUNT_BALANCE,
         ],
         names=[
@@ -281,9 +316,7 @@ def set_account(account: Account) -> Item:
         data=account,
         item_key=ItemKey(
             paths=[
-                account.network,
-                account.run_type,
-                account.label_run_index,
+                get_run_scope(account.network, account.run_type, account.label_run_index),
                 COL_ACCOUNT,
             ],
             names=[
@@ -293,22 +326,30 @@ def set_account(account: Account) -> Item:
     )
 
 
-@cache_op(_PARTITION, StoreOperation.SET_ONE)
-def set_deploy(deploy: Deploy) -> Item:
+@cache_op(_PARTITION, StoreOperation.SET_ONE_INDEXED)
+def set_deploy(deploy: Deploy) -> IndexedItem:
     """Encaches domain object: Deploy.
     
     :param deploy: Deploy domain object instance to be cached.
 
-    :returns: Cache item.
+    :returns: Cache item indexed by deploy hash.
 
     """
-    return Item(
+    return IndexedItem(
         data=deploy,
-        item_key=ItemKey(
+        index_key=ItemKey(
             paths=[
                 deploy.network,
-                deploy.run_type,
-                deploy.label_run_index,
+                COL_DEPLOY_INDEX,
+            ],
+            names=[
+                deploy.deploy_hash,
+            ]
+        ),
+        index_set_key=_get_deploy_index_set_key(deploy.network, deploy.run_type, deploy.label_run_index),
+        item_key=ItemKey(
+            paths=[
+                get_run_scope(deploy.network, deploy.run_type, deploy.label_run_index),
                 COL_DEPLOY,
             ],
             names=[
@@ -333,9 +374,7 @@ def set_named_key(ctx: ExecutionContext, named_key: NamedKey) -> Item:
         data=named_key,
         item_key=ItemKey(
             paths=[
-                named_key.network,
-                named_key.run_type,
-                named_key.label_run_index,
+                get_run_scope(named_key.network, named_key.run_type, named_key.label_run_index),
                 COL_NAMED_KEY,
                 named_key.label_account_index,
                 named_key.contract_type.name,
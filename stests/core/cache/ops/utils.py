@@ -1,4 +1,5 @@
-import json
+import contextlib
+import threading
 import typing
 import functools
 import time
@@ -7,22 +8,49 @@ import redis
 
 from stests.core.cache.model import StoreOperation
 from stests.core.cache.model import StorePartition
+from stests.core.cache.model import BucketedSetMember
 from stests.core.cache.model import CountDecrementKey
 from stests.core.cache.model import CountIncrementKey
+from stests.core.cache.model import CountIncrementKeySet
+from stests.core.cache.model import HashFieldItem
+from stests.core.cache.model import HistogramSample
+from stests.core.cache.model import IndexedItem
 from stests.core.cache.model import Item
 from stests.core.cache.model import ItemKey
+from stests.core.cache.model import LockedItemSet
+from stests.core.cache.model import RingBufferItem
 from stests.core.cache.model import SearchKey
+from stests.core.cache import local
+from stests.core.cache import metrics
 from stests.core.cache import stores
 from stests.core.utils import encoder
+from stests.core.utils import histogram
 
 
 
-def _decode_item(as_json: str) -> typing.Any:
+def _decode_item(as_bytes: bytes) -> typing.Any:
     """Returns a decoded encached domain object(s).
 
     """
-    if as_json is not None:
-        return encoder.decode(json.loads(as_json))
+    if as_bytes is not None:
+        if not metrics.is_enabled():
+            return encoder.from_bytes(as_bytes)
+        started_at = time.perf_counter()
+        result = encoder.from_bytes(as_bytes)
+        metrics.record_codec((time.perf_counter() - started_at) * 1000, bytes_read=len(as_bytes))
+        return result
+
+
+def _encode_item(item: Item) -> bytes:
+    """Returns an encoded domain object(s) to be encached.
+
+    """
+    if not metrics.is_enabled():
+        return item.data_as_bytes
+    started_at = time.perf_counter()
+    result = item.data_as_bytes
+    metrics.record_codec((time.perf_counter() - started_at) * 1000, bytes_written=len(result))
+    return result
 
 
 def _decr(store: typing.Callable, decrement: CountDecrementKey):
@@ -39,16 +67,37 @@ def _delete_one(store: typing.Callable, item_key: ItemKey):
     store.delete(item_key.key)
 
 
+def _delete_lease(store: typing.Callable, item: Item) -> bool:
+    """Deletes a lease if held by caller.
+    
+    """
+    script = store.register_script(_LUA_DELETE_LEASE)
+
+    return bool(script(keys=[item.key], args=[_encode_item(item)]))
+
+
 def _delete_many(store: typing.Callable, search_key: SearchKey):
     """Deletes items under matching keys.
 
     """
-    chunk_size = 1000
-    cursor = '0'
-    while cursor != 0:
-        cursor, keys = store.scan(cursor=cursor, match=search_key.key, count=chunk_size)
-        if keys:
-            store.delete(*keys)
+    for keys in _scan_pages(store, search_key.key):
+        # Keys are deleted individually as, when clustered, a page may span slots.
+        _delete_keys(store, keys)
+
+
+def _delete_index_set(store: typing.Callable, item_key: ItemKey):
+    """Deletes secondary index entries recorded within an index set plus the set itself.
+
+    """
+    page = []
+    for key in store.sscan_iter(item_key.key, count=1000):
+        page.append(key)
+        if len(page) == 1000:
+            _delete_keys(store, page)
+            page = []
+    if page:
+        _delete_keys(store, page)
+    store.delete(item_key.key)
 
 
 def _get_counter_one(store: typing.Callable, item_key: ItemKey) -> int:
@@ -64,28 +113,42 @@ def _get_counter_many(store: typing.Callable, search_key: SearchKey) -> typing.T
     """Returns counts under matched keys.
     
     """
-    keys = []
-    chunk_size = 1000
-    cursor = '0'
-    while cursor != 0:
-        cursor, keys_ = store.scan(cursor=cursor, match=search_key.key, count=chunk_size)
-        keys += keys_
+    keys, counts = [], []
+    for keys_ in _scan_pages(store, search_key.key):
+        for key, count in zip(keys_, _mget(store, keys_)):
+            # Skip counters expired between scan & fetch.
+            if count is not None:
+                keys.append(key.decode('utf8'))
+                counts.append(int(count))
 
-    return [i.decode('utf8') for i in keys], [int(i) for i in store.mget(keys)]
+    return keys, counts
 
 
 def _get_count(store: typing.Callable, search_key: SearchKey) -> int:
     """Returns length of collection under matched keys.
     
     """
-    count = 0
-    chunk_size = 1000
-    cursor = '0'
-    while cursor != 0:
-        cursor, keys = store.scan(cursor=cursor, match=search_key.key, count=chunk_size)
-        count += len(keys)
+    return sum(len(keys) for keys in _scan_pages(store, search_key.key))
 
-    return count
+
+def _delete_keys(store: typing.Callable, keys: typing.List[bytes]):
+    """Deletes items under a set of exactly matched keys.
+    
+    """
+    if _is_cluster(store):
+        pipeline = store.pipeline()
+        for key in keys:
+            pipeline.delete(key)
+        pipeline.execute()
+    else:
+        store.delete(*keys)
+
+
+def _get_hash(store: typing.Callable, item_key: ItemKey) -> typing.List[typing.Any]:
+    """Returns values of all fields of a hash under exactly matched key.
+    
+    """
+    return [_decode_item(i) for i in store.hgetall(item_key.key).values()]
 
 
 def _get_one(store: typing.Callable, item_key: ItemKey) -> typing.Any:
@@ -95,30 +158,156 @@ def _get_one(store: typing.Callable, item_key: ItemKey) -> typing.Any:
     return _decode_item(store.get(item_key.key))
 
 
+def _get_one_by_index(store: typing.Callable, item_key: ItemKey) -> typing.Any:
+    """Returns item pointed to by a secondary index entry.
+    
+    """
+    ref = store.get(item_key.key)
+    if ref is not None:
+        return _decode_item(store.get(ref))
+
+
 def _get_one_from_many(store: typing.Callable, item_key: ItemKey) -> typing.Any:
     """Returns item under first matched key.
     
     """
-    chunk_size = 1000
-    cursor = '0'
-    while cursor != 0:
-        cursor, keys = store.scan(cursor=cursor, match=item_key.key, count=chunk_size)
-        if keys:
-            return _decode_item(store.get(keys[0]))
+    for keys in _scan_pages(store, item_key.key):
+        return _decode_item(store.get(keys[0]))
 
 
 def _get_many(store: typing.Callable, search_key: SearchKey) -> typing.List[typing.Any]:
     """Returns collection cached under all matched keys.
     
     """
-    keys = []
-    chunk_size = 2000
-    cursor = '0'
-    while cursor != 0:
-        cursor, keys_ = store.scan(cursor=cursor, match=search_key.key, count=chunk_size)
-        keys += keys_
+    return list(_iter_many(store, search_key))
+
+
+# Lua: increments a set of counters returning updated counts.
+#   KEYS: counter keys.
+#   ARGV: increment amounts.
+_LUA_INCR_MANY = """
+local counts = {}
+for i = 1, #KEYS do
+    counts[i] = redis.call('INCRBY', KEYS[i], ARGV[i])
+end
+return counts
+"""
+
+# Lua: records a sample within a histogram encached as a hash - expiration is reset upon each sample.
+#   KEYS[1]: histogram key.
+#   ARGV[1..5]: bucket field + value + sample start + sample end + expiration (0 = none), ARGV[6..]: label field + value pairs.
+_LUA_HISTOGRAM_RECORD = """
+local function set_if(field, value, predicate)
+    local current = redis.call('HGET', KEYS[1], field)
+    if not current or predicate(tonumber(value), tonumber(current)) then
+        redis.call('HSET', KEYS[1], field, value)
+    end
+end
+local function lt(a, b) return a < b end
+local function gt(a, b) return a > b end
+redis.call('HINCRBY', KEYS[1], ARGV[1], 1)
+redis.call('HINCRBY', KEYS[1], 'count', 1)
+redis.call('HINCRBYFLOAT', KEYS[1], 'sum', ARGV[2])
+set_if('min', ARGV[2], lt)
+set_if('max', ARGV[2], gt)
+set_if('first', ARGV[3], lt)
+set_if('last', ARGV[4], gt)
+for i = 6, #ARGV, 2 do
+    redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+if tonumber(ARGV[5]) > 0 then
+    redis.call('EXPIRE', KEYS[1], ARGV[5])
+end
+return 1
+"""
+
+# Lua: deletes a lease if held by caller.
+#   KEYS[1]: lease key.
+#   ARGV[1]: lease data.
+_LUA_DELETE_LEASE = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# Lua: adds a member to current bucket of a time bucketed set unless already a member of a retained bucket.
+#   KEYS[1]: current bucket key, KEYS[2..n]: retained bucket keys.
+#   ARGV[1..2]: member + bucket expiration.
+_LUA_SET_ADD_BUCKETED = """
+for i = 2, #KEYS do
+    if redis.call('SISMEMBER', KEYS[i], ARGV[1]) == 1 then
+        return 0
+    end
+end
+if redis.call('SADD', KEYS[1], ARGV[1]) == 0 then
+    return 0
+end
+if redis.call('TTL', KEYS[1]) < 0 then
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return 1
+"""
+
+# Lua: sets a lease if not already cached or if held by caller - expiration is reset upon renewal.
+#   KEYS[1]: lease key.
+#   ARGV[1..2]: lease data + expiration.
+_LUA_SET_LEASE = """
+local current = redis.call('GET', KEYS[1])
+if current and current ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+return 1
+"""
+
+# Lua: sets an item if not already cached and, upon doing so, sets further items.
+#   KEYS[1]: singleton key, KEYS[2..n]: item keys.
+#   ARGV[1..2]: singleton data + expiration, ARGV[3..]: item data + expiration pairs (expiration 0 = none).
+_LUA_SET_ONE_SINGLETON_WITH_ITEMS = """
+local function set(key, data, ex, nx)
+    local args = {key, data}
+    if tonumber(ex) > 0 then
+        table.insert(args, 'EX')
+        table.insert(args, ex)
+    end
+    if nx then
+        table.insert(args, 'NX')
+    end
+    return redis.call('SET', unpack(args))
+end
+if not set(KEYS[1], ARGV[1], ARGV[2], true) then
+    return 0
+end
+for i = 2, #KEYS do
+    set(KEYS[i], ARGV[i * 2 - 1], ARGV[i * 2], false)
+end
+return 1
+"""
+
+
+def _hash_set(store: typing.Callable, item: HashFieldItem):
+    """Sets a field of a hash under a key.
+    
+    """
+    pipeline = store.pipeline()
+    _queue_hash_set(pipeline, item)
+    pipeline.execute()
 
-    return [_decode_item(i) for i in store.mget(keys)] if keys else []
+
+def _histogram_record(store: typing.Callable, sample: HistogramSample):
+    """Records a sample within a histogram.
+    
+    """
+    script = store.register_script(_LUA_HISTOGRAM_RECORD)
+    script(keys=[sample.key], args=_get_histogram_record_args(sample))
+
+
+def _get_histogram_record_args(sample: HistogramSample) -> typing.List[typing.Any]:
+    """Returns arguments passed to histogram record script.
+    
+    """
+    return [sample.bucket_field, sample.value, sample.started_at, sample.ended_at, sample.expiration or 0] + sample.label_fields
 
 
 def _incr(store: typing.Callable, item_key: CountIncrementKey) -> typing.Any:
@@ -128,11 +317,129 @@ def _incr(store: typing.Callable, item_key: CountIncrementKey) -> typing.Any:
     return store.incrby(item_key.key, item_key.amount)
 
 
+def _incr_many(store: typing.Callable, key_set: CountIncrementKeySet) -> typing.Tuple[int]:
+    """Increments counts under exactly matched keys as a single atomic operation.
+    
+    """
+    script = store.register_script(_LUA_INCR_MANY)
+
+    return tuple(script(
+        keys=[i.key for i in key_set.keys],
+        args=[i.amount for i in key_set.keys],
+        ))
+
+
+def _iter_many(store: typing.Callable, search_key: SearchKey) -> typing.Iterator[typing.Any]:
+    """Yields collection cached under all matched keys - fetching one scan page at a time.
+    
+    """
+    for keys in _scan_pages(store, search_key.key, 2000):
+        for item in _mget(store, keys):
+            # Skip items expired between scan & fetch.
+            if item is not None:
+                yield _decode_item(item)
+
+
+def _is_cluster(store: typing.Callable) -> bool:
+    """Returns flag indicating whether store is a cluster - i.e. multi-key commands must not span slots.
+    
+    """
+    return isinstance(store, redis.RedisCluster)
+
+
+def _mget(store: typing.Callable, keys: typing.List[bytes]) -> typing.List[typing.Optional[bytes]]:
+    """Returns items under a set of exactly matched keys.
+    
+    """
+    if _is_cluster(store):
+        return store.mget_nonatomic(keys)
+
+    return store.mget(keys)
+
+
+def _get_histograms(store: typing.Callable, search_key: SearchKey) -> typing.List[histogram.Histogram]:
+    """Returns histograms cached under all matched keys.
+    
+    """
+    histograms = []
+    for keys in _scan_pages(store, search_key.key):
+        pipeline = store.pipeline(transaction=False)
+        for key in keys:
+            pipeline.hgetall(key)
+        for fields in pipeline.execute():
+            # Skip histograms deleted between scan & fetch.
+            if fields:
+                histograms.append(histogram.from_fields({k.decode("utf8"): v.decode("utf8") for k, v in fields.items()}))
+
+    return histograms
+
+
+def _get_ring(store: typing.Callable, item_key: ItemKey) -> typing.List[typing.Any]:
+    """Returns entries of a ring buffer under exactly matched key - oldest first.
+    
+    """
+    return [_decode_item(i) for i in store.lrange(item_key.key, 0, -1)]
+
+
+def _ring_push(store: typing.Callable, item: RingBufferItem) -> int:
+    """Appends entries to a ring buffer under a key.
+    
+    """
+    pipeline = store.pipeline(transaction=not _is_cluster(store))
+    _queue_ring_push(pipeline, item)
+
+    return min(pipeline.execute()[0], item.max_length)
+
+
+def _scan_pages(store: typing.Callable, match: str, count: int = 1000) -> typing.Iterator[typing.List[bytes]]:
+    """Yields pages of keys matching a pattern - when clustered every primary node is scanned.
+    
+    """
+    page = []
+    for key in store.scan_iter(match=match, count=count):
+        page.append(key)
+        if len(page) == count:
+            yield page
+            page = []
+    if page:
+        yield page
+
+
+def _set_add_bucketed(store: typing.Callable, item: BucketedSetMember) -> bool:
+    """Adds a member to a time bucketed set unless already a member.
+    
+    """
+    script = store.register_script(_LUA_SET_ADD_BUCKETED)
+
+    return bool(script(keys=item.keys, args=[item.member, item.expiration]))
+
+
+def _set_lease(store: typing.Callable, item: Item) -> bool:
+    """Sets a lease if not already cached or if held by caller.
+    
+    """
+    script = store.register_script(_LUA_SET_LEASE)
+
+    return bool(script(keys=[item.key], args=[_encode_item(item), item.expiration]))
+
+
 def _set_one(store: typing.Callable, item: Item) -> str:
     """Set item under a key.
     
     """
-    store.set(item.key, item.data_as_json, ex=item.expiration)
+    store.set(item.key, _encode_item(item), ex=item.expiration)
+
+    return item.key
+
+
+def _set_one_indexed(store: typing.Callable, item: IndexedItem) -> str:
+    """Set item under a key plus a secondary index entry pointing to it.
+    
+    """
+    # N.B. clustered pipelines are not transactional as index & item keys may map to different slots.
+    pipeline = store.pipeline(transaction=not _is_cluster(store))
+    _queue_set_one_indexed(pipeline, item)
+    pipeline.execute()
 
     return item.key
 
@@ -141,27 +448,236 @@ def _set_one_singleton(store: typing.Callable, item: Item) -> typing.Tuple[str,
     """Sets item under a key if not already cached.
     
     """
-    key, was_cached = item.key, bool(store.setnx(item.key, item.data_as_json))
+    key, was_cached = item.key, bool(store.setnx(item.key, _encode_item(item)))
     if was_cached and item.expiration:
         store.expire(key, item.expiration)
 
     return key, was_cached  
 
 
+def _set_one_singleton_with_items(store: typing.Callable, item_set: LockedItemSet) -> bool:
+    """Sets item under a key if not already cached and, upon doing so, further items - as a single atomic operation.
+    
+    """
+    script = store.register_script(_LUA_SET_ONE_SINGLETON_WITH_ITEMS)
+    args = []
+    for item in [item_set.lock] + item_set.items:
+        args += [_encode_item(item), item.expiration or 0]
+
+    return bool(script(
+        keys=[item_set.lock.key] + [i.key for i in item_set.items],
+        args=args,
+        ))
+
+
 # Map: operation -> redis command wrapper.
 _HANDLERS = {
     StoreOperation.COUNTER_DECR: _decr,
+    StoreOperation.DELETE_LEASE: _delete_lease,
     StoreOperation.DELETE_ONE: _delete_one,
     StoreOperation.DELETE_MANY: _delete_many,
+    StoreOperation.DELETE_INDEX_SET: _delete_index_set,
     StoreOperation.GET_COUNT: _get_count,
     StoreOperation.GET_COUNTER_ONE: _get_counter_one,
     StoreOperation.GET_COUNTER_MANY: _get_counter_many,
+    StoreOperation.GET_HASH: _get_hash,
     StoreOperation.GET_ONE: _get_one,
+    StoreOperation.GET_ONE_BY_INDEX: _get_one_by_index,
     StoreOperation.GET_ONE_FROM_MANY: _get_one_from_many,
+    StoreOperation.GET_HISTOGRAMS: _get_histograms,
     StoreOperation.GET_MANY: _get_many,
+    StoreOperation.GET_RING: _get_ring,
+    StoreOperation.HASH_SET: _hash_set,
+    StoreOperation.HISTOGRAM_RECORD: _histogram_record,
+    StoreOperation.ITER_MANY: _iter_many,
+    StoreOperation.RING_PUSH: _ring_push,
     StoreOperation.COUNTER_INCR: _incr,
+    StoreOperation.COUNTER_INCR_MANY: _incr_many,
+    StoreOperation.SET_ADD_BUCKETED: _set_add_bucketed,
+    StoreOperation.SET_LEASE: _set_lease,
     StoreOperation.SET_ONE: _set_one,
+    StoreOperation.SET_ONE_INDEXED: _set_one_indexed,
     StoreOperation.SET_ONE_SINGLETON: _set_one_singleton,
+    StoreOperation.SET_ONE_SINGLETON_WITH_ITEMS: _set_one_singleton_with_items,
+}
+
+
+def _queue_decr(pipeline: typing.Callable, decrement: CountDecrementKey) -> typing.Callable:
+    """Queues decrement of count under exactly matched key.
+    
+    """
+    pipeline.decrby(decrement.key, decrement.amount)
+
+    return lambda _: None
+
+
+def _queue_delete_lease(pipeline: typing.Callable, item: Item) -> typing.Callable:
+    """Queues deletion of a lease if held by caller.
+    
+    """
+    pipeline.register_script(_LUA_DELETE_LEASE)(keys=[item.key], args=[_encode_item(item)], client=pipeline)
+
+    return bool
+
+
+def _queue_delete_one(pipeline: typing.Callable, item_key: ItemKey) -> typing.Callable:
+    """Queues deletion of item under exactly matched key.
+    
+    """
+    pipeline.delete(item_key.key)
+
+    return lambda _: None
+
+
+def _queue_get_counter_one(pipeline: typing.Callable, item_key: ItemKey) -> typing.Callable:
+    """Queues retrieval of count under exactly matched key.
+    
+    """
+    pipeline.get(item_key.key)
+
+    return lambda count: 0 if count is None else int(count)
+
+
+def _queue_get_one(pipeline: typing.Callable, item_key: ItemKey) -> typing.Callable:
+    """Queues retrieval of item under exactly matched key.
+    
+    """
+    pipeline.get(item_key.key)
+
+    return _decode_item
+
+
+def _queue_hash_set(pipeline: typing.Callable, item: HashFieldItem) -> typing.Callable:
+    """Queues setting of a field of a hash under a key.
+    
+    """
+    pipeline.hset(item.key, item.field, _encode_item(item))
+    if item.expiration:
+        pipeline.expire(item.key, item.expiration)
+
+    return lambda _: None
+
+
+def _queue_histogram_record(pipeline: typing.Callable, sample: HistogramSample) -> typing.Callable:
+    """Queues recording of a sample within a histogram.
+    
+    """
+    pipeline.register_script(_LUA_HISTOGRAM_RECORD)(keys=[sample.key], args=_get_histogram_record_args(sample), client=pipeline)
+
+    return lambda _: None
+
+
+def _queue_incr(pipeline: typing.Callable, item_key: CountIncrementKey) -> typing.Callable:
+    """Queues increment of count under exactly matched key.
+    
+    """
+    pipeline.incrby(item_key.key, item_key.amount)
+
+    return lambda count: count
+
+
+def _queue_ring_push(pipeline: typing.Callable, item: RingBufferItem) -> typing.Callable:
+    """Queues appending of entries to a ring buffer under a key.
+    
+    """
+    pipeline.rpush(item.key, *item.entries_as_bytes)
+    pipeline.ltrim(item.key, -item.max_length, -1)
+    if item.expiration:
+        pipeline.expire(item.key, item.expiration)
+
+    return lambda length: min(length, item.max_length)
+
+
+def _queue_set_add_bucketed(pipeline: typing.Callable, item: BucketedSetMember) -> typing.Callable:
+    """Queues adding of a member to a time bucketed set unless already a member.
+    
+    """
+    pipeline.register_script(_LUA_SET_ADD_BUCKETED)(keys=item.keys, args=[item.member, item.expiration], client=pipeline)
+
+    return bool
+
+
+def _queue_set_lease(pipeline: typing.Callable, item: Item) -> typing.Callable:
+    """Queues setting of a lease if not already cached or if held by caller.
+    
+    """
+    pipeline.register_script(_LUA_SET_LEASE)(keys=[item.key], args=[_encode_item(item), item.expiration], client=pipeline)
+
+    return bool
+
+
+def _queue_set_one(pipeline: typing.Callable, item: Item) -> typing.Callable:
+    """Queues setting of item under a key.
+    
+    """
+    pipeline.set(item.key, _encode_item(item), ex=item.expiration)
+
+    return lambda _: item.key
+
+
+def _queue_set_one_indexed(pipeline: typing.Callable, item: IndexedItem) -> typing.Callable:
+    """Queues setting of item under a key plus a secondary index entry pointing to it.
+    
+    """
+    pipeline.set(item.key, _encode_item(item), ex=item.expiration)
+    pipeline.set(item.index_key, item.key, ex=item.expiration)
+    pipeline.sadd(item.index_set_key, item.index_key)
+
+    return lambda _: item.key
+
+
+def _queue_set_one_singleton(pipeline: typing.Callable, item: Item) -> typing.Callable:
+    """Queues setting of item under a key if not already cached.
+    
+    """
+    pipeline.set(item.key, _encode_item(item), ex=item.expiration, nx=True)
+
+    return lambda was_cached: (item.key, bool(was_cached))
+
+
+# Map: operation -> redis pipeline command wrapper.
+_HANDLERS_BATCH = {
+    StoreOperation.COUNTER_DECR: _queue_decr,
+    StoreOperation.DELETE_LEASE: _queue_delete_lease,
+    StoreOperation.DELETE_ONE: _queue_delete_one,
+    StoreOperation.GET_COUNTER_ONE: _queue_get_counter_one,
+    StoreOperation.GET_ONE: _queue_get_one,
+    StoreOperation.COUNTER_INCR: _queue_incr,
+    StoreOperation.HASH_SET: _queue_hash_set,
+    StoreOperation.HISTOGRAM_RECORD: _queue_histogram_record,
+    StoreOperation.RING_PUSH: _queue_ring_push,
+    StoreOperation.SET_ADD_BUCKETED: _queue_set_add_bucketed,
+    StoreOperation.SET_LEASE: _queue_set_lease,
+    StoreOperation.SET_ONE: _queue_set_one,
+    StoreOperation.SET_ONE_INDEXED: _queue_set_one_indexed,
+    StoreOperation.SET_ONE_SINGLETON: _queue_set_one_singleton,
+}
+
+# Set of operations whose results may be cached locally.
+_LOCAL_CACHE_OPERATIONS = {
+    StoreOperation.GET_MANY,
+    StoreOperation.GET_ONE,
+    StoreOperation.GET_ONE_FROM_MANY,
+}
+
+# Set of operations that mutate cached state.
+_WRITE_OPERATIONS = {
+    StoreOperation.COUNTER_DECR,
+    StoreOperation.COUNTER_INCR,
+    StoreOperation.COUNTER_INCR_MANY,
+    StoreOperation.DELETE_INDEX_SET,
+    StoreOperation.DELETE_LEASE,
+    StoreOperation.DELETE_MANY,
+    StoreOperation.DELETE_ONE,
+    StoreOperation.HASH_SET,
+    StoreOperation.HISTOGRAM_RECORD,
+    StoreOperation.RING_PUSH,
+    StoreOperation.SET_ADD_BUCKETED,
+    StoreOperation.SET_LEASE,
+    StoreOperation.SET_ONE,
+    StoreOperation.SET_ONE_INDEXED,
+    StoreOperation.SET_ONE_SINGLETON,
+    StoreOperation.SET_ONE_SINGLETON_WITH_ITEMS,
 }
 
 # Set of partitions whereby keys are prefixed with os-user. 
@@ -173,6 +689,155 @@ _USER_PARTITIONS = {
 # Max. number of times an operation will be tried.
 _MAX_OP_ATTEMPTS = 5
 
+# Thread specific stack of active batches.
+_BATCHES = threading.local()
+
+
+class _Batch():
+    """A set of deferred cache operations to be executed as a single transaction per partition.
+    
+    """
+    def __init__(self):
+        # Deferred operations: (partition, operation, key | item).
+        self.ops: typing.List[typing.Tuple[StorePartition, StoreOperation, typing.Any]] = []
+
+        # Operation results in order of invocation.
+        self.results: typing.List[typing.Any] = []
+
+
+    def append(self, partition: StorePartition, operation: StoreOperation, obj: typing.Any):
+        """Defers an operation until batch execution.
+
+        :param partition: Cache partition to which operation pertains.
+        :param operation: Cache operation to apply.
+        :param obj: Key or item to which operation pertains - None if operation is to be skipped.
+
+        """
+        if obj is not None and operation not in _HANDLERS_BATCH:
+            raise ValueError(f"Cache operation cannot be batched: {operation.name}")
+
+        self.ops.append((partition, operation, obj))
+
+
+    def execute(self):
+        """Executes deferred operations as a single MULTI/EXEC pipeline per partition.
+
+        """
+        self.results[:] = [None] * len(self.ops)
+
+        # Group operations by partition whilst retaining invocation order.
+        partitions = dict()
+        for idx, (partition, operation, obj) in enumerate(self.ops):
+            if obj is not None:
+                partitions.setdefault(partition, []).append((idx, operation, obj))
+
+        for partition, ops in partitions.items():
+            results = _execute_instrumented(
+                partition,
+                metrics.OPERATION_BATCH,
+                lambda: _execute_with_retry(partition, lambda store: _execute_pipeline(store, ops)),
+                )
+            for (idx, _, _), result in zip(ops, results):
+                self.results[idx] = result
+            if partition in local.PARTITIONS and any(i in _WRITE_OPERATIONS for _, i, _ in ops):
+                local.invalidate(partition)
+
+
+def _execute_pipeline(store: typing.Callable, ops: list) -> typing.List[typing.Any]:
+    """Executes a set of operations as a single transactional pipeline.
+    
+    """
+    # An operation may queue several commands - its result is parsed from the reply to the first.
+    pipeline = store.pipeline(transaction=not _is_cluster(store))
+    parsers = []
+    for _, operation, obj in ops:
+        parsers.append((len(pipeline), _HANDLERS_BATCH[operation](pipeline, obj)))
+    replies = pipeline.execute()
+
+    return [parser(replies[offset]) for offset, parser in parsers]
+
+
+def _execute_instrumented(partition: StorePartition, operation: typing.Union[StoreOperation, str], handler: typing.Callable) -> typing.Any:
+    """Invokes a store handler recording instrumentation if enabled.
+    
+    """
+    if not metrics.is_enabled():
+        return handler()
+
+    # Streamed operations are measured whilst iterated.
+    if operation == StoreOperation.ITER_MANY:
+        return metrics.measure_iter(partition, operation, handler())
+
+    with metrics.measure(partition, operation):
+        return handler()
+
+
+def _execute_with_local_cache(partition: StorePartition, operation: StoreOperation, obj: typing.Any) -> typing.Any:
+    """Invokes a store read handler via process local cache.
+    
+    """
+    key = (operation, obj.key)
+    was_cached, result = local.get_item(partition, key)
+    if not was_cached:
+        generation = local.get_generation()
+        handler = _HANDLERS[operation]
+        result = _execute_instrumented(
+            partition,
+            operation,
+            lambda: _execute_with_retry(partition, lambda store: handler(store, obj)),
+            )
+        local.set_item(partition, key, result, generation)
+    elif metrics.is_enabled():
+        metrics.record_local_hit(partition, operation)
+
+    return result
+
+
+def _execute_with_retry(partition: StorePartition, handler: typing.Callable) -> typing.Any:
+    """Invokes a store handler applying retry semantics in case of broken pipes.
+    
+    """
+    with stores.get_store(partition) as store:
+        attempts = 0
+        while attempts < _MAX_OP_ATTEMPTS:
+            try:
+                return handler(store)
+            except redis.ConnectionError as err:
+                attempts += 1
+                if attempts == _MAX_OP_ATTEMPTS:
+                    raise err
+                metrics.record_retry()
+                time.sleep(float(0.01))
+
+
+def _get_batches() -> typing.List[_Batch]:
+    """Returns stack of batches active within current thread.
+    
+    """
+    try:
+        return _BATCHES.stack
+    except AttributeError:
+        _BATCHES.stack = []
+        return _BATCHES.stack
+
+
+@contextlib.contextmanager
+def batch() -> typing.Iterator[typing.List[typing.Any]]:
+    """Context manager deferring cache operations so that they are executed as a single transaction per partition.
+
+    Only operations over exactly matched keys may be batched, i.e. SCAN based operations are unsupported.
+
+    :returns: List populated upon exit with results of deferred operations in order of invocation.
+
+    """
+    instance = _Batch()
+    _get_batches().append(instance)
+    try:
+        yield instance.results
+    finally:
+        _get_batches().pop()
+    instance.execute()
+
 
 def cache_op(partition: StorePartition, operation: StoreOperation) -> typing.Callable:
     """Decorator to orthoganally process a cache operation.
@@ -188,30 +853,47 @@ def cache_op(partition: StorePartition, operation: StoreOperation) -> typing.Cal
         def wrapper(*args, **kwargs):
             # JIT extend encoder - ensures all types are registered.
             encoder.initialise()
+
+            # Invoke inner function.
+            obj = func(*args, **kwargs)
+
+            # Apply key prefixing.
+            if obj is not None and partition in _USER_PARTITIONS:
+                obj.apply_key_prefix()
+
+            # Apply key namespacing - partitions sharing a cluster keyspace are thus isolated.
+            if obj is not None:
+                namespace = stores.get_key_namespace(partition)
+                if namespace is not None:
+                    obj.apply_key_prefix(namespace)
+
+            # Defer operation if batching.
+            batches = _get_batches()
+            if batches:
+                batches[-1].append(partition, operation, obj)
+                return
             
-            
-            with stores.get_store(partition) as store:
-                # Invoke inner function.
-                obj = func(*args, **kwargs)
-                if obj is None:
-                    return
-                
-                # Apply key prefixing.
-                if partition in _USER_PARTITIONS:
-                    obj.apply_key_prefix()
-                
-                # Invoke operation applying retry semantics in case of broken pipes.
-                # TODO: revisit connection pooling, 
-                attempts = 0
-                handler = _HANDLERS[operation]
-                while attempts < _MAX_OP_ATTEMPTS:
-                    try:
-                        return handler(store, obj)
-                    except redis.ConnectionError as err:
-                        attempts += 1
-                        if attempts == _MAX_OP_ATTEMPTS:
-                            raise err
-                        time.sleep(float(0.01))
+            if obj is None:
+                return
+
+            # Serve rarely written partition reads from process local cache.
+            if partition in local.PARTITIONS and operation in _LOCAL_CACHE_OPERATIONS:
+                return _execute_with_local_cache(partition, operation, obj)
+
+            # Invoke operation applying retry semantics in case of broken pipes.
+            # N.B. streamed operations return a generator that draws connections from the shared pool whilst iterated.
+            handler = _HANDLERS[operation]
+            result = _execute_instrumented(
+                partition,
+                operation,
+                lambda: _execute_with_retry(partition, lambda store: handler(store, obj)),
+                )
+
+            # Notify processes of writes to locally cached partitions.
+            if partition in local.PARTITIONS and operation in _WRITE_OPERATIONS:
+                local.invalidate(partition)
+
+            return result
 
         return wrapper
     return decorator
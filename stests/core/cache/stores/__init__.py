@@ -19,6 +19,16 @@ FACTORIES = {
 }
 
 
+def get_key_namespace(partition_type: StorePartition = StorePartition.INFRA):
+    """Returns namespace to be prefixed to keys of a partition hosted upon a shared keyspace, e.g. a cluster.
+
+    :param partition_type: Type of partition being accessed.
+    :returns: A key namespace or None.
+
+    """
+    return _get_factory().get_key_namespace(partition_type)
+
+
 def get_store(partition_type: StorePartition = StorePartition.INFRA):
     """Returns a cache store ready to be used as a state persistence & flow control mechanism.
 
@@ -26,9 +36,14 @@ def get_store(partition_type: StorePartition = StorePartition.INFRA):
     :returns: A cache store.
 
     """ 
+    return _get_factory().get_store(partition_type)
+
+
+def _get_factory():
+    """Returns cache store factory as determined by environment.
+
+    """
     try:
-        factory = FACTORIES[EnvVars.TYPE]
+        return FACTORIES[EnvVars.TYPE]
     except KeyError:
         raise InvalidEnvironmentVariable("CACHE_TYPE", EnvVars.TYPE, FACTORIES)
-
-    return factory.get_store(partition_type)
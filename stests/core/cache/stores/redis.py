@@ -1,3 +1,8 @@
+import functools
+import os
+import threading
+import typing
+
 import redis
 
 from stests.core.cache.model import StorePartition
@@ -16,6 +21,46 @@ class EnvVars:
     # Redis port.
     PORT = env.get_var('CACHE_REDIS_PORT', 6379, int)
 
+    # Interval (in seconds) after which an idle pooled connection is health checked prior to use.
+    HEALTH_CHECK_INTERVAL = env.get_var('CACHE_REDIS_HEALTH_CHECK_INTERVAL', 30, int)
+
+    # Maximum number of pooled connections per partition.
+    POOL_MAX_CONNECTIONS = env.get_var('CACHE_REDIS_POOL_MAX_CONNECTIONS', 64, int)
+
+    # Time (in seconds) to wait for a pooled connection to become available.
+    POOL_TIMEOUT = env.get_var('CACHE_REDIS_POOL_TIMEOUT', 20, int)
+
+    # Flag indicating whether host is a redis cluster node.
+    CLUSTER = env.get_var('CACHE_REDIS_CLUSTER', 0, int)
+
+
+class _PartitionConfig():
+    """Redis instance configuration of a partition - defaults may be overridden per partition,
+    e.g. STESTS_CACHE_REDIS_MONITORING_HOST, so as to isolate partition traffic.
+
+    """
+    def __init__(self, partition_type: StorePartition):
+        prefix = f"CACHE_REDIS_{partition_type.name}"
+        self.host = env.get_var(f"{prefix}_HOST", EnvVars.HOST)
+        self.port = env.get_var(f"{prefix}_PORT", EnvVars.PORT, int)
+        self.is_cluster = bool(env.get_var(f"{prefix}_CLUSTER", EnvVars.CLUSTER, int))
+
+        # Clusters only support db 0 - partitions sharing a cluster are distinguished by key namespace.
+        if self.is_cluster:
+            self.db = 0
+            self.key_namespace = partition_type.name.lower()
+        else:
+            self.db = env.get_var(f"{prefix}_DB", EnvVars.DB + PARTITION_OFFSETS[partition_type], int)
+            self.key_namespace = None
+
+
+class _RedisCluster(redis.RedisCluster):
+    """A cluster client shared across operations within a process - i.e. not closed upon context exit.
+
+    """
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
 
 # Map: partition type -> cache db index offset.
 PARTITION_OFFSETS = {
@@ -27,6 +72,26 @@ PARTITION_OFFSETS = {
     StorePartition.WORKFLOW: 5,
 }
 
+# Map: partition type -> connection pool | cluster client.
+_POOLS: typing.Dict[StorePartition, typing.Union[redis.ConnectionPool, redis.RedisCluster]] = dict()
+
+# Identifier of process within which connection pools were instantiated.
+_POOLS_PID: typing.Optional[int] = None
+
+# Lock guarding connection pool instantiation across threads.
+_POOLS_LOCK = threading.Lock()
+
+
+def get_key_namespace(partition_type: StorePartition) -> typing.Optional[str]:
+    """Returns namespace to be prefixed to a partition's keys.
+
+    :param partition_type: Type of partition being accessed.
+
+    :returns: Key namespace if partition is hosted upon a cluster.
+
+    """
+    return _get_config(partition_type).key_namespace
+
 
 def get_store(partition_type: StorePartition) -> redis.Redis:
     """Returns instance of a redis cache store accessor.
@@ -34,14 +99,61 @@ def get_store(partition_type: StorePartition) -> redis.Redis:
     :returns: An instance of a redis cache store accessor.
 
     """
-    # Set cache db index.
-    db = EnvVars.DB
-    db += PARTITION_OFFSETS[partition_type]
-
-    # TODO: cluster connections
-    return redis.Redis(
-        db=db,
-        host=EnvVars.HOST,
-        port=EnvVars.PORT
-        )
+    pool = _get_pool(partition_type)
+    if isinstance(pool, redis.RedisCluster):
+        return pool
+
+    return redis.Redis(connection_pool=pool)
+
+
+def _get_pool(partition_type: StorePartition) -> typing.Union[redis.ConnectionPool, redis.RedisCluster]:
+    """Returns process wide connection pool (or cluster client) bound to a partition's redis instance.
+
+    :param partition_type: Type of partition for which a pool is required.
+
+    :returns: A connection pool shared by all store accessors within current process.
+
+    """
+    global _POOLS_PID
+
+    with _POOLS_LOCK:
+        # Discard pools inherited from a parent process - sockets must not be shared across a fork.
+        if _POOLS_PID != os.getpid():
+            _POOLS.clear()
+            _POOLS_PID = os.getpid()
 
+        try:
+            return _POOLS[partition_type]
+        except KeyError:
+            _POOLS[partition_type] = _create_pool(_get_config(partition_type))
+            return _POOLS[partition_type]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_config(partition_type: StorePartition) -> _PartitionConfig:
+    """Returns (memoized) redis instance configuration of a partition.
+
+    """
+    return _PartitionConfig(partition_type)
+
+
+def _create_pool(cfg: _PartitionConfig) -> typing.Union[redis.ConnectionPool, redis.RedisCluster]:
+    """Returns a connection pool (or cluster client) bound to a redis instance.
+
+    """
+    if cfg.is_cluster:
+        return _RedisCluster(
+            host=cfg.host,
+            port=cfg.port,
+            health_check_interval=EnvVars.HEALTH_CHECK_INTERVAL,
+            max_connections=EnvVars.POOL_MAX_CONNECTIONS,
+            )
+
+    return redis.BlockingConnectionPool(
+        db=cfg.db,
+        host=cfg.host,
+        port=cfg.port,
+        health_check_interval=EnvVars.HEALTH_CHECK_INTERVAL,
+        max_connections=EnvVars.POOL_MAX_CONNECTIONS,
+        timeout=EnvVars.POOL_TIMEOUT,
+        )
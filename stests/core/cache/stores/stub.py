@@ -1,17 +1,28 @@
+import typing
+
 import fakeredis
 
 from stests.core.cache.model import StorePartition
+from stests.core.cache.stores.redis import PARTITION_OFFSETS
 
 
-# Factory simply instantiates an instance.
-get_store = fakeredis.FakeStrictRedis
-
+# In-memory server shared by all accessors within a process - N.B. lua scripting requires lupa.
+_SERVER = fakeredis.FakeServer()
 
 
-def get_store(_: StorePartition) -> fakeredis.FakeStrictRedis:
+def get_store(partition_type: StorePartition) -> fakeredis.FakeStrictRedis:
     """Returns instance of a fake redis cache store accessor.
 
+    :param partition_type: Type of partition being accessed - mapped to a db as per redis store.
+
     :returns: An instance of a fake redis cache store accessor.
 
     """
-    return fakeredis.FakeStrictRedis()
+    return fakeredis.FakeStrictRedis(server=_SERVER, db=PARTITION_OFFSETS[partition_type])
+
+
+def get_key_namespace(_: StorePartition) -> typing.Optional[str]:
+    """Returns namespace to be prefixed to a partition's keys - none as stub stores are not clustered.
+
+    """
+    return None
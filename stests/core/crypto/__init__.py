@@ -1,13 +1,17 @@
 from stests.core.crypto.account_hash import get_account_hash
 from stests.core.crypto.account_hash import get_account_hash_from_public_key
 from stests.core.crypto.account_key import get_account_key
+from stests.core.crypto.ecc import delete_pvk_pem_files
+from stests.core.crypto.ecc import delete_stale_pvk_pem_files
 from stests.core.crypto.ecc import get_key_algo
 from stests.core.crypto.ecc import get_key_pair
 from stests.core.crypto.ecc import get_key_pair_from_pvk_b64
 from stests.core.crypto.ecc import get_key_pair_from_pvk_pem_file
 from stests.core.crypto.ecc import get_key_pair_from_seed
+from stests.core.crypto.ecc import get_pvk_pem_file
 from stests.core.crypto.ecc import get_pvk_pem_file_from_bytes
 from stests.core.crypto.ecc import get_pvk_pem_from_bytes
+from stests.core.crypto.ecc import get_signature
 from stests.core.crypto.enums import HashAlgorithm
 from stests.core.crypto.enums import HashEncoding
 from stests.core.crypto.enums import KeyAlgorithm
@@ -1,10 +1,25 @@
+import os
+import pathlib
+import shutil
 import tempfile
+import time
 import typing
 
 from stests.core.crypto import ecc_ed25519 as ed25519
 from stests.core.crypto import ecc_secp256k1 as secp256k1
 from stests.core.crypto.enums import KeyAlgorithm
 from stests.core.crypto.enums import KeyEncoding
+from stests.core.utils import env
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Directory within which PEM key files are cached - tmpfs backed by default.
+    PEM_CACHE_DIR = env.get_var('CRYPTO_PEM_CACHE_DIR', "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir())
+
+    # Time (in seconds) after which an unmodified PEM key file namespace is deemed stale.
+    PEM_CACHE_MAX_AGE = env.get_var('CRYPTO_PEM_CACHE_MAX_AGE', 86400, int)
 
 
 
@@ -90,6 +105,86 @@ def get_key_pair_from_seed(seed: bytes, algo: KeyAlgorithm, encoding: KeyEncodin
     return (pvk.hex(), pbk.hex()) if encoding == KeyEncoding.HEX else (pvk, pbk)
 
 
+def get_signature(data: bytes, pvk: bytes, algo: KeyAlgorithm) -> bytes:
+    """Returns an ECC signature over data.
+
+    :param data: Data to be signed.
+    :param pvk: Private key.
+    :param algo: Type of ECC algo used to generate private key.
+
+    :returns : Deterministic signature over data.
+    
+    """
+    return ALGOS[algo].get_signature(data, pvk)
+
+
+def delete_pvk_pem_files(namespace: str):
+    """Deletes cached PEM key files within a namespace, e.g. upon run completion.
+
+    :param namespace: Namespace of cached PEM key files, e.g. a run.
+    
+    """
+    shutil.rmtree(_get_pem_cache_dir() / namespace, ignore_errors=True)
+
+
+def delete_stale_pvk_pem_files(parent: str):
+    """Deletes cached PEM key file namespaces not modified within max. age, e.g. those of runs that were not pruned.
+
+    :param parent: Parent of namespaces to be swept, e.g. runs.
+    
+    """
+    expiry = time.time() - EnvVars.PEM_CACHE_MAX_AGE
+    try:
+        namespaces = list((_get_pem_cache_dir() / parent).iterdir())
+    except FileNotFoundError:
+        return
+
+    for namespace in namespaces:
+        try:
+            if _get_last_modified(namespace) < expiry:
+                shutil.rmtree(namespace, ignore_errors=True)
+        except FileNotFoundError:
+            pass
+
+
+def _get_last_modified(namespace: pathlib.Path) -> float:
+    """Returns time at which a namespace was last written to - i.e. that of it's newest file.
+
+    :param namespace: Path to a cached PEM key file namespace.
+
+    :returns: Timestamp of most recent modification.
+
+    """
+    # N.B. directory mtime is not updated upon rewriting existing files and is fs dependent, hence files are inspected.
+    timestamps = [i.stat().st_mtime for i in namespace.iterdir() if i.is_file()]
+
+    return max(timestamps) if timestamps else namespace.stat().st_mtime
+
+
+def get_pvk_pem_file(pvk: bytes, algo: KeyAlgorithm, key: str, namespace: str) -> str:
+    """Returns path to a cached file containing an ECC private key in PEM format - written once & reused.
+
+    :param pvk: Private key.
+    :param algo: Type of ECC algo used to generate private key.
+    :param key: Cache key, e.g. account hash.
+    :param namespace: Cache namespace, e.g. a run.
+
+    :returns : Path to private key in PEM format.
+    
+    """
+    path = _get_pem_cache_dir() / namespace / f"{key}.pem"
+    if path.exists():
+        return str(path)
+
+    # Write to a temp file & rename so that concurrent readers never observe a partial file.
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("wb", dir=path.parent, delete=False) as temp_file:
+        temp_file.write(get_pvk_pem_from_bytes(pvk, algo))
+    os.replace(temp_file.name, path)
+
+    return str(path)
+
+
 def get_pvk_pem_from_bytes(pvk: bytes, algo: KeyAlgorithm) -> bytes:
     """Returns an ECC private key in PEM format.
 
@@ -116,3 +211,10 @@ def get_pvk_pem_file_from_bytes(pvk: bytes, algo: KeyAlgorithm) -> bytes:
             fstream.write(get_pvk_pem_from_bytes(pvk, algo))
 
         return temp_file.name
+
+
+def _get_pem_cache_dir() -> pathlib.Path:
+    """Returns user specific directory within which PEM key files are cached.
+
+    """
+    return pathlib.Path(EnvVars.PEM_CACHE_DIR) / f"stests-{os.getuid()}"
@@ -74,6 +74,13 @@ def get_pvk_pem_from_bytes(pvk: bytes) -> bytes:
     )
 
 
+def get_signature(data: bytes, pvk: bytes) -> bytes:
+    """Returns ED25519 signature (64 bytes) over data.
+    
+    """
+    return ed25519.Ed25519PrivateKey.from_private_bytes(pvk).sign(data)
+
+
 def _get_bytes_from_pem_file(fpath: str) -> bytes:
     """Returns bytes from a pem file.
     
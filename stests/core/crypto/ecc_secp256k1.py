@@ -1,4 +1,5 @@
 import base64
+import hashlib
 import typing
 
 import ecdsa
@@ -52,6 +53,21 @@ def get_pvk_pem_from_bytes(pvk: bytes) -> bytes:
     return ecdsa.SigningKey.from_string(pvk, curve=CURVE).to_pem()
 
 
+def get_signature(data: bytes, pvk: bytes) -> bytes:
+    """Returns SECP256K1 signature (64 bytes, r | s) over SHA-256 digest of data.
+
+    Signatures are deterministic (RFC 6979) & normalised to low-S form as required by node.
+    
+    """
+    sk = ecdsa.SigningKey.from_string(pvk, curve=CURVE)
+
+    return sk.sign_deterministic(
+        data,
+        hashfunc=hashlib.sha256,
+        sigencode=ecdsa.util.sigencode_string_canonize,
+        )
+
+
 def _get_bytes_from_pem_file(fpath: str) -> bytes:
     """Returns bytes from a pem file.
     
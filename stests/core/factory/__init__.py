@@ -1,5 +1,6 @@
 from stests.core.factory.chain import create_account
 from stests.core.factory.chain import create_account_for_run
+from stests.core.factory.chain import create_accounts_for_run
 from stests.core.factory.chain import create_account_id
 from stests.core.factory.chain import create_account_key
 from stests.core.factory.chain import create_block_on_addition
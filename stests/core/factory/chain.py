@@ -88,6 +88,16 @@ def create_account_for_run(
         )
 
 
+def create_accounts_for_run(
+    ctx: ExecutionContext,
+    indexes: typing.Iterable[int],
+    ) -> typing.List[Account]:
+    """Returns a batch of domain object instances: Account - suitable for execution within a worker process.
+
+    """
+    return [create_account_for_run(ctx, index) for index in indexes]
+
+
 def create_account_id(
     index: int,
     network: str,
@@ -16,7 +16,7 @@ def encode(data: MessageData) -> bytes:
     :returns: Bytestream for dispatch.
     
     """
-    return _encoder.as_json(data)
+    return _encoder.as_bytes(data)
 
 
 def decode(data: bytes) -> MessageData:
@@ -26,7 +26,7 @@ def decode(data: bytes) -> MessageData:
     :returns: Message data for further processing.
 
     """
-    return _encoder.from_json(data.decode("utf-8"))
+    return _encoder.from_bytes(data)
 
 
 def initialise():
@@ -1,7 +1,6 @@
 import dramatiq
 
 from stests.core import cache
-from stests.core import factory
 from stests.core.logging import log_event
 from stests.core.orchestration import predicates
 from stests.core.orchestration.model import Workflow
@@ -32,11 +31,9 @@ def do_phase(ctx: ExecutionContext):
     ctx.phase_index += 1
     ctx.step_index = 0
 
-    # Update cache.
-    cache.orchestration.set_context(ctx)
-    cache.orchestration.set_info(factory.create_execution_info(
-        ExecutionAspect.PHASE, ctx
-        ))
+    # Update cache - escape if phase locked.
+    if not predicates.was_lock_acquired(ExecutionAspect.PHASE, ctx):
+        return
 
     # Notify.
     log_event(EventType.WFLOW_PHASE_START, None, ctx)
@@ -103,10 +100,6 @@ def _can_start(ctx: ExecutionContext) -> bool:
     if phase is None:
         log_event(EventType.WFLOW_PHASE_ABORT, None, ctx)
         return False
-
-    # False if next phase locked.
-    if not predicates.was_lock_acquired(ExecutionAspect.PHASE, ctx):
-        return False
     
     # All tests passed, therefore return true.    
     return True
\ No newline at end of file
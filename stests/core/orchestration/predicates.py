@@ -40,10 +40,10 @@ def is_valid_wflow(ctx: ExecutionContext) -> typing.Tuple[typing.Optional[Workfl
 
 
 def was_lock_acquired(aspect: ExecutionAspect, ctx: ExecutionContext) -> bool:
-    """Returns flag indicating whether an execution lock was acquired.
+    """Returns flag indicating whether an execution lock was acquired - if so execution context & info are cached atomically.
     
     :param aspect: Aspect of execution in scope.
-    :param ctx: Execution context information.
+    :param ctx: Execution context information - incremented to aspect being locked.
 
     :returns: Flag indicating whether an execution lock was acquired
 
@@ -63,12 +63,10 @@ def was_lock_acquired(aspect: ExecutionAspect, ctx: ExecutionContext) -> bool:
     if aspect == ExecutionAspect.RUN:
         lock = _create_lock()
     elif aspect == ExecutionAspect.PHASE:
-        lock = _create_lock(ctx.next_phase_index)
+        lock = _create_lock(ctx.phase_index)
     elif aspect == ExecutionAspect.STEP:
-        lock = _create_lock(ctx.phase_index, ctx.next_step_index)
+        lock = _create_lock(ctx.phase_index, ctx.step_index)
     else:
         return False
 
-    _, acquired = cache.orchestration.set_lock(aspect, lock)
-
-    return acquired
+    return cache.orchestration.set_lock_with_context(aspect, lock, ctx)
@@ -1,10 +1,11 @@
 import dramatiq
 
 from stests.core import cache
-from stests.core import factory
+from stests.core import crypto
 from stests.core.logging import log_event
 from stests.core.orchestration import predicates
 from stests.core.orchestration.phase import do_phase
+from stests.core.types.chain import get_pem_file_namespace
 from stests.core.types.orchestration import ExecutionAspect
 from stests.core.types.orchestration import ExecutionContext
 from stests.core.types.orchestration import ExecutionMode
@@ -35,18 +36,16 @@ def do_run(ctx: ExecutionContext):
     if not _can_start(ctx):
         return
     
-    # Enqueue next run (when mode=PERIODIC).
-    if ctx.execution_mode == ExecutionMode.PERIODIC:
-        _loop(encoder.clone(ctx))
-
     # Update ctx.
     ctx.status = ExecutionStatus.IN_PROGRESS
 
-    # Update cache.
-    cache.orchestration.set_context(ctx)
-    cache.orchestration.set_info(factory.create_execution_info(
-        ExecutionAspect.RUN, ctx
-        ))
+    # Update cache - escape if run locked.
+    if not predicates.was_lock_acquired(ExecutionAspect.RUN, ctx):
+        return
+
+    # Enqueue next run (when mode=PERIODIC).
+    if ctx.execution_mode == ExecutionMode.PERIODIC:
+        _loop(encoder.clone(ctx))
 
     # Notify.
     log_event(EventType.WFLOW_RUN_START, None, ctx)
@@ -76,6 +75,7 @@ def on_run_end(ctx: ExecutionContext):
     if bool(ctx.prune_on_completion):
         cache.orchestration.prune_on_run_completion(ctx)   
         cache.state.prune_on_run_completion(ctx)
+        crypto.delete_pvk_pem_files(get_pem_file_namespace(ctx.network, ctx.run_type, ctx.run_index))
 
     # Notify.
     log_event(EventType.WFLOW_RUN_END, None, ctx)
@@ -122,10 +122,6 @@ def _can_start(ctx: ExecutionContext) -> bool:
         log_event(EventType.WFLOW_RUN_ABORT, None, ctx)
         return False
 
-    # False if locked.
-    if not predicates.was_lock_acquired(ExecutionAspect.RUN, ctx):
-        return False
-
     # All tests passed, therefore return true.    
     return True
 
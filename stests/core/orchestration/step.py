@@ -4,7 +4,6 @@ import time
 import dramatiq
 
 from stests.core import cache
-from stests.core import factory
 from stests.core.logging import log_event
 from stests.core.mq.extensions import MessageGroup
 from stests.core.orchestration.model import Workflow
@@ -45,9 +44,9 @@ def do_step(ctx: ExecutionContext):
     ctx.step_index += 1
     ctx.step_label = step.label
 
-    # Update cache.
-    cache.orchestration.set_context(ctx)
-    cache.orchestration.set_info(factory.create_execution_info(ExecutionAspect.STEP, ctx))
+    # Update cache - escape if step locked, which can happen when processing groups of messages.
+    if not predicates.was_lock_acquired(ExecutionAspect.STEP, ctx):
+        return
 
     # Notify.
     log_event(EventType.WFLOW_STEP_START, None, ctx)
@@ -155,7 +154,7 @@ def on_step_deploy_finalized(ctx: ExecutionContext, node_id: NodeIdentifier, blo
     # Increment verified deploy counts.
     _, _, deploy_index = cache.orchestration.increment_deploy_counts(ctx)
 
-    # Verify deploy batch is complete.
+    # Verify deploy batch is complete - counts are incremented atomically thus only one worker observes completion.
     try:
         step.verify_deploy_batch_is_complete(ctx, deploy_index)
     except:
@@ -197,10 +196,6 @@ def _can_start(ctx: ExecutionContext) -> bool:
     if step is None:
         log_event(EventType.WFLOW_STEP_ABORT, "invalid step index", ctx)
         return False
-
-    # False if next step locked - can happen when processing groups of messages.
-    if not predicates.was_lock_acquired(ExecutionAspect.STEP, ctx):
-        return False
     
     # All tests passed, therefore return true.    
     return True
@@ -1,5 +1,7 @@
 from stests.core.types.chain.account import Account
 from stests.core.types.chain.account import AccountIdentifier
+from stests.core.types.chain.account import get_pem_file_namespace
+from stests.core.types.chain.account import PEM_FILE_NAMESPACE_RUNS
 from stests.core.types.chain.block import Block
 from stests.core.types.chain.block import BlockStatistics
 from stests.core.types.chain.deploy import Deploy
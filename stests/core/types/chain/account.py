@@ -6,6 +6,11 @@ from stests.core.types.chain.enums import AccountType
 
 
 
+# Parent of namespaces under which PEM files of a run's accounts are cached - swept when stale.
+# N.B. network & default namespaces hold a bounded set of files (keyed by account hash) reused across runs & so are not swept.
+PEM_FILE_NAMESPACE_RUNS = "runs"
+
+
 @dataclasses.dataclass
 class Account:
     """A non-designated account that maps to an address upon target chain.
@@ -60,16 +65,31 @@ class Account:
     def label_run_index(self):
         return f"R-{str(self.run_index).zfill(3)}"
 
+    @property
+    def pem_file_namespace(self):
+        if self.is_run_account:
+            return get_pem_file_namespace(self.network, self.run_type, self.run_index)
+        return self.network or "default"
+
     def get_private_key_pem_filepath(self):
-        """Returns path to associated pem file.
+        """Returns path to associated (cached) pem file.
         
         """
-        return crypto.get_pvk_pem_file_from_bytes(
+        return crypto.get_pvk_pem_file(
             bytes.fromhex(self.private_key),
             crypto.KeyAlgorithm[self.key_algo],
+            self.account_hash,
+            self.pem_file_namespace,
             )
 
 
+def get_pem_file_namespace(network: str, run_type: str, run_index: int) -> str:
+    """Returns namespace under which PEM files of a run's accounts are cached.
+
+    """
+    return f"{PEM_FILE_NAMESPACE_RUNS}/{network}-{run_type}-R-{str(run_index).zfill(3)}"
+
+
 @dataclasses.dataclass
 class AccountIdentifier:
     """Information required to disambiguate between accounts.
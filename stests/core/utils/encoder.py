@@ -7,10 +7,26 @@ import typing
 import typing_inspect
 
 from stests.core.logging import log_event
+from stests.core.utils import env
 from stests.events import EventType
 
+# Optional msgpack codec backend - imported once, required only when selected.
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 
+
+# Environment variables required by this module.
+class EnvVars:
+    # Codec used to serialise encoded data (json | msgpack).
+    CODEC = env.get_var('CODEC', "json", str.lower)
+
+
+# Marker prefixing msgpack payloads - 0xc1 is never emitted by msgpack & never leads a JSON document.
+_MSGPACK_MARKER = b'\xc1'
+
 # Initialisation flag.
 IS_INITIALISED = False
 
@@ -29,6 +45,29 @@ DCLASS_SET = set()
 # Set: primitive data types.
 PRIMITIVES = (type(None), int, str, float, bool)
 
+# Map: dataclass type -> precompiled encoding/decoding plan.
+_PLANS = dict()
+
+
+class _Plan():
+    """Encoding/decoding plan compiled once per registered data class.
+    
+    """
+    def __init__(self, cls):
+        self.type_key = f"{cls.__module__}.{cls.__name__}"
+
+        # Resolve field types once - string annotations are resolved against declaring module.
+        try:
+            hints = typing.get_type_hints(cls)
+        except Exception:
+            hints = dict()
+
+        # Set field converters: (field name, encoder, decoder).
+        self.fields = []
+        for field in dataclasses.fields(cls):
+            field_type = _get_field_type(hints.get(field.name, field.type))
+            self.fields.append((field.name, ) + _get_field_converters(field_type))
+
 
 def as_dict(data: typing.Any) -> typing.Any:
     """Encodes input data in readiness for downstream processing.
@@ -37,11 +76,23 @@ def as_dict(data: typing.Any) -> typing.Any:
     return encode(data)
 
 
+def as_bytes(data: typing.Any) -> bytes:
+    """Encodes input data using configured codec.
+    
+    """
+    try:
+        serialiser = _SERIALISERS[EnvVars.CODEC]
+    except KeyError:
+        raise ValueError(f"Unsupported codec: {EnvVars.CODEC}")
+
+    return serialiser(encode(data))
+
+
 def as_json(data: typing.Any) -> str:
     """Encodes input data as JSON.
     
     """
-    return json.dumps(encode(data), indent=4).encode("utf-8")
+    return _to_json(encode(data))
 
 
 def from_dict(obj: typing.Any) -> typing.Any:
@@ -51,6 +102,16 @@ def from_dict(obj: typing.Any) -> typing.Any:
     return decode(obj)
 
 
+def from_bytes(data: bytes) -> typing.Any:
+    """Decodes input data - codec is inferred from payload so that previously encoded JSON remains decodable.
+    
+    """
+    if data[:1] == _MSGPACK_MARKER:
+        return decode(_from_msgpack(data))
+
+    return decode(json.loads(data))
+
+
 def from_json(as_json: str) -> typing.Any:
     """Encodes input data as JSON.
     
@@ -58,6 +119,50 @@ def from_json(as_json: str) -> typing.Any:
     return decode(json.loads(as_json))
 
 
+def _from_msgpack(data: bytes) -> typing.Any:
+    """Deserialises a marked msgpack payload.
+    
+    """
+    _assert_msgpack()
+
+    return msgpack.unpackb(data[1:], raw=False, strict_map_key=False)
+
+
+def _assert_msgpack():
+    """Raises if msgpack codec is in use but its backend is not installed.
+    
+    """
+    if msgpack is None:
+        raise ImportError("msgpack codec requires the msgpack package to be installed")
+
+
+def _to_json(obj: typing.Any) -> bytes:
+    """Serialises encoded data as compact JSON.
+    
+    """
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _to_msgpack(obj: typing.Any) -> bytes:
+    """Serialises encoded data as marked msgpack.
+    
+    """
+    _assert_msgpack()
+
+    try:
+        return _MSGPACK_MARKER + msgpack.packb(obj, use_bin_type=True)
+    # Integers beyond 64 bits (e.g. motes) are unsupported by msgpack - JSON remains decodable.
+    except OverflowError:
+        return _to_json(obj)
+
+
+# Map: codec name -> serialiser.
+_SERIALISERS = {
+    "json": _to_json,
+    "msgpack": _to_msgpack,
+}
+
+
 def clone(data: typing.Any) -> typing.Any:
     """Returns a clone of a data class.
     
@@ -97,45 +202,43 @@ def _decode_dclass(obj):
     # Set data class type.
     dcls = DCLASS_MAP[obj['_type_key']]
 
-    # Convert fields:
-    for field in dataclasses.fields(dcls):
-        if field.name not in obj:
-            continue
+    # Convert fields.
+    kwargs = dict()
+    for name, _, decoder in _PLANS[dcls].fields:
+        if name in obj:
+            value = obj[name]
+            kwargs[name] = value if value is None else decoder(value)
 
-        field_value = obj[field.name]
-        if isinstance(field_value, type(None)):
-            continue 
+    return dcls(**kwargs)
 
-        field_type = _get_field_type(field)
-        if field_type is datetime.datetime:
-            obj[field.name] = datetime.datetime.fromtimestamp(field_value)
 
-        elif field.type in ENUM_TYPE_SET:
-            obj[field.name] = field.type[obj[field.name]]
+def _get_field_converters(field_type) -> typing.Tuple[typing.Callable, typing.Callable]:
+    """Returns encoder/decoder functions to apply to values of a dataclass field.
     
-        elif field_type in DCLASS_SET:
-            obj[field.name] = _decode_dclass(obj[field.name])
+    """
+    if field_type is datetime.datetime:
+        return lambda v, _: v.timestamp(), datetime.datetime.fromtimestamp
 
-        else:
-            obj[field.name] = decode(obj[field.name])
+    if inspect.isclass(field_type) and issubclass(field_type, enum.Enum):
+        return lambda v, _: v.name, lambda v: field_type[v]
 
-    # Remove type key as it has served it's purpose.
-    del obj['_type_key']
+    if dataclasses.is_dataclass(field_type):
+        return _encode_dclass, _decode_dclass
 
-    return dcls(**obj)
+    return encode, decode
 
 
-def _get_field_type(field):
+def _get_field_type(field_type):
     """Returns a dataclass field type.
     
     """
-    # For optional fields the dataclass type annotation Union needs to be deconstruacture.
-    if typing_inspect.get_origin(field.type) is typing.Union:
-        type_args = typing_inspect.get_args(field.type)
+    # For optional fields the dataclass type annotation Union needs to be deconstructed.
+    if typing_inspect.get_origin(field_type) is typing.Union:
+        type_args = typing_inspect.get_args(field_type)
         for type_arg in [i for i in type_args if i not in (type(None), )]:
             return type_arg
     else:
-        return field.type
+        return field_type
 
 
 def encode(data: typing.Any, requires_decoding=True) -> typing.Any:
@@ -157,8 +260,8 @@ def encode(data: typing.Any, requires_decoding=True) -> typing.Any:
     if isinstance(data, list):
         return list(map(lambda i: encode(i, requires_decoding), data))
 
-    if type(data) in DCLASS_SET:
-        return _encode_dclass(data, dataclasses.asdict(data), requires_decoding)
+    if type(data) in _PLANS:
+        return _encode_dclass(data, requires_decoding)
 
     if type(data) in ENUM_TYPE_SET:
         return data.name
@@ -168,25 +271,23 @@ def encode(data: typing.Any, requires_decoding=True) -> typing.Any:
     return data
 
 
-def _encode_dclass(data, obj, requires_decoding):
+def _encode_dclass(data, requires_decoding=True):
     """Encodes a data class that has been previously registered with the encoder.
     
     """
-    # Inject typekey for subsequent roundtrip.
-    if requires_decoding:
-        obj['_type_key'] = f"{data.__module__}.{data.__class__.__name__}"
-
-    # Set fields to be encoded.
-    fields = [i for i in dir(data) if i in obj and not i.startswith('_')]
+    plan = _PLANS[type(data)]
 
-    # Recurse through properties that are also registered data classes.
-    fields_dcls = [i for i in fields if type(getattr(data, i)) in DCLASS_SET]
-    for field in fields_dcls:
-        _encode_dclass(getattr(data, field), obj[field], requires_decoding)
+    # Convert fields - nested data classes (incl. within collections) are encoded via their own plans.
+    obj = dict()
+    for name, encoder, _ in plan.fields:
+        value = getattr(data, name)
+        obj[name] = value if value is None else encoder(value, requires_decoding)
 
-    # TODO: handle lists of dclasses
+    # Inject typekey for subsequent roundtrip.
+    if requires_decoding:
+        obj['_type_key'] = plan.type_key
 
-    return encode(obj, requires_decoding)
+    return obj
 
 
 def register_type(cls):
@@ -203,6 +304,8 @@ def register_type(cls):
     else:
         DCLASS_MAP[f"{cls.__module__}.{cls.__name__}"] = cls
         DCLASS_SET = DCLASS_SET | { cls, }
+        if dataclasses.is_dataclass(cls):
+            _PLANS[cls] = _Plan(cls)
 
 
 def initialise():
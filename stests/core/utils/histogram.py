@@ -0,0 +1,171 @@
+import math
+import typing
+
+
+
+# Relative accuracy of percentile estimates.
+RELATIVE_ACCURACY = 0.01
+
+# Ratio between consecutive bucket boundaries.
+_GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+
+# Smallest distinguishable value (in seconds) - smaller values are accumulated within lowest bucket.
+_MIN_VALUE = 0.001
+
+# Prefix of hash fields holding bucket counts.
+_BUCKET_PREFIX = "b:"
+
+# Prefix of hash fields holding labels.
+_LABEL_PREFIX = "l:"
+
+
+class Histogram():
+    """A mergeable histogram of log scaled buckets whereby percentile estimates are within relative accuracy of actual values.
+
+    """
+    def __init__(self):
+        # Map: bucket -> count.
+        self.buckets: typing.Dict[int, int] = dict()
+        self.count = 0
+        self.first_at = None
+        self.labels: typing.Dict[str, str] = dict()
+        self.last_at = None
+        self.maxima = None
+        self.minima = None
+        self.sum = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else None
+
+    @property
+    def tps(self) -> float:
+        """Samples per second over span between first sample start & last sample end."""
+        if self.count and self.last_at is not None and self.last_at > self.first_at:
+            return self.count / (self.last_at - self.first_at)
+
+    def get_percentile(self, quantile: float) -> float:
+        """Returns estimated value at a quantile.
+
+        :param quantile: Quantile in range [0, 1].
+
+        :returns: Estimated value - clamped to observed range.
+
+        """
+        if not self.count:
+            return None
+
+        rank = quantile * (self.count - 1)
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen > rank:
+                return min(max(get_bucket_value(bucket), self.minima), self.maxima)
+
+        return self.maxima
+
+    def merge(self, other: "Histogram") -> "Histogram":
+        """Merges another histogram into this one.
+
+        :param other: Histogram to be merged.
+
+        :returns: This histogram.
+
+        """
+        for bucket, count in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+        self.count += other.count
+        self.sum += other.sum
+        self.first_at = _reduce(min, self.first_at, other.first_at)
+        self.last_at = _reduce(max, self.last_at, other.last_at)
+        self.maxima = _reduce(max, self.maxima, other.maxima)
+        self.minima = _reduce(min, self.minima, other.minima)
+
+        return self
+
+
+def get_bucket(value: float) -> int:
+    """Returns index of bucket within which a value is accumulated.
+
+    :param value: Value (in seconds) being sampled.
+
+    :returns: Bucket index.
+
+    """
+    return math.ceil(math.log(max(value, _MIN_VALUE) / _MIN_VALUE, _GAMMA))
+
+
+def get_bucket_field(value: float) -> str:
+    """Returns name of hash field holding count of bucket within which a value is accumulated.
+
+    :param value: Value (in seconds) being sampled.
+
+    :returns: Hash field name.
+
+    """
+    return f"{_BUCKET_PREFIX}{get_bucket(value)}"
+
+
+def get_bucket_value(bucket: int) -> float:
+    """Returns representative value of a bucket - i.e. value with minimal relative error over bucket's range.
+
+    :param bucket: Bucket index.
+
+    :returns: Representative value (in seconds).
+
+    """
+    return _MIN_VALUE * 2 * _GAMMA ** bucket / (_GAMMA + 1)
+
+
+def get_label_field(name: str) -> str:
+    """Returns name of hash field holding a label.
+
+    :param name: Label name.
+
+    :returns: Hash field name.
+
+    """
+    return f"{_LABEL_PREFIX}{name}"
+
+
+def from_fields(fields: typing.Dict[str, str]) -> Histogram:
+    """Returns a histogram decoded from hash fields.
+
+    :param fields: Map: hash field -> value.
+
+    :returns: A histogram.
+
+    """
+    histogram = Histogram()
+    for field, value in fields.items():
+        if field.startswith(_BUCKET_PREFIX):
+            histogram.buckets[int(field[len(_BUCKET_PREFIX):])] = int(value)
+        elif field.startswith(_LABEL_PREFIX):
+            histogram.labels[field[len(_LABEL_PREFIX):]] = value
+    histogram.count = int(fields.get("count", 0))
+    histogram.sum = float(fields.get("sum", 0))
+    histogram.first_at = _parse_float(fields.get("first"))
+    histogram.last_at = _parse_float(fields.get("last"))
+    histogram.maxima = _parse_float(fields.get("max"))
+    histogram.minima = _parse_float(fields.get("min"))
+
+    return histogram
+
+
+def _parse_float(value: typing.Optional[str]) -> typing.Optional[float]:
+    """Returns parsed optional float.
+
+    """
+    return None if value is None else float(value)
+
+
+def _reduce(func: typing.Callable, a: typing.Optional[float], b: typing.Optional[float]) -> typing.Optional[float]:
+    """Returns reduction of a pair of optional values.
+
+    """
+    if a is None:
+        return b
+    if b is None:
+        return a
+
+    return func(a, b)
@@ -10,6 +10,7 @@ class EventType(enum.Enum):
     """
     # Core sub-system.
     CORE_BROKER_CONNECTION_ESTABLISHED = enum.auto()
+    CORE_CACHE_METRICS = enum.auto()
     CORE_ENCODING_FAILURE = enum.auto()
     CORE_ACTOR_ERROR = enum.auto()
 
@@ -37,6 +38,9 @@ class EventType(enum.Enum):
     MONIT_CONSENSUS_FINALITY_SIGNATURE = enum.auto()
     MONIT_DEPLOY_EXECUTION_ERROR = enum.auto()
     MONIT_DEPLOY_PROCESSED = enum.auto()
+    MONIT_EVENT_PROCESSING_ERROR = enum.auto()
+    MONIT_NODE_METRICS_SAMPLING_ERROR = enum.auto()
+    MONIT_SHARD_REBALANCE_ERROR = enum.auto()
     MONIT_STEP = enum.auto()
     MONIT_STREAM_BIND_ERROR = enum.auto()
     MONIT_STREAM_EVENT_TYPE_UNKNOWN = enum.auto()
@@ -61,6 +65,7 @@ class EventType(enum.Enum):
     WFLOW_STEP_END = enum.auto()
     WFLOW_STEP_ERROR = enum.auto()
     WFLOW_STEP_FAILURE = enum.auto()
+    WFLOW_STEP_PROGRESS = enum.auto()
     WFLOW_STEP_START = enum.auto()
     WFLOW_INVALID = enum.auto()
     WFLOW_GENERATOR_LAUNCHED = enum.auto()
@@ -80,6 +85,8 @@ EVENTS_ERROR = (
     EventType.CHAIN_QUERY_BLOCK_NOT_FOUND,
     EventType.CHAIN_QUERY_DEPLOY_NOT_FOUND,
     EventType.MONIT_DEPLOY_EXECUTION_ERROR,
+    EventType.MONIT_EVENT_PROCESSING_ERROR,
+    EventType.MONIT_SHARD_REBALANCE_ERROR,
     EventType.MONIT_STREAM_BIND_ERROR,
     EventType.WFLOW_DEPLOY_DISPATCH_ERROR,
     EventType.WFLOW_RUN_ERROR,
@@ -93,6 +100,7 @@ EVENTS_WARN = (
     EventType.CORE_ENCODING_FAILURE,
     EventType.CHAIN_QUERY_BALANCE_NOT_FOUND,
     EventType.WFLOW_DEPLOY_DISPATCH_FAILURE,
+    EventType.MONIT_NODE_METRICS_SAMPLING_ERROR,
     EventType.MONIT_STREAM_EVENT_TYPE_UNKNOWN,
     EventType.WFLOW_RUN_ABORT,
     EventType.WFLOW_PHASE_ABORT,
@@ -140,7 +148,7 @@ def get_event_info(event_type: EventType, message: typing.Union[BaseException, s
     sub_system = event_type.name.split('_')[0]
 
     if sub_system == "CORE":
-        event_id, data = event_type.value, dict()
+        event_id, data = event_type.value, args[0] if args else dict()
     elif sub_system == "CHAIN":
         event_id, message, data = _get_event_info_chaininfo(event_type, message, *args, **kwargs)
     elif sub_system == "MONIT":
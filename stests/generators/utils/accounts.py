@@ -1,15 +1,20 @@
+import concurrent.futures
+import functools
+import multiprocessing
 import typing
 import dramatiq
 
 from stests import chain
 from stests.core import cache
 from stests.core import factory
+from stests.core.logging import log_event
 from stests.core.types.chain import Account
 from stests.core.types.chain import AccountType
 from stests.core.types.chain import DeployType
 from stests.core.types.infra import Node
 from stests.core.types.infra import Network
 from stests.core.types.orchestration import ExecutionContext
+from stests.events import EventType
 from stests.generators.utils import constants
 from stests.generators.utils.infra import get_network_node
 
@@ -21,6 +26,12 @@ _QUEUE = "orchestration.generators.accounts"
 # Account index: network faucet.
 ACC_NETWORK_FAUCET_INDEX = 0
 
+# Number of accounts created & cached per provisioning chunk.
+PROVISIONING_CHUNK_SIZE = 500
+
+# Minimum number of accounts for which key pair generation is spread across a process pool.
+PROVISIONING_POOL_THRESHOLD = 2000
+
 # Map of transfer types to handling functions.
 TFR_TYPE_TO_TFR_FN = {
     DeployType.TRANSFER_WASM: chain.set_transfer_wasm,
@@ -79,23 +90,24 @@ def do_transfer(
     dispatch_fn = TFR_TYPE_TO_TFR_FN[DeployType[transfer_type]]
     deploy_hash, dispatch_duration, dispatch_attempts = dispatch_fn(dispatch_info, cp2, amount)
 
-    # Update cache: deploy.
-    cache.state.set_deploy(factory.create_deploy_for_run(
-        ctx=ctx, 
-        account=cp1,
-        associated_account=cp2,
-        node=node, 
-        deploy_hash=deploy_hash, 
-        dispatch_attempts=dispatch_attempts,
-        dispatch_duration=dispatch_duration,
-        typeof=DeployType[transfer_type]
-        ))
-
-    # Update cache: account balances.
-    if cp1.is_run_account:
-        cache.state.decrement_account_balance(cp1, amount)
-    if cp2.is_run_account:
-        cache.state.increment_account_balance(cp2, amount)
+    with cache.batch():
+        # Update cache: deploy.
+        cache.state.set_deploy(factory.create_deploy_for_run(
+            ctx=ctx, 
+            account=cp1,
+            associated_account=cp2,
+            node=dispatch_info.node, 
+            deploy_hash=deploy_hash, 
+            dispatch_attempts=dispatch_attempts,
+            dispatch_duration=dispatch_duration,
+            typeof=DeployType[transfer_type]
+            ))
+
+        # Update cache: account balances.
+        if cp1.is_run_account:
+            cache.state.decrement_account_balance(cp1, amount)
+        if cp2.is_run_account:
+            cache.state.increment_account_balance(cp2, amount)
 
    
 def do_transfer_fire_forget(
@@ -121,6 +133,43 @@ def do_transfer_fire_forget(
     cache.orchestration.increment_deploy_counts(ctx, 1)
 
 
+def set_accounts_for_run(ctx: ExecutionContext, account_indexes: typing.Iterable[int]):
+    """Creates & caches run accounts in bulk.
+
+    Key pairs & account hashes are generated in chunks across a process pool whilst
+    previously generated chunks are cached via pipelined writes.
+
+    :param ctx: Execution context information.
+    :param account_indexes: Run specific indexes of accounts to be created.
+    
+    """
+    account_indexes = list(account_indexes)
+    chunks = [account_indexes[i:i + PROVISIONING_CHUNK_SIZE] for i in range(0, len(account_indexes), PROVISIONING_CHUNK_SIZE)]
+    create_accounts = functools.partial(factory.create_accounts_for_run, ctx)
+
+    # Small account sets do not warrant worker start-up costs.
+    if len(account_indexes) < PROVISIONING_POOL_THRESHOLD:
+        _set_accounts(ctx, map(create_accounts, chunks), len(account_indexes))
+        return
+
+    # N.B. workers are spawned as forking a multi-threaded actor process is unsafe.
+    with concurrent.futures.ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as executor:
+        _set_accounts(ctx, executor.map(create_accounts, chunks), len(account_indexes))
+
+
+def _set_accounts(ctx: ExecutionContext, chunks: typing.Iterator[typing.List[Account]], total: int):
+    """Caches chunks of accounts - one pipeline per chunk - reporting progress.
+    
+    """
+    count = 0
+    for accounts in chunks:
+        with cache.batch():
+            for account in accounts:
+                cache.state.set_account(account)
+        count += len(accounts)
+        log_event(EventType.WFLOW_STEP_PROGRESS, f"accounts cached: {count} of {total}", ctx)
+
+
 def get_account(ctx: ExecutionContext, network: Network, account_index: int) -> Account:
     """Returns either a faucet account or a user account.
     
@@ -68,7 +68,7 @@ def _do_delegate_action(ctx: ExecutionContext, account_index: int, amount: int,
     cache.state.set_deploy(factory.create_deploy_for_run(
         ctx=ctx, 
         account=user,
-        node=node, 
+        node=dispatch_info.node, 
         deploy_hash=deploy_hash, 
         dispatch_attempts=dispatch_attempts,
         dispatch_duration=dispatch_duration,
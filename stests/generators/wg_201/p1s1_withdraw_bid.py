@@ -38,7 +38,7 @@ def execute(ctx: ExecutionContext):
     cache.state.set_deploy(factory.create_deploy_for_run(
         ctx=ctx, 
         account=validator.account,
-        node=node, 
+        node=dispatch_info.node, 
         deploy_hash=deploy_hash, 
         dispatch_attempts=dispatch_attempts,
         dispatch_duration=dispatch_duration,
@@ -0,0 +1,95 @@
+import collections
+import time
+import typing
+
+from stests.core import cache
+from stests.core.types.infra import Node
+from stests.core.utils import env
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Minimum interval (in seconds) between persisting a node's last processed event identifier.
+    INTERVAL = env.get_var('MONITORING_CHECKPOINT_INTERVAL', 5, int)
+
+
+class NodeEventCheckpoint():
+    """Tracks last event processed from a node's event stream so that streams can be resumed after a rebind.
+
+    """
+    def __init__(self, node: Node, event_id: int = None):
+        """Constructor.
+
+        :param node: Node being monitored.
+        :param event_id: Identifier of last processed event - defaults to persisted checkpoint.
+
+        """
+        if event_id is None:
+            checkpoint = cache.monitoring.get_node_event_checkpoint(node)
+            event_id = checkpoint["event_id"] if checkpoint else None
+
+        self.event_id = event_id
+        self.event_id_persisted = event_id
+        self.node = node
+        self.persisted_at = time.monotonic()
+
+        # Map: event id -> processed flag - in order of dispatch.
+        self._in_flight = collections.OrderedDict()
+
+    @property
+    def is_dirty(self) -> bool:
+        return self.event_id != self.event_id_persisted
+
+    @property
+    def is_due(self) -> bool:
+        return self.is_dirty and time.monotonic() - self.persisted_at >= EnvVars.INTERVAL
+
+    @property
+    def start_from(self) -> int:
+        return self.event_id + 1 if self.event_id is not None else 0
+
+    def on_event_dispatched(self, event_id: typing.Optional[int]):
+        """Registers an event pending processing.
+
+        :param event_id: Identifier of dispatched event.
+
+        """
+        if event_id is not None:
+            self._in_flight.setdefault(event_id, False)
+
+    def on_event_processed(self, event_id: typing.Optional[int]):
+        """Registers a processed event - checkpoint only advances once all previously dispatched events are processed.
+
+        :param event_id: Identifier of processed event.
+
+        """
+        if event_id not in self._in_flight:
+            return
+
+        self._in_flight[event_id] = True
+        while self._in_flight and next(iter(self._in_flight.values())):
+            self.event_id, _ = self._in_flight.popitem(last=False)
+
+    def persist(self):
+        """Persists checkpoint to cache.
+
+        """
+        if self.is_dirty:
+            cache.monitoring.set_node_event_checkpoint(self.node, self.event_id)
+            self.event_id_persisted = self.event_id
+        self.persisted_at = time.monotonic()
+
+
+def persist(checkpoints: typing.Iterable[NodeEventCheckpoint], force: bool = False):
+    """Persists checkpoints in a single batch.
+
+    :param checkpoints: Checkpoints to be persisted.
+    :param force: Flag indicating whether to persist irrespective of interval since last write.
+
+    """
+    checkpoints = [i for i in checkpoints if (i.is_dirty if force else i.is_due)]
+    if checkpoints:
+        with cache.batch():
+            for checkpoint in checkpoints:
+                checkpoint.persist()
@@ -8,14 +8,26 @@ from dramatiq.middleware import Shutdown
 from stests.core import cache
 from stests.core import factory
 from stests.core.logging import log_event
+from stests.core.types.infra import NetworkIdentifier
 from stests.core.types.infra import NodeIdentifier
 from stests.core.types.infra import NodeMonitoringLock
 from stests.core.utils.env import get_var
+from stests.monitoring import coordinator
 from stests.monitoring import listener
+from stests.monitoring import node_metrics
 from stests.events import EventType
 
 
 
+# Environment variables required by this module.
+class EnvVars:
+    # Flag indicating whether all of a network's nodes are monitored from a single actor via an asyncio event stream multiplexer.
+    MULTIPLEXED = get_var('MONITORING_MULTIPLEXED', 0, int)
+
+    # Number of monitor shards across which a network's nodes are assigned - 0 = unsharded.
+    SHARDS = get_var('MONITORING_SHARDS', 0, int)
+
+
 # Queue to which messages will be dispatched.
 _QUEUE = "monitoring.control"
 
@@ -25,7 +37,10 @@ _MONITORS_PER_NODE = 1
 # Time limit for node monitoring actor.
 _60_MINUTES_IN_MS = 3600000
 
-# Maximum number of nodes to monitor.
+# Time for which a multiplexed network monitor follows streams - less than actor time limit so as to exit cleanly.
+_55_MINUTES_IN_SECONDS = 3300
+
+# Maximum number of nodes to monitor - when not multiplexed.
 _MAX_NODES = 5
 
 
@@ -36,6 +51,15 @@ def do_start_monitoring():
     """
     for network in cache.infra.get_networks():
         network_id = factory.create_network_id(network.name)
+        if node_metrics.EnvVars.INTERVAL > 0:
+            do_sample_node_metrics.send(network_id)
+        if EnvVars.SHARDS > 0:
+            for shard_index in range(1, EnvVars.SHARDS + 1):
+                do_monitor_shard.send(network_id, shard_index)
+            continue
+        if EnvVars.MULTIPLEXED:
+            do_monitor_network.send(network_id)
+            continue
         for node in cache.infra.get_nodes_for_monitoring(network, _MAX_NODES):
             do_monitor_node.send(
                 factory.create_node_id(network_id, node.index),
@@ -50,16 +74,9 @@ def do_monitor_node(node_id: NodeIdentifier):
     :node_id: Identifier of node to be monitored.
 
     """
-    # Set lock.
-    locked = False
-    for i in range(_MONITORS_PER_NODE):
-        lock = factory.create_node_monitoring_lock(node_id, i + 1)
-        _, lock_acquired = cache.monitoring.set_node_monitor_lock(lock)
-        if lock_acquired:
-            break
-
-    # Escape if sufficient locks are already in place.
-    if not lock_acquired:
+    # Set lock - escape if sufficient locks are already in place.
+    lock = _get_node_monitor_lock(node_id)
+    if not lock:
         return
 
     # Monitor node by listening to & processing node events.
@@ -84,3 +101,125 @@ def do_monitor_node(node_id: NodeIdentifier):
     # Release lock.
     finally:
         cache.monitoring.delete_node_monitor_lock(lock)
+
+
+@dramatiq.actor(queue_name=_QUEUE, notify_shutdown=True, time_limit=_60_MINUTES_IN_MS)
+def do_monitor_network(network_id: NetworkIdentifier):
+    """Launches multiplexed monitoring of a network's nodes from a single actor.
+
+    :network_id: Identifier of network to be monitored.
+
+    """
+    # Set locks - nodes locked by other monitors are skipped.
+    locks = []
+    nodes = []
+    for node in cache.infra.get_nodes_for_monitoring(network_id):
+        lock = _get_node_monitor_lock(factory.create_node_id(network_id, node.index))
+        if lock:
+            locks.append(lock)
+            nodes.append(node)
+
+    # Escape if all nodes are already monitored.
+    if not nodes:
+        return
+
+    # Monitor nodes by listening to & processing node events.
+    try:
+        listener.bind_to_streams(nodes, _55_MINUTES_IN_SECONDS)
+
+    # Exception: process shutdown.
+    except Shutdown:
+        return
+
+    # Exception: actor timeout.
+    except TimeLimitExceeded:
+        pass
+
+    # Exception: multiplexer failure.
+    except Exception as err:
+        log_event(EventType.MONIT_STREAM_BIND_ERROR, err, nodes[0])
+
+    # Release locks.
+    finally:
+        for lock in locks:
+            cache.monitoring.delete_node_monitor_lock(lock)
+
+    do_monitor_network.send(network_id)
+
+
+@dramatiq.actor(queue_name=_QUEUE, notify_shutdown=True, time_limit=_60_MINUTES_IN_MS)
+def do_monitor_shard(network_id: NetworkIdentifier, shard_index: int):
+    """Launches monitoring of those of a network's nodes assigned to a monitor shard.
+
+    :network_id: Identifier of network to be monitored.
+    :shard_index: Index of monitor shard.
+
+    """
+    # Join shard - escape if shard is already held by a live monitor.
+    shard = coordinator.MonitorShard(cache.infra.get_network(network_id), shard_index)
+    if not shard.join():
+        return
+
+    # Monitor assigned nodes by listening to & processing node events.
+    try:
+        listener.bind_to_shard(shard, _55_MINUTES_IN_SECONDS)
+
+    # Exception: process shutdown.
+    except Shutdown:
+        return
+
+    # Exception: actor timeout.
+    except TimeLimitExceeded:
+        pass
+
+    # Exception: multiplexer failure.
+    except Exception as err:
+        log_event(EventType.MONIT_SHARD_REBALANCE_ERROR, err, shard)
+
+    # Leave shard - assigned nodes are rebalanced across remaining shards.
+    finally:
+        shard.leave()
+
+    do_monitor_shard.send(network_id, shard_index)
+
+
+def _get_node_monitor_lock(node_id: NodeIdentifier) -> NodeMonitoringLock:
+    """Returns a lock over a node's monitor, or None if sufficient locks are already in place.
+
+    """
+    for i in range(_MONITORS_PER_NODE):
+        lock = factory.create_node_monitoring_lock(node_id, i + 1)
+        _, lock_acquired = cache.monitoring.set_node_monitor_lock(lock)
+        if lock_acquired:
+            return lock
+
+
+@dramatiq.actor(queue_name=_QUEUE, notify_shutdown=True, time_limit=_60_MINUTES_IN_MS)
+def do_sample_node_metrics(network_id: NetworkIdentifier):
+    """Launches periodic sampling of a network's node metrics.
+
+    :network_id: Identifier of network whose nodes are to be sampled.
+
+    """
+    # Escape if network is already being sampled.
+    _, lock_acquired = cache.monitoring.set_node_metrics_sampler_lock(network_id.name)
+    if not lock_acquired:
+        return
+
+    # Sample node metrics.
+    try:
+        node_metrics.execute(cache.infra.get_network(network_id), _55_MINUTES_IN_SECONDS)
+
+    # Exception: process shutdown.
+    except Shutdown:
+        return
+
+    # Exception: actor timeout.
+    except TimeLimitExceeded:
+        pass
+
+    # Release lock.
+    finally:
+        cache.monitoring.delete_node_metrics_sampler_lock(network_id.name)
+
+    do_sample_node_metrics.send(network_id)
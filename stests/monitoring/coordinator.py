@@ -0,0 +1,119 @@
+import hashlib
+import typing
+import uuid
+
+from stests.core import cache
+from stests.core.types.infra import Network
+from stests.core.types.infra import Node
+from stests.core.utils import env
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Interval (in seconds) between monitor shard heartbeats - upon each heartbeat leases are renewed & nodes rebalanced.
+    HEARTBEAT_INTERVAL = env.get_var('MONITORING_SHARD_HEARTBEAT_INTERVAL', 5, int)
+
+    # Time (in seconds) after which a lease expires unless renewed - i.e. time taken to rebalance a failed shard's nodes.
+    LEASE_DURATION = env.get_var('MONITORING_SHARD_LEASE_DURATION', 20, int)
+
+
+class MonitorShard():
+    """A member of a network's set of monitor shards - each node is assigned to exactly one live shard via rendezvous hashing.
+
+    """
+    def __init__(self, network: Network, index: int):
+        """Constructor.
+
+        :param network: Network being monitored.
+        :param index: Index of shard - a shard index is held by at most one monitor at a time.
+
+        """
+        self.index = index
+        self.network = network
+        self.token = uuid.uuid4().hex
+
+        # Map: node index -> node whose lease is held.
+        self.leased: typing.Dict[int, Node] = dict()
+
+    @property
+    def label_index(self) -> str:
+        return f"S-{str(self.index).zfill(4)}"
+
+    @property
+    def network_name(self) -> str:
+        return self.network.name
+
+    def heartbeat(self) -> typing.List[Node]:
+        """Renews shard membership & acquires or renews leases over assigned nodes.
+        N.B. leases over nodes no longer assigned are neither renewed nor released - see release.
+
+        :returns: Nodes whose lease is held, i.e. nodes to be monitored.
+
+        """
+        if not self.join():
+            self.leased = dict()
+            return []
+
+        shard_indexes = [i["shard_index"] for i in cache.monitoring.get_monitor_shard_leases(self.network.name)]
+        assigned = [
+            i for i in cache.infra.get_nodes_for_monitoring(self.network)
+            if get_shard_index(shard_indexes, self.network.name, i.index) == self.index
+            ]
+        with cache.batch() as results:
+            for node in assigned:
+                cache.monitoring.set_node_monitor_lease(self.network.name, node.index, self.index, self.token, EnvVars.LEASE_DURATION)
+        self.leased = {node.index: node for node, acquired in zip(assigned, results) if acquired}
+
+        return list(self.leased.values())
+
+    def join(self) -> bool:
+        """Acquires or renews shard membership.
+
+        :returns: Flag indicating whether shard membership is held.
+
+        """
+        return cache.monitoring.set_monitor_shard_lease(self.network.name, self.index, self.token, EnvVars.LEASE_DURATION)
+
+    def leave(self):
+        """Releases shard membership plus all held node leases.
+
+        """
+        self.release(list(self.leased.values()))
+        cache.monitoring.delete_monitor_shard_lease(self.network.name, self.index, self.token)
+
+    def release(self, nodes: typing.List[Node]):
+        """Releases leases over nodes no longer monitored - to be invoked once monitoring has ceased.
+
+        :param nodes: Nodes whose leases are to be released.
+
+        """
+        with cache.batch():
+            for node in nodes:
+                cache.monitoring.delete_node_monitor_lease(self.network.name, node.index, self.index, self.token)
+        for node in nodes:
+            self.leased.pop(node.index, None)
+
+
+def get_shard_index(shard_indexes: typing.List[int], network: str, node_index: int) -> typing.Optional[int]:
+    """Returns index of shard to which a node is assigned - i.e. shard with highest rendezvous weight.
+    When a shard joins or leaves only the nodes it gains or loses are reassigned.
+
+    :param shard_indexes: Indexes of live shards.
+    :param network: Name of network being monitored.
+    :param node_index: Index of node being monitored.
+
+    :returns: Index of assigned shard, or None if there are no live shards.
+
+    """
+    if shard_indexes:
+        return max(shard_indexes, key=lambda i: _get_weight(i, network, node_index))
+
+
+def _get_weight(shard_index: int, network: str, node_index: int) -> int:
+    """Returns rendezvous weight of a (shard, node) pairing.
+
+    """
+    digest = hashlib.blake2b(f"{network}:{shard_index}:{node_index}".encode("utf-8"), digest_size=8).digest()
+
+    return int.from_bytes(digest, "big")
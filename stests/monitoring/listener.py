@@ -1,27 +1,125 @@
+import functools
+import re
+import typing
+
+import dramatiq
+
 from stests import chain
 from stests.core import cache
 from stests.core.logging import log_event
 from stests.core.types.infra import Node
 from stests.core.types.infra import NodeEventInfo
+from stests.core.utils import env
+from stests.core.utils.exceptions import InvalidEnvironmentVariable
 from stests.events import EventType
+from stests.monitoring import checkpoint
+from stests.monitoring import coordinator
+from stests.monitoring import multiplexer
+from stests.monitoring import on_block_added
+from stests.monitoring import on_deploy_processed
 from stests.monitoring.on_consensus_finality_signature import on_consensus_finality_signature
 
 
 
-# Map: event type -> actor.
+# Environment variables required by this module.
+class EnvVars:
+    # Deploy correlation mode: BLOCK = query chain upon finality signature | EVENT = derive from DeployProcessed + BlockAdded payloads.
+    # Overridable per network, e.g. STESTS_MONITORING_CORRELATION_NCTL1=EVENT.
+    CORRELATION = env.get_var('MONITORING_CORRELATION', "BLOCK", str.upper)
+
+
+# Map: correlation mode -> event type -> actor.
 _ACTORS = {
-    EventType.MONIT_CONSENSUS_FINALITY_SIGNATURE: on_consensus_finality_signature,
+    "BLOCK": {
+        EventType.MONIT_CONSENSUS_FINALITY_SIGNATURE: on_consensus_finality_signature,
+    },
+    "EVENT": {
+        EventType.MONIT_BLOCK_ADDED: on_block_added.on_block_added,
+        EventType.MONIT_DEPLOY_PROCESSED: on_deploy_processed.on_deploy_processed,
+    },
+}
+
+# Map: event type -> function deriving actor message summary from event payload.
+_SUMMARISERS = {
+    EventType.MONIT_BLOCK_ADDED: on_block_added.get_summary,
+    EventType.MONIT_DEPLOY_PROCESSED: on_deploy_processed.get_summary,
 }
 
 
-def bind_to_stream(node: Node, event_id: int = 0):
-    """Binds to a node's event stream.
+def bind_to_stream(node: Node, event_id: int = None):
+    """Binds to a node's event stream - resuming from last processed event.
 
     :node: Node being monitored.
-    :param event_id: Identifer of event from which to start stream.
+    :param event_id: Identifer of last processed event - defaults to persisted checkpoint.
     
     """
-    chain.stream_events(node, _on_node_event)
+    node_checkpoint = checkpoint.NodeEventCheckpoint(node, event_id)
+
+    def _on_node_event_checkpointed(node: Node, info: NodeEventInfo, payload: dict):
+        node_checkpoint.on_event_dispatched(info.event_id)
+        _on_node_event(node, info, payload)
+        node_checkpoint.on_event_processed(info.event_id)
+        checkpoint.persist([node_checkpoint])
+
+    try:
+        chain.stream_events(node, _on_node_event_checkpointed, node_checkpoint.start_from, set(get_actors(node.network)))
+    finally:
+        checkpoint.persist([node_checkpoint], force=True)
+
+
+def bind_to_streams(nodes: typing.List[Node], duration: float):
+    """Binds to multiple nodes' event streams from current thread.
+
+    :nodes: Nodes being monitored.
+    :param duration: Time (in seconds) for which to remain bound.
+
+    """
+    event_types = set()
+    for node in nodes:
+        event_types |= set(get_actors(node.network))
+    multiplexer.execute(nodes, _on_node_event, duration, event_types)
+
+
+def bind_to_shard(shard: coordinator.MonitorShard, duration: float):
+    """Binds to event streams of nodes assigned to a monitor shard from current thread - rebalancing upon each heartbeat.
+
+    :shard: Monitor shard to which nodes are assigned.
+    :param duration: Time (in seconds) for which to remain bound.
+
+    """
+    multiplexer.execute(shard.heartbeat(), _on_node_event, duration, set(get_actors(shard.network.name)), shard)
+
+
+@functools.lru_cache(maxsize=None)
+def get_actors(network: str) -> typing.Dict[EventType, dramatiq.Actor]:
+    """Returns actors to which events of interest are dispatched - as per network's correlation mode.
+
+    :param network: Name of network being monitored.
+
+    :returns: Map: event type -> actor.
+
+    """
+    var_name = get_correlation_var_name(network)
+    mode = env.get_var(var_name, EnvVars.CORRELATION, str.upper)
+    if mode not in _ACTORS:
+        raise InvalidEnvironmentVariable(var_name, mode, " | ".join(sorted(_ACTORS)))
+
+    return _ACTORS[mode]
+
+
+def get_correlation_var_name(network: str) -> str:
+    """Returns name of environment variable overriding a network's correlation mode - suffixed with raw network name
+    as network identifiers are not valid shell variable names, e.g. NCTL-01 -> MONITORING_CORRELATION_NCTL1.
+
+    :param network: Name of network being monitored.
+
+    :returns: Environment variable name (sans prefix).
+
+    """
+    typeof, _, index = network.partition("-")
+    suffix = f"{typeof}{int(index)}" if index.isdigit() else re.sub("[^0-9a-zA-Z]", "", network)
+
+    return f"MONITORING_CORRELATION_{suffix.upper()}"
 
 
 def _on_node_event(node: Node, info: NodeEventInfo, payload: dict):
@@ -29,13 +127,13 @@ def _on_node_event(node: Node, info: NodeEventInfo, payload: dict):
     
     """
     # Escape if event not of interest.
-    if info.event_type not in _ACTORS:
+    actors = get_actors(info.network)
+    if info.event_type not in actors:
         return
 
     # Escape if event already processed - happens when monitoring multiple nodes.
     if info.event_id:
-        _, was_lock_acquired = cache.monitoring.set_node_event_info(info)
-        if not was_lock_acquired:
+        if not cache.monitoring.set_node_event_info(info):
             return
 
     # Notify.
@@ -49,5 +147,8 @@ def _on_node_event(node: Node, info: NodeEventInfo, payload: dict):
         )
 
     # Dispatch message to actor for further processing.
-    actor = _ACTORS[info.event_type]
-    actor.send(info)
+    actor = actors[info.event_type]
+    if info.event_type in _SUMMARISERS:
+        actor.send(info, _SUMMARISERS[info.event_type](info, payload))
+    else:
+        actor.send(info)
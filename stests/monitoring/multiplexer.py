@@ -0,0 +1,179 @@
+import asyncio
+import concurrent.futures
+import typing
+
+from stests import chain
+from stests.core.logging import log_event
+from stests.core.types.infra import Node
+from stests.core.types.infra import NodeEventInfo
+from stests.core.utils import env
+from stests.events import EventType
+from stests.monitoring import checkpoint
+from stests.monitoring import coordinator
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Maximum number of node events awaiting processing - once reached stream reads are suspended.
+    QUEUE_SIZE = env.get_var('MONITORING_MULTIPLEXER_QUEUE_SIZE', 1024, int)
+
+    # Time (in seconds) to wait before rebinding to a node's event stream following an error.
+    REBIND_DELAY = env.get_var('MONITORING_MULTIPLEXER_REBIND_DELAY', 5, int)
+
+    # Maximum number of node events processed concurrently.
+    WORKERS = env.get_var('MONITORING_MULTIPLEXER_WORKERS', 16, int)
+
+
+def execute(
+    nodes: typing.List[Node],
+    event_callback: typing.Callable,
+    duration: float,
+    event_types: typing.Set[EventType] = None,
+    shard: coordinator.MonitorShard = None,
+    ):
+    """Follows multiple nodes' event streams from a single thread, dispatching events to a bounded pool of callback workers.
+    Streams are resumed from each node's last processed event.
+
+    :param nodes: Nodes to be monitored.
+    :param event_callback: (Blocking) callback to invoke per node event.
+    :param duration: Time (in seconds) for which to follow streams.
+    :param event_types: Types of event of interest - defaults to all.
+    :param shard: Monitor shard whose heartbeat determines set of nodes followed - if unspecified set of nodes is fixed.
+
+    """
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=EnvVars.WORKERS,
+        thread_name_prefix="stests-monitoring",
+        ) as executor:
+        asyncio.run(_execute(nodes, event_callback, duration, event_types, executor, shard))
+
+
+async def _execute(
+    nodes: typing.List[Node],
+    event_callback: typing.Callable,
+    duration: float,
+    event_types: typing.Optional[typing.Set[EventType]],
+    executor: concurrent.futures.Executor,
+    shard: typing.Optional[coordinator.MonitorShard],
+    ):
+    """Follows node event streams until duration elapses.
+
+    """
+    loop = asyncio.get_running_loop()
+    checkpoints = await loop.run_in_executor(executor, lambda: [checkpoint.NodeEventCheckpoint(i) for i in nodes])
+
+    # Bounded queue: when full stream readers suspend & so TCP flow control throttles nodes.
+    queue = asyncio.Queue(maxsize=EnvVars.QUEUE_SIZE)
+
+    # Map: node index -> stream follower task.
+    followers = {i.node.index: asyncio.create_task(_follow(i, queue, event_types)) for i in checkpoints}
+
+    tasks = \
+        [asyncio.create_task(_process(queue, event_callback, executor)) for _ in range(EnvVars.WORKERS)] + \
+        [asyncio.create_task(_persist(checkpoints, executor))]
+    if shard is not None:
+        tasks.append(asyncio.create_task(_rebalance(shard, checkpoints, followers, queue, event_types, executor)))
+    try:
+        await asyncio.sleep(duration)
+    finally:
+        for task in tasks + list(followers.values()):
+            task.cancel()
+        await asyncio.gather(*tasks, *followers.values(), return_exceptions=True)
+        await loop.run_in_executor(executor, checkpoint.persist, checkpoints, True)
+        if shard is not None:
+            await loop.run_in_executor(executor, shard.release, [i.node for i in checkpoints])
+
+
+async def _follow(
+    node_checkpoint: checkpoint.NodeEventCheckpoint,
+    queue: asyncio.Queue,
+    event_types: typing.Optional[typing.Set[EventType]],
+    ):
+    """Follows a node's event stream - rebinding from last processed event upon error.
+
+    """
+    async def _on_node_event(node: Node, info: NodeEventInfo, payload: dict):
+        node_checkpoint.on_event_dispatched(info.event_id)
+        await queue.put((node, info, payload, node_checkpoint))
+
+    while True:
+        try:
+            await chain.stream_events_async(node_checkpoint.node, _on_node_event, node_checkpoint.start_from, event_types)
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            log_event(EventType.MONIT_STREAM_BIND_ERROR, err, node_checkpoint.node)
+        await asyncio.sleep(EnvVars.REBIND_DELAY)
+
+
+async def _persist(checkpoints: typing.List[checkpoint.NodeEventCheckpoint], executor: concurrent.futures.Executor):
+    """Periodically persists node event checkpoints in batches.
+
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(checkpoint.EnvVars.INTERVAL)
+        try:
+            await loop.run_in_executor(executor, checkpoint.persist, checkpoints)
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            if checkpoints:
+                log_event(EventType.MONIT_EVENT_PROCESSING_ERROR, err, checkpoints[0].node)
+
+
+async def _rebalance(
+    shard: coordinator.MonitorShard,
+    checkpoints: typing.List[checkpoint.NodeEventCheckpoint],
+    followers: typing.Dict[int, asyncio.Task],
+    queue: asyncio.Queue,
+    event_types: typing.Optional[typing.Set[EventType]],
+    executor: concurrent.futures.Executor,
+    ):
+    """Periodically heartbeats a monitor shard - following newly leased nodes & ceasing to follow reassigned nodes.
+
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(coordinator.EnvVars.HEARTBEAT_INTERVAL)
+        try:
+            nodes = {i.index: i for i in await loop.run_in_executor(executor, shard.heartbeat)}
+
+            # Cease following reassigned nodes - checkpoints are persisted prior to lease release so that new owner resumes from them.
+            released = [i for i in checkpoints if i.node.index not in nodes]
+            for node_checkpoint in released:
+                followers[node_checkpoint.node.index].cancel()
+            await asyncio.gather(*[followers.pop(i.node.index) for i in released], return_exceptions=True)
+            for node_checkpoint in released:
+                checkpoints.remove(node_checkpoint)
+            if released:
+                await loop.run_in_executor(executor, checkpoint.persist, released, True)
+                await loop.run_in_executor(executor, shard.release, [i.node for i in released])
+
+            # Follow newly leased nodes.
+            for node in [i for i in nodes.values() if i.index not in followers]:
+                node_checkpoint = await loop.run_in_executor(executor, checkpoint.NodeEventCheckpoint, node)
+                checkpoints.append(node_checkpoint)
+                followers[node.index] = asyncio.create_task(_follow(node_checkpoint, queue, event_types))
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            log_event(EventType.MONIT_SHARD_REBALANCE_ERROR, err, shard)
+
+
+async def _process(queue: asyncio.Queue, event_callback: typing.Callable, executor: concurrent.futures.Executor):
+    """Processes queued node events by invoking callback within worker pool.
+
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        node, info, payload, node_checkpoint = await queue.get()
+        try:
+            await loop.run_in_executor(executor, event_callback, node, info, payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            log_event(EventType.MONIT_EVENT_PROCESSING_ERROR, err, node, event_id=info.event_id)
+        node_checkpoint.on_event_processed(info.event_id)
+        queue.task_done()
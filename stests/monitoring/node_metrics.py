@@ -0,0 +1,170 @@
+import collections
+import concurrent.futures
+import threading
+import time
+import typing
+
+from stests import chain
+from stests.chain.get_node_metrics import NodeMetricSample
+from stests.core import cache
+from stests.core.logging import log_event
+from stests.core.types.infra import Network
+from stests.core.types.infra import Node
+from stests.core.utils import env
+from stests.core.utils.exceptions import InvalidEnvironmentVariable
+from stests.events import EventType
+
+
+
+# Environment variables required by this module.
+class EnvVars:
+    # Maximum number of samples retained per node metric series.
+    BUFFER_SIZE = env.get_var('MONITORING_NODE_METRICS_BUFFER_SIZE', 720, int)
+
+    # Interval (in seconds) between samples - 0 disables sampling.
+    INTERVAL = env.get_var('MONITORING_NODE_METRICS_INTERVAL', 0, int)
+
+    # Comma delimited prefixes of metrics to be sampled - * = all.
+    METRICS = env.get_var(
+        'MONITORING_NODE_METRICS',
+        "amount_of_blocks,contract_runtime,deploy_gossiper,mem_,pending_deploy,scheduler_queue",
+        lambda i: tuple(j.strip() for j in i.split(",") if j.strip()),
+        )
+
+    # Store within which samples are retained: CACHE = MONITORING partition | MEMORY = in process.
+    STORE = env.get_var('MONITORING_NODE_METRICS_STORE', "CACHE", str.upper)
+
+    # Maximum number of nodes polled concurrently.
+    WORKERS = env.get_var('MONITORING_NODE_METRICS_WORKERS', 16, int)
+
+
+# Set of supported sample stores.
+STORES = {
+    "CACHE",
+    "MEMORY",
+}
+
+# Map: (network, node index, series) -> in process ring buffer of (timestamp, value) samples.
+_MEMORY: typing.Dict[typing.Tuple[str, int, str], collections.deque] = dict()
+
+# Lock guarding access to in process samples.
+_MEMORY_LOCK = threading.Lock()
+
+
+def execute(network: Network, duration: float):
+    """Periodically samples metrics of a network's queryable nodes.
+
+    :param network: Network being monitored.
+    :param duration: Time (in seconds) for which to sample.
+
+    """
+    ends_at = time.monotonic() + duration
+    interval = max(EnvVars.INTERVAL, 1)
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=EnvVars.WORKERS,
+        thread_name_prefix="stests-node-metrics",
+        ) as executor:
+        while time.monotonic() < ends_at:
+            started_at = time.monotonic()
+            nodes = cache.infra.get_nodes_for_query(network)
+            set_samples(network, sample(network, nodes, executor))
+            time.sleep(max(0, min(interval - (time.monotonic() - started_at), ends_at - time.monotonic())))
+
+
+def get_samples(network: str, node_index: int, series: str) -> typing.List[typing.Tuple[float, float]]:
+    """Returns time series of samples of a node metric - oldest first.
+
+    :param network: Name of network being monitored.
+    :param node_index: Index of node being sampled.
+    :param series: Metric series identifier, i.e. metric name plus labels, e.g. pending_deploy.
+
+    :returns: Samples: (timestamp, value).
+
+    """
+    if _is_memory_store():
+        with _MEMORY_LOCK:
+            return list(_MEMORY.get((network, node_index, series), []))
+
+    return [tuple(i) for i in cache.monitoring.get_node_metric_samples(network, node_index, series)]
+
+
+def sample(
+    network: Network,
+    nodes: typing.List[Node],
+    executor: concurrent.futures.Executor,
+    ) -> typing.List[typing.Tuple[Node, typing.List[NodeMetricSample]]]:
+    """Polls nodes for metrics concurrently.
+
+    :param network: Network being monitored.
+    :param nodes: Nodes to be polled.
+    :param executor: Executor within which nodes are polled.
+
+    :returns: Pairs: (node, metric samples of interest) - nodes that failed to reply are excluded.
+
+    """
+    futures = [(i, executor.submit(chain.get_node_metric_samples, network, i)) for i in nodes]
+    samples = []
+    for node, future in futures:
+        try:
+            samples.append((node, [i for i in future.result() if _is_of_interest(i)]))
+        except Exception as err:
+            log_event(EventType.MONIT_NODE_METRICS_SAMPLING_ERROR, err, node)
+
+    return samples
+
+
+def set_samples(network: Network, samples: typing.List[typing.Tuple[Node, typing.List[NodeMetricSample]]]):
+    """Appends samples to per node metric series ring buffers.
+
+    :param network: Network being monitored.
+    :param samples: Pairs: (node, metric samples).
+
+    """
+    timestamp = time.time()
+    if _is_memory_store():
+        with _MEMORY_LOCK:
+            for node, node_samples in samples:
+                for i in node_samples:
+                    key = (network.name, node.index, i.series)
+                    if key not in _MEMORY:
+                        _MEMORY[key] = collections.deque(maxlen=EnvVars.BUFFER_SIZE)
+                    _MEMORY[key].append(_get_entry(i, timestamp))
+        return
+
+    # Series expire if sampling stops for longer than buffer span.
+    expiration = max(EnvVars.BUFFER_SIZE * max(EnvVars.INTERVAL, 1), 3600)
+    with cache.batch():
+        for node, node_samples in samples:
+            for i in node_samples:
+                cache.monitoring.set_node_metric_samples(
+                    network.name,
+                    node.index,
+                    i.series,
+                    [_get_entry(i, timestamp)],
+                    EnvVars.BUFFER_SIZE,
+                    expiration,
+                    )
+
+
+def _get_entry(sample: NodeMetricSample, timestamp: float) -> typing.Tuple[float, float]:
+    """Returns a ring buffer entry: (timestamp, value).
+
+    """
+    return (sample.timestamp / 1000 if sample.timestamp else timestamp, sample.value)
+
+
+def _is_memory_store() -> bool:
+    """Returns flag indicating whether samples are retained in process.
+
+    """
+    if EnvVars.STORE not in STORES:
+        raise InvalidEnvironmentVariable("MONITORING_NODE_METRICS_STORE", EnvVars.STORE, " | ".join(sorted(STORES)))
+
+    return EnvVars.STORE == "MEMORY"
+
+
+def _is_of_interest(sample: NodeMetricSample) -> bool:
+    """Returns flag indicating whether a sample is to be retained.
+
+    """
+    return "*" in EnvVars.METRICS or sample.name.startswith(EnvVars.METRICS)
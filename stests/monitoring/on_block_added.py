@@ -0,0 +1,87 @@
+from datetime import datetime
+
+import dramatiq
+
+from stests.core import cache
+from stests.core import factory
+from stests.core.logging import log_event
+from stests.core.types.chain import BlockStatus
+from stests.core.types.infra import NodeEventInfo
+from stests.events import EventType
+from stests.monitoring.on_deploy_processed import correlate
+
+
+
+# Queue to which messages will be dispatched.
+_QUEUE = "monitoring.events.block.added"
+
+# Summary fields derived from block body - None when payload holds block header only.
+_BODY_FIELDS = {"deploy_count", "proposer"}
+
+
+@dramatiq.actor(queue_name=_QUEUE)
+def on_block_added(info: NodeEventInfo, summary: dict):
+    """Event: raised whenever a block is added to a node's linear chain.
+
+    :param info: Node event information.
+    :param summary: Added block summary derived from event payload.
+
+    """
+    # Emit event.
+    if summary["deploy_count"] is None:
+        # Header only payload - body derived statistics are unknown & so are not reported.
+        log_event(EventType.CHAIN_ADDED_BLOCK, f"{info.block_hash}", {k: v for k, v in summary.items() if k not in _BODY_FIELDS})
+    elif summary["deploy_count"] == 0:
+        log_event(EventType.CHAIN_ADDED_BLOCK_EMPTY, None, info.block_hash)
+    else:
+        network = cache.infra.get_network(factory.create_network_id(info.network))
+        log_event(EventType.CHAIN_ADDED_BLOCK, f"{info.block_hash}", factory.create_block_statistics_on_addition(
+            block_hash = info.block_hash,
+            block_hash_parent = summary["parent_hash"],
+            chain_name = network.chain_name,
+            era_id = summary["era_id"],
+            deploy_cost_total = None,
+            deploy_count = summary["deploy_count"],
+            deploy_gas_price_avg = None,
+            height = summary["height"],
+            is_switch_block = summary["is_switch_block"],
+            network = info.network,
+            proposer = summary["proposer"],
+            size_bytes = None,
+            state_root_hash = summary["state_root_hash"],
+            status = BlockStatus.FINALIZED.name,
+            timestamp = datetime.strptime(summary["timestamp"], "%Y-%m-%dT%H:%M:%S.%fZ"),
+        ))
+
+    # Encache summary prior to reading processed deploys so that a concurrently processed deploy cannot be missed.
+    cache.monitoring.set_block_summary(info.network, summary)
+
+    # Correlate deploys processed prior to block being added.
+    for deploy_summary in cache.monitoring.get_deploys_processed(info.network, info.block_hash):
+        correlate(info.network, summary, deploy_summary)
+
+
+def get_summary(info: NodeEventInfo, payload: dict) -> dict:
+    """Returns summary of an added block - block body is discarded, body derived fields are None if absent.
+
+    :param info: Node event information.
+    :param payload: Event payload.
+
+    :returns: Added block summary.
+
+    """
+    block = payload["BlockAdded"].get("block") or dict()
+    header = block.get("header") or payload["BlockAdded"]["block_header"]
+    body = block.get("body") or dict()
+
+    return {
+        "block_hash": info.block_hash,
+        "deploy_count": len(body.get("deploy_hashes") or []) + len(body.get("transfer_hashes") or []) if body else None,
+        "era_id": header["era_id"],
+        "height": header["height"],
+        "is_switch_block": header.get("era_end") is not None,
+        "parent_hash": header["parent_hash"],
+        "proposer": body.get("proposer"),
+        "state_root_hash": header["state_root_hash"],
+        "timestamp": header["timestamp"],
+    }
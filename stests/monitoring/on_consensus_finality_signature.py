@@ -1,3 +1,6 @@
+import concurrent.futures
+import copy
+import functools
 from datetime import datetime
 import typing
 
@@ -15,10 +18,17 @@ from stests.core.types.infra import Node
 from stests.core.types.infra import NodeEventInfo
 from stests.core.types.infra import NodeIdentifier
 from stests.core.utils import encoder
+from stests.core.utils import env
 from stests.events import EventType
 
 
 
+# Environment variables required by this module.
+class EnvVars:
+    # Maximum number of a finalised block's deploys fetched & correlated concurrently (per process).
+    DEPLOY_WORKERS = env.get_var('MONITORING_BLOCK_DEPLOY_WORKERS', 32, int)
+
+
 # Queue to which messages will be dispatched.
 _QUEUE = "monitoring.events.consensus.fault"
 
@@ -81,18 +91,7 @@ def _is_block_processed(info: NodeEventInfo) -> bool:
     """Returns flag indicating whether finalised deploy event has already been processed.
 
     """
-    _, encached = cache.monitoring.set_block(info)
-
-    return not encached
-
-
-def _is_deploy_processed(ctx: _Context) -> bool:
-    """Returns flag indicating whether finalised deploy event has already been processed.
-
-    """
-    _, encached = cache.monitoring.set_deploy(ctx.network.name, ctx.block_hash, ctx.deploy_hash)
-
-    return not encached
+    return not cache.monitoring.set_block(info)
 
 
 def _process_block(ctx: _Context):
@@ -138,13 +137,26 @@ def _process_block(ctx: _Context):
 
 
 def _process_block_deploys(ctx: _Context):
-    """Processes a finalised block.
+    """Processes a finalised block's deploys - fetched & correlated concurrently.
     
     """
-    for deploy_hash in ctx.deploy_hashes + ctx.transfer_hashes:
-        ctx.deploy_hash = deploy_hash
-        if not _is_deploy_processed(ctx):
-            _process_deploy(ctx)
+    # Escape if all deploys already processed - dedupe flags are set in a single round trip.
+    deploy_hashes = ctx.deploy_hashes + ctx.transfer_hashes
+    with cache.batch() as results:
+        for deploy_hash in deploy_hashes:
+            cache.monitoring.set_deploy(ctx.network.name, ctx.block_hash, deploy_hash)
+    deploy_hashes = [i for i, encached in zip(deploy_hashes, results) if encached]
+    if not deploy_hashes:
+        return
+
+    # Process deploys - each within it's own context.
+    def _process(deploy_hash: str):
+        deploy_ctx = copy.copy(ctx)
+        deploy_ctx.deploy_hash = deploy_hash
+        _process_deploy(deploy_ctx)
+
+    for future in [_get_executor().submit(_process, i) for i in deploy_hashes]:
+        future.result()
 
 
 def _process_deploy(ctx: _Context):
@@ -193,11 +205,15 @@ def _process_deploy_correlated(ctx: _Context):
     ctx.deploy.finalization_timestamp = ctx.block.timestamp
     ctx.deploy.state_root_hash = ctx.block.state_root_hash
     ctx.deploy.status = DeployStatus.ADDED
-    cache.state.set_deploy(ctx.deploy)
+    with cache.batch():
+        cache.state.set_deploy(ctx.deploy)
+
+        # Update cache: finalization time histogram.
+        cache.orchestration.increment_finalization_histogram(ctx.deploy)
 
-    # Update cache: account balance.
-    if ctx.deploy.deploy_cost > 0:
-        cache.state.decrement_account_balance_on_deploy_finalisation(ctx.deploy, ctx.deploy.deploy_cost)
+        # Update cache: account balance.
+        if ctx.deploy.deploy_cost > 0:
+            cache.state.decrement_account_balance_on_deploy_finalisation(ctx.deploy, ctx.deploy.deploy_cost)
 
     # Enqueue message for processing by orchestrator.
     _enqueue_correlated(ctx)
@@ -219,3 +235,14 @@ def _enqueue_correlated(ctx: _Context):
         kwargs=dict(),
         options=dict(),
     ))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Returns pool within which deploys are fetched & correlated - shared across actor threads so as to bound node load.
+    
+    """
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=EnvVars.DEPLOY_WORKERS,
+        thread_name_prefix="stests-block-deploys",
+        )
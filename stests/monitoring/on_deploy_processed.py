@@ -0,0 +1,120 @@
+from datetime import datetime
+
+import dramatiq
+
+from stests.core import cache
+from stests.core import factory
+from stests.core.logging import log_event
+from stests.core.types.chain import DeployStatus
+from stests.core.types.infra import NodeEventInfo
+from stests.core.utils import encoder
+from stests.events import EventType
+
+
+
+# Queue to which messages will be dispatched.
+_QUEUE = "monitoring.events.deploy.processed"
+
+
+@dramatiq.actor(queue_name=_QUEUE)
+def on_deploy_processed(info: NodeEventInfo, summary: dict):
+    """Event: raised whenever a deploy is processed by a node.
+
+    :param info: Node event information.
+    :param summary: Processed deploy summary derived from event payload.
+
+    """
+    # Encache summary prior to reading block summary so that a concurrently added block cannot be missed.
+    cache.monitoring.set_deploy_processed(info.network, summary)
+
+    # Correlate if block already added - otherwise deferred until block added event is processed.
+    block = cache.monitoring.get_block_summary(info.network, info.block_hash)
+    if block:
+        correlate(info.network, block, summary)
+
+
+def correlate(network: str, block: dict, summary: dict):
+    """Correlates a processed deploy with it's block - without querying chain.
+
+    :param network: Name of network being monitored.
+    :param block: Added block summary.
+    :param summary: Processed deploy summary.
+
+    """
+    # Escape if already correlated - happens when both events are processed concurrently.
+    if not cache.monitoring.set_deploy(network, summary["block_hash"], summary["deploy_hash"]):
+        return
+
+    # Emit event.
+    log_event(EventType.CHAIN_ADDED_DEPLOY, f"{summary['block_hash']}.{summary['deploy_hash']}", summary)
+
+    # Escape if deploy cannot be correlated to a workflow.
+    deploy = cache.state.get_deploy_on_finalisation(network, summary["deploy_hash"])
+    if not deploy:
+        return
+
+    # Notify.
+    network_id = factory.create_network_id(network)
+    node_id = factory.create_node_id(network_id, summary["node_index"])
+    node = cache.infra.get_node(node_id)
+    log_event(EventType.WFLOW_DEPLOY_CORRELATED, f"{summary['block_hash']}.{summary['deploy_hash']}", node, block_hash=summary["block_hash"], deploy_hash=summary["deploy_hash"])
+
+    # Update cache: deploy.
+    timestamp = datetime.strptime(block["timestamp"], "%Y-%m-%dT%H:%M:%S.%fZ")
+    deploy.block_hash = summary["block_hash"]
+    deploy.deploy_cost = summary["deploy_cost"]
+    deploy.era_id = block["era_id"]
+    deploy.finalization_duration = timestamp.timestamp() - deploy.dispatch_timestamp.timestamp()
+    deploy.finalization_node_index = summary["node_index"]
+    deploy.finalization_timestamp = timestamp
+    deploy.state_root_hash = block["state_root_hash"]
+    deploy.status = DeployStatus.ADDED
+    with cache.batch():
+        cache.state.set_deploy(deploy)
+
+        # Update cache: finalization time histogram.
+        cache.orchestration.increment_finalization_histogram(deploy)
+
+        # Update cache: account balance.
+        if deploy.deploy_cost > 0:
+            cache.state.decrement_account_balance_on_deploy_finalisation(deploy, deploy.deploy_cost)
+
+    # Enqueue message for processing by orchestrator.
+    dramatiq.get_broker().enqueue(dramatiq.Message(
+        queue_name="orchestration.engine.step",
+        actor_name="on_step_deploy_finalized",
+        args=([
+            encoder.encode(cache.orchestration.get_context(deploy.network, deploy.run_index, deploy.run_type)),
+            encoder.encode(node_id),
+            summary["block_hash"],
+            summary["deploy_hash"],
+            ]),
+        kwargs=dict(),
+        options=dict(),
+    ))
+
+
+def get_summary(info: NodeEventInfo, payload: dict) -> dict:
+    """Returns summary of a processed deploy - execution effects are discarded.
+
+    :param info: Node event information.
+    :param payload: Event payload.
+
+    :returns: Processed deploy summary.
+
+    """
+    execution_result = payload["DeployProcessed"]["execution_result"]
+    try:
+        deploy_cost = int(execution_result["Success"]["cost"])
+    except KeyError:
+        try:
+            deploy_cost = int(execution_result["Failure"]["cost"])
+        except KeyError:
+            deploy_cost = 0
+
+    return {
+        "block_hash": info.block_hash,
+        "deploy_cost": deploy_cost,
+        "deploy_hash": info.deploy_hash,
+        "node_index": info.node_index,
+    }
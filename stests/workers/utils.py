@@ -1,6 +1,8 @@
+from stests.core import crypto
 from stests.core import mq
 from stests.core import logging
 from stests.core.mq import encoder
+from stests.core.types.chain import PEM_FILE_NAMESPACE_RUNS
 from stests.core.types.logging import OutputMode
 
 
@@ -32,6 +34,9 @@ def _setup(output_mode: OutputMode):
     # Initialise message encoder.
     encoder.initialise()    
 
+    # Sweep PEM key files of runs that were not pruned upon completion.
+    crypto.delete_stale_pvk_pem_files(PEM_FILE_NAMESPACE_RUNS)
+
 
 def start_orchestration():
     """Starts workload generators.
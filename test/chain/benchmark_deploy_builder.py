@@ -0,0 +1,110 @@
+import argparse
+import datetime
+import json
+import subprocess
+import timeit
+
+from stests.chain import deploy_builder
+from stests.core import crypto
+from stests.core import factory
+from stests.core.types.chain import AccountType
+
+
+
+# CLI argument parser.
+ARGS = argparse.ArgumentParser("Cross-checks & benchmarks in-process native transfer construction against casper-client make-transfer.")
+
+# CLI argument: path to client binary.
+ARGS.add_argument(
+    "--client",
+    default="casper-client",
+    dest="client",
+    help="Path to casper-client binary.",
+    type=str,
+    )
+
+# CLI argument: number of deploys per sample.
+ARGS.add_argument(
+    "--deploys",
+    default=100,
+    dest="deploys",
+    help="Number of deploys per benchmark sample.",
+    type=int,
+    )
+
+# Transfer parameters.
+_AMOUNT = int(1e9)
+_CHAIN_NAME = "casper-net-1"
+_FEE = int(1e4)
+_GAS_PRICE = 10
+_TIME_TO_LIVE = "1h"
+_TIMESTAMP = datetime.datetime(2021, 3, 1, 12, 0, 0, 123000, tzinfo=datetime.timezone.utc)
+_TRANSFER_ID = 1
+
+
+def main(args):
+    """Cross-check: deploy hashes (& deterministic signatures) must be identical to those of client binary.
+    Benchmark: deploys built per second in process versus via client binary.
+
+    Usage: python -m test.chain.benchmark_deploy_builder --client PATH-TO-CASPER-CLIENT
+
+    """
+    target = factory.create_account("lrt1", AccountType.OTHER, index=2)
+    for key_algo in crypto.KeyAlgorithm:
+        dispatcher = factory.create_account("lrt1", AccountType.NETWORK_FAUCET, key_algo=key_algo)
+        pem_filepath = dispatcher.get_private_key_pem_filepath()
+
+        # Cross-check.
+        expected = _make_transfer_via_client(args.client, dispatcher, target, pem_filepath)
+        deploy_hash, deploy = _make_transfer_native(dispatcher, target)
+        assert deploy_hash == expected["hash"], f"{key_algo.name} :: deploy hash mismatch :: {deploy_hash} != {expected['hash']}"
+        assert deploy["header"]["body_hash"] == expected["header"]["body_hash"]
+        assert deploy["approvals"][0]["signature"] == expected["approvals"][0]["signature"]
+        print(f"{key_algo.name.ljust(10)} deploy hash identical :: {deploy_hash}")
+
+        # Benchmark.
+        for label, func in (
+            ("client", lambda: _make_transfer_via_client(args.client, dispatcher, target, pem_filepath)),
+            ("native", lambda: _make_transfer_native(dispatcher, target)),
+            ):
+            elapsed = min(timeit.repeat(func, number=args.deploys, repeat=3))
+            print(f"{key_algo.name.ljust(10)} {label.ljust(8)} {format(args.deploys / elapsed, ',.0f').rjust(10)} deploys/s")
+
+
+def _make_transfer_native(dispatcher, target):
+    return deploy_builder.create_transfer_native(
+        dispatcher=dispatcher,
+        target_account_key=target.account_key,
+        amount=_AMOUNT,
+        transfer_id=_TRANSFER_ID,
+        chain_name=_CHAIN_NAME,
+        fee=_FEE,
+        gas_price=_GAS_PRICE,
+        time_to_live=_TIME_TO_LIVE,
+        timestamp=_TIMESTAMP,
+        )
+
+
+def _make_transfer_via_client(client, dispatcher, target, pem_filepath) -> dict:
+    cli_response = subprocess.run([
+        client, "make-transfer",
+        "--amount", str(_AMOUNT),
+        "--chain-name", _CHAIN_NAME,
+        "--gas-price", str(_GAS_PRICE),
+        "--payment-amount", str(_FEE),
+        "--secret-key", pem_filepath,
+        "--target-account", target.account_key,
+        "--timestamp", f"{_TIMESTAMP.strftime('%Y-%m-%dT%H:%M:%S')}.123Z",
+        "--transfer-id", str(_TRANSFER_ID),
+        "--ttl", _TIME_TO_LIVE,
+        ],
+        stdout=subprocess.PIPE,
+        check=True,
+        )
+
+    return json.loads(cli_response.stdout)
+
+
+# Entry point.
+if __name__ == '__main__':
+    main(ARGS.parse_args())
@@ -0,0 +1,116 @@
+import argparse
+import json
+import random
+import timeit
+
+from stests.chain.stream_events import _SSE_Event
+from stests.chain.stream_events import _decode_event
+from stests.chain.stream_events import _get_event_id
+from stests.chain.stream_events import _get_json_decoder
+from stests.chain.stream_events import _parse_event
+from stests.events import EventType
+
+
+
+# CLI argument parser.
+ARGS = argparse.ArgumentParser("Benchmarks event stream decoding by replaying a recorded event stream.")
+
+# CLI argument: path to recorded event stream.
+ARGS.add_argument(
+    "--file",
+    default=None,
+    dest="file",
+    help="Path to a recorded event stream, e.g. curl -sN http://NODE:9999/events > events.txt - defaults to a synthetic stream.",
+    type=str,
+    )
+
+# CLI argument: number of synthetic events.
+ARGS.add_argument(
+    "--events",
+    default=10000,
+    dest="events",
+    help="Number of events within synthetic stream.",
+    type=int,
+    )
+
+# Types of event of interest to monitoring.
+_EVENT_TYPES = {
+    EventType.MONIT_CONSENSUS_FINALITY_SIGNATURE,
+}
+
+
+class _Node():
+    address_event = address_rpc = "localhost:9999"
+    network = network_name = "lrt1"
+
+
+def main(args):
+    """Replays a recorded event stream & reports events decoded per second: full decode of every event versus prefiltered decode.
+
+    Usage: python -m test.chain.benchmark_stream_events --file PATH-TO-RECORDED-EVENTS
+
+    """
+    events = _read_events(args.file) if args.file else _get_synthetic_events(args.events)
+    node = _Node()
+
+    for label, func in (
+        ("before", lambda: [_parse_event(node, i, json.loads(data)) for i, data in events]),
+        ("after", lambda: [_decode_event(node, i, data, _EVENT_TYPES) for i, data in events]),
+        ):
+        elapsed = min(timeit.repeat(func, number=1, repeat=5))
+        print(f"{label.ljust(8)} {format(len(events) / elapsed, ',.0f').rjust(12)} events/s")
+    print(f"json backend :: {_get_json_decoder().__module__}")
+
+
+def _read_events(path: str) -> list:
+    """Returns (event id, data) pairs parsed from a recorded event stream.
+
+    """
+    events = []
+    with open(path) as fstream:
+        event = _SSE_Event()
+        for line in fstream:
+            line = line.rstrip("\r\n")
+            if line:
+                event.set_field(line)
+            elif event.data:
+                events.append((_get_event_id(event.id), event.data))
+                event = _SSE_Event()
+
+    return events
+
+
+def _get_synthetic_events(count: int) -> list:
+    """Returns (event id, data) pairs approximating a loaded network's event mix.
+
+    """
+    def _hash():
+        return random.getrandbits(256).to_bytes(32, "big").hex()
+
+    def _block_added():
+        deploy_hashes = [_hash() for _ in range(100)]
+        return {"BlockAdded": {"block_hash": _hash(), "block": {
+            "hash": _hash(),
+            "header": {"parent_hash": _hash(), "state_root_hash": _hash(), "body_hash": _hash(), "height": 1},
+            "body": {"proposer": f"01{_hash()}", "deploy_hashes": [], "transfer_hashes": deploy_hashes},
+        }}}
+
+    def _deploy_processed():
+        return {"DeployProcessed": {"deploy_hash": _hash(), "account": f"01{_hash()}", "block_hash": _hash(), "execution_result": {
+            "Success": {"effect": {"operations": [], "transforms": [
+                {"key": f"hash-{_hash()}", "transform": {"WriteCLValue": {"cl_type": "U512", "bytes": "0400e1f505", "parsed": "100000000"}}}
+                for _ in range(20)
+            ]}, "transfers": [f"transfer-{_hash()}"], "cost": "10000"}
+        }}}
+
+    def _finality_signature():
+        return {"FinalitySignature": {"block_hash": _hash(), "era_id": 1, "signature": f"01{_hash()}{_hash()}", "public_key": f"01{_hash()}"}}
+
+    factories = [_block_added] + [_deploy_processed] * 100 + [_finality_signature] * 20
+
+    return [(i, json.dumps(factories[i % len(factories)]())) for i in range(count)]
+
+
+# Entry point.
+if __name__ == '__main__':
+    main(ARGS.parse_args())
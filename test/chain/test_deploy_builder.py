@@ -0,0 +1,119 @@
+import datetime
+import hashlib
+
+import ecdsa
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ed25519
+
+from stests.chain import deploy_builder
+from stests.core import crypto
+from stests.core import factory
+from stests.core.types.chain import AccountType
+
+
+
+# Deploy timestamp.
+_TIMESTAMP = datetime.datetime(2021, 3, 1, 12, 0, 0, 123000, tzinfo=datetime.timezone.utc)
+
+# Known answer vector: ed25519 native transfer - expected values generated independently via the Casper python SDK (pycspr 0.12.4).
+_KAT_PRIVATE_KEY = "2f1ad2b8c7d8f05e0b2d6fcd3d5a1f2d6c5e3b8a9d0e4f1c2b3a4d5e6f708192"
+_KAT_PUBLIC_KEY = "b980fa7cefa446c1d25e1dfbbb1fb03955f32980ce3c7088e297b9434a139372"
+_KAT_TARGET_ACCOUNT_KEY = "013b6a27bcceb6a42d62a3a8d02a6f0d73653215771de243a63ac048a18b59da29"
+_KAT_BODY_HASH = "3e363a62e56c45a5688a8b731a3c2478654c5cb50bc86d56a71be78335fd34de"
+_KAT_DEPLOY_HASH = "6940f89457c3abdf40e48afd2676047e9c45abe9ed02820d036c11f9d96b2e87"
+_KAT_SIGNATURE = "013ecdb099a9a86d4b5c309ddfc6f7f538fcc558f5fe821f62540b5a693f01ba20ed7f27273af56fb3d6b7da442e17ef8144de3f4cfea41c234c728352043afa00"
+
+
+def _create_transfer(key_algo: crypto.KeyAlgorithm):
+    dispatcher = factory.create_account("lrt1", AccountType.NETWORK_FAUCET, key_algo=key_algo)
+    target = factory.create_account("lrt1", AccountType.OTHER, index=2)
+    deploy_hash, deploy = deploy_builder.create_transfer_native(
+        dispatcher=dispatcher,
+        target_account_key=target.account_key,
+        amount=int(1e9),
+        transfer_id=1,
+        chain_name="casper-net-1",
+        fee=int(1e4),
+        gas_price=10,
+        time_to_live="1h",
+        timestamp=_TIMESTAMP,
+        )
+
+    return dispatcher, target, deploy_hash, deploy
+
+
+def test_01():
+    """Test CL value serialisation."""
+    assert deploy_builder._get_cl_u512(0).as_bytes.hex() == "00"
+    assert deploy_builder._get_cl_u512(int(1e9)).as_bytes.hex() == "0400ca9a3b"
+    assert deploy_builder._get_cl_u512(int(1e9)).to_bytes().hex() == "050000000400ca9a3b08"
+    assert deploy_builder._get_cl_option_u64(1).to_bytes().hex() == "09000000010100000000000000" + "0d05"
+    assert deploy_builder._get_cl_option_u64(None).to_bytes().hex() == "0100000000" + "0d05"
+
+
+def test_02():
+    """Test time to live parsing."""
+    assert deploy_builder.get_ttl_ms("3600000ms") == 3600000
+    assert deploy_builder.get_ttl_ms("1h") == 3600000
+    assert deploy_builder.get_ttl_ms("1h 30m") == 5400000
+    with pytest.raises(ValueError):
+        deploy_builder.get_ttl_ms("1 fortnight")
+
+
+@pytest.mark.parametrize("key_algo", list(crypto.KeyAlgorithm))
+def test_03(key_algo):
+    """Test native transfer deploy hashing & signing."""
+    dispatcher, target, deploy_hash, deploy = _create_transfer(key_algo)
+
+    assert deploy["hash"] == deploy_hash
+    assert deploy["header"]["timestamp"] == "2021-03-01T12:00:00.123Z"
+    assert deploy["session"]["Transfer"]["args"][1][1]["bytes"] == crypto.get_account_hash(target.account_key)
+
+    signature = bytes.fromhex(deploy["approvals"][0]["signature"])
+    assert signature[0] == deploy_builder._KEY_ALGO_TAGS[key_algo]
+    if key_algo == crypto.KeyAlgorithm.ED25519:
+        ed25519.Ed25519PublicKey.from_public_bytes(bytes.fromhex(dispatcher.public_key)).verify(signature[1:], bytes.fromhex(deploy_hash))
+    else:
+        vk = ecdsa.VerifyingKey.from_string(bytes.fromhex(dispatcher.public_key), curve=ecdsa.SECP256k1)
+        assert vk.verify(signature[1:], bytes.fromhex(deploy_hash), hashfunc=hashlib.sha256)
+
+
+def test_04():
+    """Test native transfer deploys are deterministic."""
+    dispatcher, target, deploy_hash, deploy = _create_transfer(crypto.KeyAlgorithm.ED25519)
+    assert deploy_builder.create_transfer_native(
+        dispatcher=dispatcher,
+        target_account_key=target.account_key,
+        amount=int(1e9),
+        transfer_id=1,
+        chain_name="casper-net-1",
+        fee=int(1e4),
+        gas_price=10,
+        time_to_live="1h",
+        timestamp=_TIMESTAMP,
+        ) == (deploy_hash, deploy)
+
+
+def test_05():
+    """Test native transfer deploy against known answer vector."""
+    dispatcher = factory.create_account(
+        "lrt1",
+        AccountType.NETWORK_FAUCET,
+        private_key=_KAT_PRIVATE_KEY,
+        public_key=_KAT_PUBLIC_KEY,
+        )
+    deploy_hash, deploy = deploy_builder.create_transfer_native(
+        dispatcher=dispatcher,
+        target_account_key=_KAT_TARGET_ACCOUNT_KEY,
+        amount=int(1e9),
+        transfer_id=1,
+        chain_name="casper-net-1",
+        fee=int(1e4),
+        gas_price=10,
+        time_to_live="1h",
+        timestamp=_TIMESTAMP,
+        )
+
+    assert deploy["header"]["body_hash"] == _KAT_BODY_HASH
+    assert deploy_hash == _KAT_DEPLOY_HASH
+    assert deploy["approvals"] == [{"signature": _KAT_SIGNATURE, "signer": f"01{_KAT_PUBLIC_KEY}"}]
@@ -0,0 +1,77 @@
+import types
+
+import pytest
+
+from stests.chain import node_health
+
+
+
+# Nodes of network under test.
+_NODES = [types.SimpleNamespace(network="NCTL-01", index=i) for i in range(1, 4)]
+
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch):
+    clock = types.SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(node_health.time, "monotonic", lambda: clock.now)
+    monkeypatch.setattr(node_health.cache.infra, "get_nodes_for_dispatch", lambda _: _NODES)
+    monkeypatch.setattr(node_health, "_HEALTH", dict())
+
+    return clock
+
+
+def _fail(node, times: int = node_health.EnvVars.CIRCUIT_FAILURE_THRESHOLD):
+    for _ in range(times):
+        node_health.on_dispatch_failure(node)
+
+
+def test_01():
+    """Test circuit opens upon consecutive failure threshold & closes upon success."""
+    health = node_health._get(_NODES[0])
+    _fail(_NODES[0], node_health.EnvVars.CIRCUIT_FAILURE_THRESHOLD - 1)
+    assert health.is_available
+    _fail(_NODES[0], 1)
+    assert not health.is_available
+    node_health.on_dispatch_success(_NODES[0], 0.1)
+    assert health.is_available
+    assert health.consecutive_failures == 0
+
+
+def test_02(clock):
+    """Test preferred node is only bypassed whilst it's circuit is open - a trial dispatch is permitted once elapsed."""
+    _fail(_NODES[0])
+    assert node_health.get_node(None, _NODES[0]) in _NODES[1:]
+    clock.now += node_health.EnvVars.CIRCUIT_OPEN_DURATION - 1
+    assert node_health.get_node(None, _NODES[0]) in _NODES[1:]
+    clock.now += 1
+    assert node_health.get_node(None, _NODES[0]) is _NODES[0]
+
+    # Failed trial dispatch re-opens circuit.
+    _fail(_NODES[0], 1)
+    assert node_health.get_node(None, _NODES[0]) in _NODES[1:]
+
+
+def test_03():
+    """Test excluded nodes are never selected whilst an alternative exists."""
+    for _ in range(50):
+        assert node_health.get_node(None, _NODES[0], {1, 2}) is _NODES[2]
+
+
+def test_04():
+    """Test nodes with open circuits are selected only if all remaining candidates are unavailable."""
+    _fail(_NODES[0])
+    _fail(_NODES[2])
+    assert node_health.get_node(None, _NODES[0], {2}) in (_NODES[0], _NODES[2])
+
+
+def test_05():
+    """Test preferred node is returned if all nodes are excluded."""
+    assert node_health.get_node(None, _NODES[0], {1, 2, 3}) is _NODES[0]
+
+
+def test_06():
+    """Test backoff is bounded by exponential delay & max. backoff."""
+    for attempt in range(1, 10):
+        for _ in range(20):
+            backoff = node_health.get_backoff(attempt, 0.1)
+            assert 0 <= backoff <= min(node_health.EnvVars.BACKOFF_MAX, 0.1 * 2 ** (attempt - 1))
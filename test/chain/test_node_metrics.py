@@ -0,0 +1,28 @@
+from stests.chain.get_node_metrics import parse
+
+
+
+# Metrics in Prometheus text exposition format.
+_EXPOSITION = """
+# HELP pending_deploy number of deploys pending
+# TYPE pending_deploy gauge
+pending_deploy 42
+# TYPE deploy_gossiper_items_received counter
+deploy_gossiper_items_received 1.5e3 1614600000123
+# TYPE mem_deploy_buffer histogram
+mem_deploy_buffer_bucket{le="0.5",name="a \\"b\\""} 3
+mem_deploy_buffer_sum +Inf
+not a sample
+"""
+
+
+def test_01():
+    """Test parsing of metrics exposition into typed samples."""
+    samples = parse(_EXPOSITION)
+    assert [i.name for i in samples] == ["pending_deploy", "deploy_gossiper_items_received", "mem_deploy_buffer_bucket", "mem_deploy_buffer_sum"]
+    assert [i.metric_type for i in samples] == ["gauge", "counter", "histogram", "histogram"]
+    assert samples[0].value == 42 and samples[0].series == "pending_deploy" and samples[0].timestamp is None
+    assert samples[1].value == 1500 and samples[1].timestamp == 1614600000123
+    assert samples[2].labels == {"le": "0.5", "name": 'a "b"'}
+    assert samples[2].series == 'mem_deploy_buffer_bucket[le=0.5,name=a "b"]'
+    assert samples[3].value == float("inf")
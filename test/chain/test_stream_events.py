@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from stests.chain.stream_events import _decode_event
+from stests.chain.stream_events import _get_connection_info
+from stests.events import EventType
+
+
+
+# Types of event of interest.
+_EVENT_TYPES = {
+    EventType.MONIT_CONSENSUS_FINALITY_SIGNATURE,
+}
+
+
+class _Node():
+    address_event = address_rpc = "localhost:9999"
+    network = network_name = "lrt1"
+
+
+def test_01():
+    """Test events of interest are decoded."""
+    data = json.dumps({"FinalitySignature": {"block_hash": "aa", "public_key": "01"}})
+    event_type, event_id, payload, block_hash, _, account_key = _decode_event(_Node(), 1, data, _EVENT_TYPES)
+    assert event_type == EventType.MONIT_CONSENSUS_FINALITY_SIGNATURE
+    assert (event_id, block_hash, account_key) == (1, "aa", "01")
+    assert payload == json.loads(data)
+
+
+def test_02():
+    """Test events not of interest are discarded without decoding."""
+    assert _decode_event(_Node(), 1, '{"ApiVersion":"1.0.0"}', None) is None
+    assert _decode_event(_Node(), 2, '{"BlockAdded": {"block_hash": "aa", NOT-JSON', _EVENT_TYPES) is None
+    assert _decode_event(_Node(), 3, '{"BlockAdded": {"block_hash": "aa"}}', None)[0] == EventType.MONIT_BLOCK_ADDED
+
+
+def test_03():
+    """Test event stream connection info is derived from url - defaulting port as per scheme."""
+    host, port, ssl_context, path, netloc = _get_connection_info("http://localhost:9999/events", 5)
+    assert (host, port, ssl_context, path, netloc) == ("localhost", 9999, None, "/events?start_from=5", "localhost:9999")
+
+    host, port, ssl_context, path, netloc = _get_connection_info("https://node.casper.network/events/main", None)
+    assert (host, port, path, netloc) == ("node.casper.network", 443, "/events/main", "node.casper.network")
+    assert ssl_context is not None
+
+    assert _get_connection_info("http://localhost/events", None)[1] == 80
+    with pytest.raises(ValueError):
+        _get_connection_info("ws://localhost:9999/events", None)
@@ -0,0 +1,82 @@
+import timeit
+
+from stests.core import factory
+from stests.core import types
+from stests.core.utils import encoder
+
+
+
+# Number of round-trips per sample.
+_ROUND_TRIPS = 10000
+
+
+def main():
+    """Micro-benchmark: encoder round-trips over frequently (de)serialised domain types.
+
+    Usage: python -m test.core.benchmark_utils_encoder
+
+    """
+    encoder.initialise()
+    for label, instance in (
+        ("ExecutionContext", _create_execution_context()),
+        ("Deploy", _create_deploy()),
+        ):
+        assert encoder.decode(encoder.encode(instance)) == instance
+        elapsed = min(timeit.repeat(
+            lambda: encoder.decode(encoder.encode(instance)),
+            number=_ROUND_TRIPS,
+            repeat=3,
+            ))
+        print(f"{label.ljust(20)} {format(_ROUND_TRIPS / elapsed, ',.0f').rjust(10)} round-trips/s")
+
+
+def _create_execution_context() -> types.orchestration.ExecutionContext:
+    network_id = factory.create_network_id("lrt1")
+
+    return factory.create_execution_context(
+        args=None,
+        prune_on_completion=False,
+        deploys_per_second=100,
+        key_algorithm="ED25519",
+        loop_count=10,
+        loop_interval_ms=1000,
+        execution_mode="periodic",
+        network_id=network_id,
+        node_id=factory.create_node_id(network_id, 1),
+        run_index=1,
+        run_type="WG-100",
+    )
+
+
+def _create_deploy() -> types.chain.Deploy:
+    ctx = _create_execution_context()
+    account = factory.create_account(
+        network=ctx.network,
+        typeof=types.chain.AccountType.GENERATOR_RUN,
+        run_index=ctx.run_index,
+        run_type=ctx.run_type,
+        )
+
+    return factory.create_deploy_for_run(
+        ctx=ctx,
+        account=account,
+        node=factory.create_node(
+            group=types.infra.NodeGroup.GENESIS,
+            host="localhost",
+            index=1,
+            network_id=factory.create_network_id("lrt1"),
+            port_rest=14101,
+            port_rpc=11101,
+            port_event=18101,
+            typeof=types.infra.NodeType.VALIDATOR,
+            ),
+        deploy_hash="02c74421666866809a2343f95229af960077a9bfed56b31bc9f231d108958eeb",
+        dispatch_attempts=1,
+        dispatch_duration=float(2),
+        typeof=types.chain.DeployType.TRANSFER_NATIVE,
+    )
+
+
+# Entry point.
+if __name__ == '__main__':
+    main()
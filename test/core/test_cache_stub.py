@@ -0,0 +1,40 @@
+import pytest
+
+from stests.core import cache
+from stests.core.cache import stores
+from stests.core.cache.model import StorePartition
+from stests.core.types.infra import NodeEventInfo
+from stests.events import EventType
+
+
+
+@pytest.fixture(autouse=True)
+def stub_store(monkeypatch):
+    monkeypatch.setattr(stores.EnvVars, "TYPE", "STUB")
+    stores.stub.get_store(StorePartition.MONITORING).flushall()
+
+
+def test_01():
+    """Test lua scripted lease operations are supported by stub store."""
+    assert cache.monitoring.set_node_monitor_lease("NCTL-01", 1, 0, "a", 10) == True
+    assert cache.monitoring.set_node_monitor_lease("NCTL-01", 1, 1, "b", 10) == False
+    assert cache.monitoring.delete_node_monitor_lease("NCTL-01", 1, 0, "a") == True
+    assert cache.monitoring.set_node_monitor_lease("NCTL-01", 1, 1, "b", 10) == True
+
+
+def test_02():
+    """Test lua scripted operations are supported by stub store when batched."""
+    with cache.batch() as results:
+        cache.monitoring.set_deploy("NCTL-01", "b1", "d1")
+        cache.monitoring.set_deploy("NCTL-01", "b1", "d1")
+    assert results == [True, False]
+
+
+def test_03():
+    """Test distinct events lacking a chain identity are not deduped against one another."""
+    def _get_info(event_id):
+        return NodeEventInfo(None, None, None, event_id, None, EventType.MONIT_CONSENSUS_FAULT, "NCTL-01", "localhost:50101", 1)
+
+    assert cache.monitoring.set_node_event_info(_get_info(10)) == True
+    assert cache.monitoring.set_node_event_info(_get_info(11)) == True
+    assert cache.monitoring.set_node_event_info(_get_info(11)) == False
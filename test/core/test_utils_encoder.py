@@ -1,5 +1,8 @@
+import dataclasses
 import inspect
+import typing
 
+from stests.core import types
 from stests.core.types import TYPE_SET
 from stests.core.utils import encoder
 from test.core import utils_factory as factory
@@ -115,5 +118,17 @@ def test_12():
     assert Example in encoder.DCLASS_MAP.values()
 
 
+def test_13():
+    """Test round-trip over data classes holding collections of data classes."""
+    @dataclasses.dataclass
+    class Example():
+        items: typing.List[types.chain.AccountIdentifier]
+    encoder.register_type(Example)
+    i = Example(items=[factory.create_account_key(), factory.create_account_key()])
+    k = encoder.decode(encoder.encode(i))
+    assert isinstance(k, Example)
+    assert k == i
+
+
 def _get_test_dclass_instances():
     return [factory.get_instance(i) for i in encoder.DCLASS_SET]
\ No newline at end of file
@@ -0,0 +1,45 @@
+import random
+
+from stests.core.utils import histogram
+
+
+
+def test_01():
+    """Test percentile estimates of merged histograms are within relative accuracy of actual values."""
+    random.seed(1)
+    values = [random.lognormvariate(3, 0.5) for _ in range(2000)]
+    shards = [histogram.Histogram(), histogram.Histogram()]
+    for idx, value in enumerate(values):
+        bucket = histogram.get_bucket(value)
+        shard = shards[idx % 2]
+        shard.buckets[bucket] = shard.buckets.get(bucket, 0) + 1
+        shard.count += 1
+        shard.sum += value
+        shard.maxima = max(shard.maxima or value, value)
+        shard.minima = min(shard.minima or value, value)
+
+    merged = histogram.Histogram().merge(shards[0]).merge(shards[1])
+    values.sort()
+    assert merged.count == len(values)
+    assert merged.maxima == values[-1] and merged.minima == values[0]
+    for quantile in (0.5, 0.9, 0.99):
+        actual = values[int(quantile * (len(values) - 1))]
+        assert abs(merged.get_percentile(quantile) / actual - 1) <= histogram.RELATIVE_ACCURACY
+
+
+def test_02():
+    """Test decoding of a histogram from hash fields."""
+    fields = {
+        histogram.get_bucket_field(2.5): "3",
+        histogram.get_label_field("phase"): "P-01",
+        "count": "3",
+        "sum": "7.5",
+        "min": "2.5",
+        "max": "2.5",
+        "first": "10",
+        "last": "13",
+    }
+    decoded = histogram.from_fields(fields)
+    assert decoded.labels == {"phase": "P-01"}
+    assert decoded.mean == 2.5 and decoded.tps == 1.0
+    assert decoded.get_percentile(0.5) == 2.5
@@ -0,0 +1,77 @@
+import types
+
+from stests.monitoring import checkpoint
+from stests.monitoring.checkpoint import NodeEventCheckpoint
+
+
+
+# Node being monitored - checkpoint only uses it as a cache key.
+_NODE = types.SimpleNamespace(network="NCTL-01", index=1)
+
+
+def _create_checkpoint(event_id: int = 10, dispatched: list = ()) -> NodeEventCheckpoint:
+    instance = NodeEventCheckpoint(_NODE, event_id)
+    for i in dispatched:
+        instance.on_event_dispatched(i)
+
+    return instance
+
+
+def test_01():
+    """Test checkpoint advances through contiguous in order completions."""
+    instance = _create_checkpoint(dispatched=[11, 12, 13])
+    instance.on_event_processed(11)
+    assert instance.event_id == 11
+    instance.on_event_processed(12)
+    instance.on_event_processed(13)
+    assert instance.event_id == 13
+    assert instance.is_dirty
+
+
+def test_02():
+    """Test out of order completion does not advance checkpoint until earlier events are processed."""
+    instance = _create_checkpoint(dispatched=[11, 12, 13])
+    instance.on_event_processed(13)
+    instance.on_event_processed(12)
+    assert instance.event_id == 10
+    assert not instance.is_dirty
+    instance.on_event_processed(11)
+    assert instance.event_id == 13
+
+
+def test_03():
+    """Test None & unknown event identifiers are ignored."""
+    instance = _create_checkpoint(dispatched=[None, 11])
+    instance.on_event_processed(None)
+    instance.on_event_processed(99)
+    assert instance.event_id == 10
+    instance.on_event_processed(11)
+    assert instance.event_id == 11
+
+
+def test_04():
+    """Test re-dispatch of an in flight event neither reorders nor resets it."""
+    instance = _create_checkpoint(dispatched=[11, 12])
+    instance.on_event_dispatched(11)
+    instance.on_event_processed(12)
+    instance.on_event_dispatched(12)
+    assert instance.event_id == 10
+    instance.on_event_processed(11)
+    assert instance.event_id == 12
+
+
+def test_05():
+    """Test stream start position given an explicit checkpoint."""
+    assert _create_checkpoint(event_id=41).start_from == 42
+    assert _create_checkpoint(event_id=0).start_from == 1
+
+
+def test_06(monkeypatch):
+    """Test stream start position with & without a persisted checkpoint."""
+    monkeypatch.setattr(checkpoint.cache.monitoring, "get_node_event_checkpoint", lambda _: {"event_id": 41})
+    assert NodeEventCheckpoint(_NODE).start_from == 42
+
+    monkeypatch.setattr(checkpoint.cache.monitoring, "get_node_event_checkpoint", lambda _: None)
+    instance = NodeEventCheckpoint(_NODE)
+    assert instance.event_id is None
+    assert instance.start_from == 0
@@ -0,0 +1,16 @@
+from stests.monitoring.coordinator import get_shard_index
+
+
+
+def test_01():
+    """Test assignment of nodes to shards - a joining shard only gains nodes, a leaving shard's nodes are spread across remainder."""
+    nodes = range(1, 201)
+    before = {i: get_shard_index([1, 2, 3], "nctl1", i) for i in nodes}
+    after_join = {i: get_shard_index([1, 2, 3, 4], "nctl1", i) for i in nodes}
+    after_leave = {i: get_shard_index([1, 3], "nctl1", i) for i in nodes}
+
+    assert set(before.values()) == {1, 2, 3}
+    assert all(after_join[i] in (before[i], 4) for i in nodes)
+    assert all(after_leave[i] == before[i] for i in nodes if before[i] != 2)
+    assert {after_leave[i] for i in nodes if before[i] == 2} == {1, 3}
+    assert get_shard_index([], "nctl1", 1) is None
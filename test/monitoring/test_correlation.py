@@ -0,0 +1,88 @@
+import types
+
+import pytest
+
+from stests.core.cache import stores
+from stests.core.cache.model import StorePartition
+from stests.core.types.infra import NodeEventInfo
+from stests.events import EventType
+from stests.monitoring import listener
+from stests.monitoring import on_block_added
+from stests.monitoring import on_deploy_processed
+
+
+
+# Name of network being monitored.
+_NETWORK = "NCTL-01"
+
+# Hashes of block & deploys within block.
+_BLOCK_HASH = "b" * 64
+_DEPLOY_HASHES = ["d" * 64, "e" * 64]
+
+
+@pytest.fixture(autouse=True)
+def correlated(monkeypatch):
+    monkeypatch.setattr(stores.EnvVars, "TYPE", "STUB")
+    stores.stub.get_store(StorePartition.MONITORING).flushall()
+
+    # Correlation ceases upon workflow lookup - deploys are recorded so as to assert correlation count.
+    correlated = []
+    monkeypatch.setattr(on_deploy_processed.cache.state, "get_deploy_on_finalisation", lambda _, deploy_hash: correlated.append(deploy_hash))
+    monkeypatch.setattr(on_block_added.cache.infra, "get_network", lambda _: types.SimpleNamespace(chain_name="casper-net-1"))
+    for module in (on_block_added, on_deploy_processed):
+        monkeypatch.setattr(module, "log_event", lambda *args, **kwargs: None)
+
+    return correlated
+
+
+def _get_info(event_type: EventType, deploy_hash: str = None) -> NodeEventInfo:
+    return NodeEventInfo(None, _BLOCK_HASH, deploy_hash, 1, None, event_type, _NETWORK, "localhost:50101", 1)
+
+
+def _block_added():
+    info = _get_info(EventType.MONIT_BLOCK_ADDED)
+    on_block_added.on_block_added.fn(info, on_block_added.get_summary(info, {"BlockAdded": {"block": {
+        "body": {"deploy_hashes": _DEPLOY_HASHES, "proposer": "01" + "a" * 64, "transfer_hashes": []},
+        "header": {"era_end": None, "era_id": 1, "height": 10, "parent_hash": "c" * 64, "state_root_hash": "f" * 64, "timestamp": "2021-03-01T12:00:00.123Z"},
+        }}}))
+
+
+def _deploy_processed(deploy_hash: str):
+    info = _get_info(EventType.MONIT_DEPLOY_PROCESSED, deploy_hash)
+    on_deploy_processed.on_deploy_processed.fn(info, on_deploy_processed.get_summary(info, {"DeployProcessed": {
+        "execution_result": {"Success": {"cost": "10000"}},
+        }}))
+
+
+def test_01(correlated):
+    """Test deploys processed prior to block being added are correlated once block is added."""
+    for deploy_hash in _DEPLOY_HASHES:
+        _deploy_processed(deploy_hash)
+    assert correlated == []
+    _block_added()
+    assert sorted(correlated) == _DEPLOY_HASHES
+
+
+def test_02(correlated):
+    """Test deploys processed after block was added are correlated immediately."""
+    _block_added()
+    assert correlated == []
+    for deploy_hash in _DEPLOY_HASHES:
+        _deploy_processed(deploy_hash)
+    assert correlated == _DEPLOY_HASHES
+
+
+def test_03(correlated):
+    """Test deploys are correlated once irrespective of arrival order & redelivery."""
+    _deploy_processed(_DEPLOY_HASHES[0])
+    _block_added()
+    _deploy_processed(_DEPLOY_HASHES[1])
+    _deploy_processed(_DEPLOY_HASHES[0])
+    _block_added()
+    assert sorted(correlated) == _DEPLOY_HASHES
+
+
+def test_04():
+    """Test per network correlation override variable names are valid shell identifiers."""
+    assert listener.get_correlation_var_name("NCTL-01") == "MONITORING_CORRELATION_NCTL1"
+    assert listener.get_correlation_var_name("LRT-12") == "MONITORING_CORRELATION_LRT12"